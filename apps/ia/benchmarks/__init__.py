@@ -0,0 +1,6 @@
+"""
+Benchmarks do Task Generator Agent
+
+Execute a partir de apps/ia, por exemplo:
+    python -m benchmarks.bench_json_roundtrip
+"""
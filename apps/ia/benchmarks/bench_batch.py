@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vazão de generate_tasks_batch por número de workers
+
+Processa ``--goals`` goals distintos (sem acertos de cache) com 1, 2, 4, ...
+workers até o número de CPUs, em processos e em threads. O pool de processos
+é aquecido antes da medição (é reaproveitado entre chamadas), então a coluna
+de processos mede só o trabalho e o IPC, sem o custo de subir os workers.
+
+Uso:
+    python -m benchmarks.bench_batch [--goals 2000] [--repeat 3] [--max-workers 8]
+"""
+
+import argparse
+import os
+import time
+
+def worker_counts(limit: int) -> list:
+    counts, n = [], 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    return counts + [limit]
+
+def best_throughput(run, goals: list, repeat: int) -> float:
+    """Melhor vazão (goals/s) entre ``repeat`` execuções"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = run(goals)
+        best = min(best, time.perf_counter() - started)
+        assert not any("error" in result for result in results)
+    return len(goals) / best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--goals", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+    from benchmarks.corpus import generate_corpus
+    from task_generator_agent import TaskGeneratorAgent
+
+    goals = generate_corpus(args.goals)
+    print(f"{args.goals} goals, {os.cpu_count()} CPUs, melhor de {args.repeat}\n")
+    print(f"{'workers':>8}{'processos (goals/s)':>22}{'ganho':>8}{'threads (goals/s)':>20}")
+
+    baseline = None
+    for workers in worker_counts(args.max_workers):
+        agent = TaskGeneratorAgent()
+        try:
+            agent.generate_tasks_batch(goals[:workers * 4], max_workers=workers)
+            processes = best_throughput(
+                lambda batch: agent.generate_tasks_batch(batch, max_workers=workers), goals, args.repeat
+            )
+            threads = best_throughput(
+                lambda batch: agent.generate_tasks_batch(batch, max_workers=workers, use_processes=False),
+                goals, args.repeat
+            )
+        finally:
+            agent.close()
+        baseline = baseline or processes
+        print(f"{workers:>8}{processes:>22.0f}{processes / baseline:>7.2f}x{threads:>20.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: overhead do checkpointing SQLite por nó do grafo
+
+Executa o mesmo conjunto de goals sem checkpointer e com o checkpointer de
+checkpointing.py em cada modo de durabilidade, além de um SqliteSaver com as
+configurações padrão (``synchronous=FULL``) como referência. O overhead por nó
+é a diferença de latência média por sessão dividida pelo número de nós, e é
+comparado com CHECKPOINT_BUDGET_MS_PER_NODE.
+
+Uso:
+    python -m benchmarks.bench_checkpoint [--sessions 300]
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+
+GOALS = [
+    "Planejar uma viagem para o Japão de 2 semanas",
+    "Criar um aplicativo mobile",
+    "Organizar uma festa de aniversário",
+    "Implementar sistema de gestão de tarefas",
+    "Desenvolver projeto de pesquisa",
+]
+
+def measure(agent, sessions: int) -> float:
+    """Latência média por sessão, em milissegundos"""
+    samples = []
+    for i in range(sessions):
+        state = agent._build_initial_state(GOALS[i % len(GOALS)], str(uuid.uuid4()))
+        started = time.perf_counter()
+        agent.graph.invoke(state, **agent._run_options(state["session_id"]))
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.mean(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=300)
+    args = parser.parse_args()
+
+    # Mede só o custo local, sem envio de traces ao LangSmith
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    from checkpointing import CHECKPOINT_BUDGET_MS_PER_NODE
+    from task_generator_agent import TaskGeneratorAgent, create_task_generator_graph
+
+    with tempfile.TemporaryDirectory() as workdir:
+        baseline = TaskGeneratorAgent()
+        node_count = len(baseline.graph.nodes) - 1  # sem o nó __start__
+
+        variants = {}
+        for durability in ("sync", "async", "exit"):
+            variants[f"wal+normal/{durability}"] = TaskGeneratorAgent(
+                checkpoint_path=os.path.join(workdir, f"{durability}.db"),
+                checkpoint_durability=durability
+            )
+
+        # Referência: SqliteSaver sem ajustes de PRAGMA (synchronous=FULL)
+        default_saver = SqliteSaver(sqlite3.connect(os.path.join(workdir, "default.db"), check_same_thread=False))
+        reference = TaskGeneratorAgent()
+        reference.checkpointer = default_saver
+        reference.checkpoint_durability = "sync"
+        reference.graph = create_task_generator_graph(default_saver)
+        variants["padrao/sync"] = reference
+
+        # Aquecimento
+        for agent in (baseline, *variants.values()):
+            measure(agent, 10)
+
+        baseline_ms = measure(baseline, args.sessions)
+        print(f"{'variante':<22}{'ms/sessão':>12}{'overhead/nó (ms)':>20}")
+        print(f"{'sem checkpointer':<22}{baseline_ms:>12.2f}{'-':>20}")
+
+        for name, agent in variants.items():
+            session_ms = measure(agent, args.sessions)
+            per_node = (session_ms - baseline_ms) / node_count
+            status = "ok" if per_node <= CHECKPOINT_BUDGET_MS_PER_NODE else "ACIMA"
+            print(f"{name:<22}{session_ms:>12.2f}{per_node:>20.3f}  {status}")
+
+        print(f"\nOrçamento: {CHECKPOINT_BUDGET_MS_PER_NODE} ms por nó")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start de task_generator_agent
+
+Cada amostra roda em um processo Python novo, como um worker serverless, e
+mede em milissegundos:
+- import: ``import task_generator_agent``
+- init: ``TaskGeneratorAgent()``
+- 1ª requisição: primeiro ``generate_tasks`` (importa LangGraph/LangChain e
+  compila o grafo compartilhado)
+- 2ª requisição: ``generate_tasks`` seguinte, já aquecido
+
+Como referência, mede também o import direto das dependências pesadas que o
+módulo adia para o primeiro uso.
+
+Uso:
+    python -m benchmarks.bench_cold_start [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+AGENT_PROBE = """
+import contextlib, io, json, time
+started = time.perf_counter()
+import task_generator_agent
+imported = time.perf_counter()
+agent = task_generator_agent.TaskGeneratorAgent()
+initialized = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    agent.generate_tasks("Planejar uma viagem para o Japão")
+    first = time.perf_counter()
+    agent.generate_tasks("Criar um aplicativo mobile")
+    second = time.perf_counter()
+print(json.dumps({
+    "import": (imported - started) * 1000,
+    "init": (initialized - imported) * 1000,
+    "1ª requisição": (first - initialized) * 1000,
+    "2ª requisição": (second - first) * 1000,
+}))
+"""
+
+DEPENDENCIES_PROBE = """
+import json, time
+started = time.perf_counter()
+import langgraph.graph, langchain_core.tools, langsmith
+print(json.dumps({"import das dependências": (time.perf_counter() - started) * 1000}))
+"""
+
+def run_probe(code: str) -> dict:
+    """Executa o código em um interpretador novo e lê o JSON da última linha"""
+    env = dict(os.environ, LANGCHAIN_TRACING_V2="false")
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    samples = {}
+    for _ in range(args.runs):
+        for probe in (AGENT_PROBE, DEPENDENCIES_PROBE):
+            for name, value in run_probe(probe).items():
+                samples.setdefault(name, []).append(value)
+
+    print(f"{'etapa':<26}{'mediana (ms)':>14}{'p90 (ms)':>12}")
+    for name, values in samples.items():
+        values.sort()
+        p90 = values[min(len(values) - 1, int(len(values) * 0.9))]
+        print(f"{name:<26}{statistics.median(values):>14.1f}{p90:>12.1f}")
+
+    total = sum(statistics.median(samples[name]) for name in ("import", "init", "1ª requisição"))
+    print(f"\nCold start até a primeira resposta: {total:.1f} ms")
+
+if __name__ == "__main__":
+    main()
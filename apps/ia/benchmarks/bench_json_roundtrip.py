@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: custo das serializações JSON entre os nós do grafo
+
+Compara o caminho antigo (cada nó serializa o resultado da ferramenta em JSON
+e faz o parse logo em seguida) com o caminho tipado atual, em que os nós
+trocam dicts nativos. Mede tempo de CPU e pico de alocação por goal.
+
+Uso:
+    python -m benchmarks.bench_json_roundtrip [--iterations 2000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from task_generator_agent import (
+    analyze_goal_feasibility,
+    build_structured_plan,
+    build_task_steps,
+    generate_task_steps,
+    structure_tasks_json,
+    validate_goal_feasibility,
+)
+
+GOALS = [
+    "Planejar uma viagem para o Japão de 2 semanas",
+    "Criar um aplicativo mobile",
+    "Organizar uma festa de aniversário",
+    "Implementar sistema de gestão de tarefas",
+    "Desenvolver projeto de pesquisa",
+]
+
+def legacy_pipeline(goal: str) -> dict:
+    """Reproduz as conversões str <-> dict feitas pelos nós antigos"""
+    # ``.func`` é a função original da ferramenta, sem a camada BaseTool,
+    # para isolar apenas o custo das serializações
+    analysis = json.loads(validate_goal_feasibility.func(goal))
+    steps = json.loads(generate_task_steps.func(goal, analysis["detected_intention"]))
+    return json.loads(structure_tasks_json.func(goal, json.dumps(steps)))
+
+def typed_pipeline(goal: str) -> dict:
+    """Caminho atual dos nós: dicts nativos do início ao fim"""
+    analysis = analyze_goal_feasibility(goal)
+    steps = build_task_steps(goal, analysis["detected_intention"])
+    return build_structured_plan(goal, steps)
+
+def measure_cpu(pipeline, iterations: int) -> float:
+    """Tempo médio de CPU por goal, em microssegundos"""
+    start = time.process_time()
+    for i in range(iterations):
+        pipeline(GOALS[i % len(GOALS)])
+    return (time.process_time() - start) / iterations * 1e6
+
+def measure_peak_alloc(pipeline, samples: int = 200) -> float:
+    """Pico médio de memória alocada por goal, em KiB"""
+    total_peak = 0
+    tracemalloc.start()
+    try:
+        for i in range(samples):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            pipeline(GOALS[i % len(GOALS)])
+            _, peak = tracemalloc.get_traced_memory()
+            total_peak += peak - baseline
+    finally:
+        tracemalloc.stop()
+    return total_peak / samples / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    
+    # Aquecimento
+    for goal in GOALS:
+        legacy_pipeline(goal)
+        typed_pipeline(goal)
+    
+    results = {}
+    for name, pipeline in (("json_roundtrip", legacy_pipeline), ("typed", typed_pipeline)):
+        results[name] = {
+            "cpu_us_per_goal": measure_cpu(pipeline, args.iterations),
+            "peak_kib_per_goal": measure_peak_alloc(pipeline),
+        }
+    
+    print(f"{'caminho':<16}{'CPU/goal (µs)':>16}{'pico/goal (KiB)':>18}")
+    for name, data in results.items():
+        print(f"{name:<16}{data['cpu_us_per_goal']:>16.1f}{data['peak_kib_per_goal']:>18.1f}")
+    
+    legacy, typed = results["json_roundtrip"], results["typed"]
+    print(f"\nEconomia de CPU: {1 - typed['cpu_us_per_goal'] / legacy['cpu_us_per_goal']:.0%}")
+    print(f"Economia de pico de alocação: {1 - typed['peak_kib_per_goal'] / legacy['peak_kib_per_goal']:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: varreduras repetidas de substring vs. matcher pré-compilado
+
+Compara a detecção de grupos/intenção feita com um ``any(k in texto)`` por
+tabela (estratégia antiga de validate_goal_feasibility) com o KeywordMatcher,
+variando o tamanho do goal e o número de palavras-chave registradas. A
+primeira linha (``--extra-keywords 0``) é a tabela real do agente.
+
+A coluna de normalização é o custo de ``normalize_text``, incluído no do
+matcher: a estratégia antiga só aplica ``lower()`` e não ignora acentos
+("japao" não casa com "japão"), então em goals longos com acentos e com a
+tabela real ela continua mais barata.
+
+Uso:
+    python -m benchmarks.bench_keyword_matcher [--extra-keywords 0 200 1000]
+"""
+
+import argparse
+import random
+import string
+import timeit
+
+from keyword_matcher import KeywordMatcher, ahocorasick, normalize_text
+from task_generator_agent import FEASIBILITY_KEYWORDS, INTENTION_KEYWORDS
+
+GOALS = {
+    "curto": "Planejar uma viagem para o Japão de 2 semanas",
+    "longo": "Quero montar um cronograma detalhado de estudos com revisões semanais " * 20 + "e uma viagem",
+}
+
+def synthetic_keywords(count: int, seed: int = 7) -> list:
+    """Palavras artificiais que não aparecem nos goals de teste"""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 12))) for _ in range(count)]
+
+def repeated_scans(groups: dict, intentions: dict):
+    """Estratégia antiga: uma varredura completa do texto por palavra-chave"""
+    def scan(text: str):
+        text_lower = text.lower()
+        hits = {group for group, keywords in groups.items() if any(k in text_lower for k in keywords)}
+        intention = next((i for k, i in intentions.items() if k in text_lower), "geral")
+        return hits, intention
+    return scan
+
+def single_pass(groups: dict, intentions: dict):
+    """Estratégia atual: um único KeywordMatcher com todas as tabelas"""
+    matcher = KeywordMatcher(groups)
+    for keyword, intention in intentions.items():
+        matcher.add_ranked(keyword, intention)
+    matcher.match("")  # compila o matcher fora da medição
+    return matcher.match
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--extra-keywords", type=int, nargs="+", default=[0, 200, 1000])
+    parser.add_argument("--number", type=int, default=3000)
+    args = parser.parse_args()
+    
+    def mean_us(call) -> float:
+        return timeit.timeit(call, number=args.number) / args.number * 1e6
+    
+    print(f"Backend do matcher: {'pyahocorasick' if ahocorasick else 're (trie)'}\n")
+    print(f"{'palavras':>10}  {'goal':<6}{'varreduras':>12}{'normalização':>14}{'matcher':>10}   (µs)")
+    
+    for extra in args.extra_keywords:
+        groups = {group: list(keywords) for group, keywords in FEASIBILITY_KEYWORDS.items()}
+        groups["extra"] = synthetic_keywords(extra)
+        total = sum(len(k) for k in groups.values()) + len(INTENTION_KEYWORDS)
+        
+        scan = repeated_scans(groups, INTENTION_KEYWORDS)
+        match = single_pass(groups, INTENTION_KEYWORDS)
+        
+        for name, goal in GOALS.items():
+            label = f"{total} (real)" if extra == 0 else str(total)
+            print(
+                f"{label:>10}  {name:<6}{mean_us(lambda: scan(goal)):>12.1f}"
+                f"{mean_us(lambda: normalize_text(goal)):>14.1f}{mean_us(lambda: match(goal)):>10.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
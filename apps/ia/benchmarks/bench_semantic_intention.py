@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark: detecção semântica de intenção (semantic_intention)
+
+Mede, sobre goals escritos sem as palavras-chave de INTENTION_KEYWORDS:
+- acerto em goals fora dos exemplos (HELD_OUT_GOALS: nenhuma palavra em comum
+  com os ``exemplars`` dos templates, conferido ao iniciar) do caminho só com
+  palavras-chave (tudo vira "geral") e do semântico
+- precisão nos negativos (NEGATIVE_GOALS, que devem continuar "geral", como
+  "Fazer bolo") e precisão das intenções atribuídas pelo semântico, no limiar
+  do classificador e em outros limiares (calibração)
+- latência de analyze_goal_feasibility: só palavras-chave, semântico sem cache
+  (embedding calculado) e semântico com cache
+- latência média em um tráfego misto, em que ``--keyword-share`` dos goals
+  casam palavras-chave (caminho rápido) e o restante se repete com
+  frequência (``--repeat-share``), como em produção
+
+Uso:
+    python -m benchmarks.bench_semantic_intention [--embedder hashing|<modelo sentence-transformers>]
+"""
+
+import argparse
+import random
+import time
+
+import task_generator_agent
+from keyword_matcher import normalize_text
+from semantic_intention import HashingEmbedder, SemanticIntentionClassifier, SentenceTransformerEmbedder
+
+# Goals sem palavras-chave e sem nenhuma palavra dos exemplos -> intenção esperada
+HELD_OUT_GOALS = [
+    ("Viajar até Tóquio", "planejamento_viagem"),
+    ("Conhecendo praias nordestinas", "planejamento_viagem"),
+    ("Reservar hotel e passagens aéreas", "planejamento_viagem"),
+    ("Mochilar sozinho até Patagônia", "planejamento_viagem"),
+    ("Feriadão prolongado nos Andes", "planejamento_viagem"),
+    ("Escrevendo contos infantis", "criação_conteudo"),
+    ("Gravações diárias pro vlog", "criação_conteudo"),
+    ("Publicação frequente sobre receitas", "criação_conteudo"),
+    ("Autopublicar ebook sobre jardinagem", "criação_conteudo"),
+    ("Produção audiovisual independente", "criação_conteudo"),
+    ("Desenvolvimento backend usando Python", "implementação_sistema"),
+    ("Automação dos relatórios financeiros", "implementação_sistema"),
+    ("Migração dos servidores pra AWS", "implementação_sistema"),
+    ("Integração entre CRM e marketplace", "implementação_sistema"),
+    ("Programação dum robô atendente", "implementação_sistema"),
+    ("Arrumação geral dos armários", "organização_atividade"),
+    ("Preparativos pra formatura", "organização_atividade"),
+    ("Estudando pro ENEM", "organização_atividade"),
+    ("Faxina completa nos quartos", "organização_atividade"),
+    ("Agendamento dos compromissos mensais", "organização_atividade"),
+    ("Reforma completa dos banheiros", "desenvolvimento_projeto"),
+    ("Construção duma garagem", "desenvolvimento_projeto"),
+    ("Pesquisas acadêmicas sobre genética", "desenvolvimento_projeto"),
+    ("Abertura duma lanchonete", "desenvolvimento_projeto"),
+    ("Monografia sobre economia", "desenvolvimento_projeto"),
+]
+
+# Goals de nenhuma intenção, que devem continuar "geral" (alguns repetem
+# palavras genéricas dos exemplos: "Fazer", "Passar", "Cuidar")
+NEGATIVE_GOALS = [
+    "Fazer bolo",
+    "Fazer exercícios",
+    "Passar roupa",
+    "Ir ao médico",
+    "Cuidar das plantas",
+    "Aprender violão",
+    "Dormir melhor",
+    "Ler mais livros",
+    "Beber mais água",
+    "Tirar carteira de motorista",
+    "Montar quebra-cabeça",
+    "Ser mais feliz",
+]
+
+LABELED_GOALS = HELD_OUT_GOALS + [(goal, None) for goal in NEGATIVE_GOALS]
+
+SWEEP_THRESHOLDS = (0.15, 0.2, 0.25, 0.3, 0.4, 0.5)
+
+KEYWORD_GOALS = [
+    "Planejar uma viagem para o Japão",
+    "Criar um aplicativo mobile",
+    "Organizar uma festa de aniversário",
+    "Implementar sistema de gestão de tarefas",
+    "Desenvolver projeto de pesquisa",
+]
+
+def check_held_out() -> None:
+    """Falha se algum goal de HELD_OUT_GOALS repete uma palavra dos exemplos"""
+    vocabulary = {
+        word
+        for phrases in task_generator_agent.TEMPLATE_REGISTRY.exemplars().values()
+        for phrase in phrases
+        for word in normalize_text(phrase).split()
+    }
+    overlaps = {goal: shared for goal, _ in HELD_OUT_GOALS if (shared := vocabulary & set(normalize_text(goal).split()))}
+    if overlaps:
+        raise SystemExit(f"Goals de avaliação com palavras dos exemplos: {overlaps}")
+
+def quality(intentions: list) -> dict:
+    """
+    Acerto nos goals fora dos exemplos, fração dos negativos que ficam em
+    "geral" e precisão das intenções atribuídas (certas / atribuídas)
+    """
+    predicted = dict(zip((goal for goal, _ in LABELED_GOALS), intentions))
+    assigned = [(predicted[goal], expected) for goal, expected in LABELED_GOALS if predicted[goal] != "geral"]
+    return {
+        "held_out": sum(predicted[goal] == expected for goal, expected in HELD_OUT_GOALS) / len(HELD_OUT_GOALS),
+        "negatives": sum(predicted[goal] == "geral" for goal in NEGATIVE_GOALS) / len(NEGATIVE_GOALS),
+        "precision": sum(intention == expected for intention, expected in assigned) / len(assigned) if assigned else 1.0,
+        "assigned": len(assigned),
+    }
+
+def detected(goals: list) -> list:
+    return [task_generator_agent.analyze_goal_feasibility(goal)["detected_intention"] for goal, _ in goals]
+
+def format_quality(name: str, metrics: dict) -> str:
+    return (
+        f"{name:<28}{metrics['held_out']:>10.0%}{metrics['negatives']:>12.0%}"
+        f"{metrics['precision']:>11.0%}{metrics['assigned']:>11}"
+    )
+
+def mean_us(goals: list) -> float:
+    started = time.perf_counter()
+    for goal in goals:
+        task_generator_agent.analyze_goal_feasibility(goal)
+    return (time.perf_counter() - started) / len(goals) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embedder", default="hashing")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--keyword-share", type=float, default=0.7)
+    parser.add_argument("--repeat-share", type=float, default=0.8)
+    args = parser.parse_args()
+
+    check_held_out()
+    embedder = HashingEmbedder() if args.embedder == "hashing" else SentenceTransformerEmbedder(args.embedder)
+    rng = random.Random(42)
+    traffic = []
+    for i in range(args.requests):
+        if rng.random() < args.keyword_share:
+            traffic.append(rng.choice(KEYWORD_GOALS))
+        elif rng.random() < args.repeat_share:
+            traffic.append(rng.choice(LABELED_GOALS)[0])
+        else:
+            traffic.append(f"{rng.choice(LABELED_GOALS)[0]} #{i}")
+    unlabeled = [goal for goal, _ in LABELED_GOALS]
+
+    task_generator_agent.set_semantic_classifier(None)
+    keyword_quality = quality(detected(LABELED_GOALS))
+    keyword_us = mean_us(unlabeled * 200)
+    keyword_traffic_us = mean_us(traffic)
+
+    classifier = SemanticIntentionClassifier(embedder=embedder)
+    task_generator_agent.set_semantic_classifier(classifier)
+    semantic_quality = quality(detected(LABELED_GOALS))
+    cached_us = mean_us(unlabeled * 200)
+    classifier.cache_size = 0
+    classifier.clear_cache()
+    uncached_us = mean_us(unlabeled * 5)
+    classifier.cache_size = 4096
+    semantic_traffic_us = mean_us(traffic)
+    task_generator_agent.set_semantic_classifier(None)
+
+    # Calibração: as mesmas previsões, aceitas a partir de outros limiares
+    predictions = [classifier.predict(goal) for goal, _ in LABELED_GOALS]
+    sweep = {
+        threshold: quality([
+            prediction.candidates[0][0] if prediction.score >= threshold else "geral" for prediction in predictions
+        ])
+        for threshold in SWEEP_THRESHOLDS
+    }
+
+    print(f"Embedder: {embedder.name} | limiar: {classifier.threshold}")
+    print(
+        f"{len(HELD_OUT_GOALS)} goals fora dos exemplos (sem palavras em comum) e "
+        f"{len(NEGATIVE_GOALS)} negativos (devem ficar em \"geral\")\n"
+    )
+    print(f"{'':<28}{'acerto':>10}{'negativos':>12}{'precisão':>11}{'atribuídas':>11}")
+    print(format_quality("só palavras-chave", keyword_quality))
+    print(format_quality(f"semântico (limiar {classifier.threshold:g})", semantic_quality))
+    for threshold, metrics in sweep.items():
+        print(format_quality(f"  limiar {threshold:g}", metrics))
+    print(f"\n{'analyze_goal_feasibility':<40}{'µs/goal':>10}")
+    print(f"{'só palavras-chave':<40}{keyword_us:>10.1f}")
+    print(f"{'semântico, sem cache':<40}{uncached_us:>10.1f}")
+    print(f"{'semântico, com cache':<40}{cached_us:>10.1f}")
+    print(
+        f"\nTráfego misto ({args.keyword_share:.0%} com palavra-chave): "
+        f"{keyword_traffic_us:.1f} µs -> {semantic_traffic_us:.1f} µs por goal | cache: {classifier.stats()}"
+    )
+
+if __name__ == "__main__":
+    main()
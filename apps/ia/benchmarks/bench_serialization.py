@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vazão (bytes/s) da serialização de planos grandes por backend
+
+Monta um plano com ``--tasks`` tarefas (concatenando planos gerados pelo
+pipeline) e mede, para cada backend instalado de serialization.py, a vazão de
+``dumps`` compacto e indentado e de ``loads``. A referência é o caminho
+antigo: ``json.dumps(..., ensure_ascii=False, indent=2)``.
+
+Uso:
+    python -m benchmarks.bench_serialization [--tasks 10000]
+"""
+
+import argparse
+import json
+import timeit
+
+import serialization
+from benchmarks.corpus import generate_corpus
+from task_generator_agent import analyze_goal_feasibility, build_structured_plan, build_task_steps
+
+def build_large_plan(task_count: int) -> dict:
+    plan = None
+    for goal in generate_corpus(task_count):
+        intention = analyze_goal_feasibility(goal)["detected_intention"]
+        current = build_structured_plan(goal, build_task_steps(goal, intention))
+        if plan is None:
+            plan = current
+        else:
+            plan["tasks"].extend(current["tasks"])
+        if len(plan["tasks"]) >= task_count:
+            break
+    plan["metadata"]["total_tasks"] = len(plan["tasks"])
+    return plan
+
+def best_seconds(call, repeat: int) -> float:
+    return min(timeit.repeat(call, repeat=repeat, number=1))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    plan = build_large_plan(args.tasks)
+    legacy = json.dumps(plan, ensure_ascii=False, indent=2).encode("utf-8")
+    legacy_s = best_seconds(lambda: json.dumps(plan, ensure_ascii=False, indent=2).encode("utf-8"), args.repeat)
+
+    print(f"Plano: {len(plan['tasks'])} tarefas | JSON indentado: {len(legacy) / 2**20:.2f} MiB")
+    print(f"{'backend':<24}{'tamanho (MiB)':>15}{'dumps (MiB/s)':>15}{'loads (MiB/s)':>15}{'vs antigo':>11}")
+    print(f"{'json indent=2 (antigo)':<24}{len(legacy) / 2**20:>15.2f}{len(legacy) / legacy_s / 2**20:>15.1f}{'-':>15}{'1.0x':>11}")
+
+    for name in serialization.available_backends():
+        serializer = serialization.get_serializer(name)
+        for pretty in (False, True):
+            data = serializer.dumps(plan, pretty)
+            assert serializer.loads(data) == plan
+            dumps_s = best_seconds(lambda: serializer.dumps(plan, pretty), args.repeat)
+            loads_s = best_seconds(lambda: serializer.loads(data), args.repeat)
+            label = f"{name} {'pretty' if pretty else 'compacto'}"
+            print(
+                f"{label:<24}{len(data) / 2**20:>15.2f}{len(data) / dumps_s / 2**20:>15.1f}"
+                f"{len(data) / loads_s / 2**20:>15.1f}{legacy_s / dumps_s:>10.1f}x"
+            )
+
+    print(f"\nBackend padrão: {serialization.get_serializer().name}")
+
+if __name__ == "__main__":
+    main()
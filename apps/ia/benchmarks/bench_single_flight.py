@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: coalescência de requisições simultâneas (single-flight)
+
+Dispara rajadas de requisições em que poucos goals distintos se repetem
+(``--requests`` requisições sobre ``--distinct`` goals), pelo caminho
+síncrono (threads) e pelo assíncrono (asyncio.gather), com e sem
+single-flight. ``--latency-ms`` acrescenta uma espera a cada execução do
+grafo, simulando a chamada a um provedor de IA.
+
+Uso:
+    python -m benchmarks.bench_single_flight [--requests 64] [--distinct 4] [--latency-ms 50]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+GOALS = [
+    "Planejar uma viagem para o Japão",
+    "Criar um aplicativo mobile",
+    "Organizar uma festa de aniversário",
+    "Implementar sistema de gestão de tarefas",
+    "Desenvolver projeto de pesquisa",
+    "Escrever um livro de receitas",
+]
+
+def with_latency(agent, latency: float):
+    """Acrescenta ``latency`` segundos a cada execução do grafo do agente"""
+    invoke, ainvoke = agent._invoke_graph, agent._ainvoke_graph
+
+    def slow_invoke(*args, **kwargs):
+        time.sleep(latency)
+        return invoke(*args, **kwargs)
+
+    async def slow_ainvoke(*args, **kwargs):
+        await asyncio.sleep(latency)
+        return await ainvoke(*args, **kwargs)
+
+    agent._invoke_graph, agent._ainvoke_graph = slow_invoke, slow_ainvoke
+    return agent
+
+def run_threads(agent, goals: list) -> list:
+    with ThreadPoolExecutor(max_workers=len(goals)) as executor:
+        return list(executor.map(agent.generate_tasks, goals))
+
+async def run_async(agent, goals: list) -> list:
+    return await asyncio.gather(*(agent.agenerate_tasks(goal) for goal in goals))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--distinct", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+    from task_generator_agent import TaskGeneratorAgent
+
+    distinct = [GOALS[i % len(GOALS)] + ("" if i < len(GOALS) else f" #{i}") for i in range(args.distinct)]
+    goals = [distinct[i % len(distinct)] for i in range(args.requests)]
+    # Aquece o grafo compartilhado fora da medição
+    TaskGeneratorAgent().generate_tasks(goals[0])
+
+    print(f"{args.requests} requisições, {args.distinct} goals distintos, {args.latency_ms:g} ms por execução do grafo\n")
+    print(f"{'caminho':<12}{'single-flight':<15}{'tempo (ms)':>12}{'execuções':>11}{'coalescidas':>13}{'ids únicos':>12}")
+    for path in ("threads", "async"):
+        for enabled in (False, True):
+            agent = with_latency(TaskGeneratorAgent(single_flight=enabled), args.latency_ms / 1000)
+            started = time.perf_counter()
+            results = run_threads(agent, goals) if path == "threads" else asyncio.run(run_async(agent, goals))
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            assert not any("error" in result for result in results)
+
+            stats = agent.single_flight_stats() or {"executed": len(goals), "coalesced": 0}
+            unique_ids = len({result["id"] for result in results})
+            print(
+                f"{path:<12}{'sim' if enabled else 'não':<15}{elapsed_ms:>12.1f}"
+                f"{stats['executed']:>11}{stats['coalesced']:>13}{unique_ids:>12}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: custo por goal de build_task_steps com muitos templates e destinos
+
+Copia os templates do projeto para um diretório temporário, acrescenta
+``--intentions`` intenções sintéticas e ``--destinations`` regras de
+personalização para ``planejamento_viagem`` e compara o custo por goal com o
+dos templates originais. A carga (feita uma vez por processo e a cada recarga)
+é reportada à parte.
+
+Uso:
+    python -m benchmarks.bench_step_templates [--intentions 300] [--destinations 500]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+import timeit
+
+import task_generator_agent
+from step_templates import DEFAULT_TEMPLATES_DIR, StepTemplateRegistry
+
+GOALS = [
+    ("Planejar uma viagem para o Japão", "planejamento_viagem"),
+    ("Planejar viagem para destino-sintetico-0250", "planejamento_viagem"),
+    ("Criar um aplicativo mobile", "criação_conteudo"),
+    ("Organizar uma festa de aniversário", "organização_atividade"),
+    ("Melhorar minha saúde", "geral"),
+]
+
+def write_synthetic_templates(directory: str, intentions: int, destinations: int) -> None:
+    rules = [
+        {"name": f"destino-{i}", "keywords": [f"destino-sintetico-{i:04d}"], "overrides": {"voos": f"Reservar voos para o destino {i}"}}
+        for i in range(destinations)
+    ]
+    with open(os.path.join(directory, "zz_destinos.json"), "w", encoding="utf-8") as f:
+        json.dump({"intention": "planejamento_viagem", "personalization": rules}, f, ensure_ascii=False)
+    for i in range(intentions):
+        steps = [{"description": f"Passo {n} da intenção {i}"} for n in range(1, 11)]
+        with open(os.path.join(directory, f"zz_intencao_{i:04d}.json"), "w", encoding="utf-8") as f:
+            json.dump({"intention": f"intencao_{i}", "steps": steps}, f, ensure_ascii=False)
+
+def per_goal_us(registry: StepTemplateRegistry, calls: int) -> float:
+    task_generator_agent.TEMPLATE_REGISTRY = registry
+    goals = [GOALS[i % len(GOALS)] for i in range(calls)]
+    run = lambda: [task_generator_agent.build_task_steps(goal, intention) for goal, intention in goals]
+    return min(timeit.repeat(run, repeat=3, number=1)) / calls * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--intentions", type=int, default=300)
+    parser.add_argument("--destinations", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        shutil.copytree(DEFAULT_TEMPLATES_DIR, directory, dirs_exist_ok=True)
+        write_synthetic_templates(directory, args.intentions, args.destinations)
+
+        print(f"{'templates':<34}{'intenções':>10}{'carga (ms)':>12}{'por goal (µs)':>15}")
+        for label, path in (("originais", DEFAULT_TEMPLATES_DIR), ("com sintéticos", directory)):
+            registry = StepTemplateRegistry(path)
+            started = time.perf_counter()
+            intentions = len(registry.intentions())
+            load_ms = (time.perf_counter() - started) * 1000
+            print(f"{label:<34}{intentions:>10}{load_ms:>12.1f}{per_goal_us(registry, args.calls):>15.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark: escalabilidade do cronograma do grafo de tarefas (task_dag)
+
+Gera DAGs aleatórios com ``--fan-in`` dependências por tarefa (sempre para
+tarefas anteriores, então sem ciclos) e mede construção do grafo + Kahn +
+ES/EF + caminho crítico. O custo por (tarefa + dependência) deve ficar
+estável com o tamanho do plano, confirmando o comportamento linear.
+
+Uso:
+    python -m benchmarks.bench_task_dag [--sizes 1000 10000 50000] [--fan-in 3]
+"""
+
+import argparse
+import random
+import timeit
+
+from task_dag import TaskGraph
+
+def random_plan(size: int, fan_in: int, seed: int = 42) -> tuple:
+    rng = random.Random(seed)
+    ids = [f"task-{i}" for i in range(size)]
+    durations = [float(rng.randint(1, 3)) for _ in range(size)]
+    dependencies = [[ids[rng.randrange(i)] for _ in range(min(i, fan_in))] for i in range(size)]
+    return ids, durations, dependencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'tarefas':>10}{'dependências':>14}{'cronograma (ms)':>17}{'ns / elemento':>15}{'makespan':>10}")
+    for size in args.sizes:
+        ids, durations, dependencies = random_plan(size, args.fan_in)
+        edges = sum(len(deps) for deps in dependencies)
+        best = min(timeit.repeat(
+            lambda: TaskGraph(ids, durations, dependencies).schedule(), repeat=args.repeat, number=1
+        ))
+        makespan = TaskGraph(ids, durations, dependencies).schedule().makespan
+        print(f"{size:>10}{edges:>14}{best * 1000:>17.1f}{best / (size + edges) * 1e9:>15.0f}{makespan:>10g}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memória por 10 mil tarefas, dict vs modelo compacto (task_model)
+
+Gera planos com build_structured_plan até somar ``--tasks`` tarefas e mede,
+com tracemalloc, a memória retida pelos dicts do formato atual e pelos
+CompactPlan equivalentes. Confere também que a conversão é sem perdas e o
+custo de cada direção da conversão.
+
+Uso:
+    python -m benchmarks.bench_task_model [--tasks 10000]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.corpus import generate_corpus
+from task_generator_agent import analyze_goal_feasibility, build_structured_plan, build_task_steps
+from task_model import CompactPlan
+
+def build_plans(task_count: int) -> list:
+    plans = []
+    total = 0
+    for goal in generate_corpus(task_count):
+        intention = analyze_goal_feasibility(goal)["detected_intention"]
+        plan = build_structured_plan(goal, build_task_steps(goal, intention))
+        plans.append(plan)
+        total += len(plan["tasks"])
+        if total >= task_count:
+            break
+    return plans
+
+def retained_bytes(factory) -> tuple:
+    """Memória retida pelo resultado de ``factory()``, em bytes"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = factory()
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    plans, dict_bytes = retained_bytes(lambda: build_plans(args.tasks))
+    task_count = sum(len(plan["tasks"]) for plan in plans)
+
+    # Converte uma cópia independente: o modelo compacto não pode reaproveitar
+    # strings (goal, created_at) nem metadata já contabilizados nos dicts
+    compact, compact_bytes = retained_bytes(
+        lambda: [CompactPlan.from_dict(plan) for plan in json.loads(json.dumps(plans))]
+    )
+
+    started = time.perf_counter()
+    for plan in plans:
+        CompactPlan.from_dict(plan)
+    from_dict_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    restored = [plan.to_dict() for plan in compact]
+    to_dict_ms = (time.perf_counter() - started) * 1000
+
+    lossless = restored == plans
+    scale = 10_000 / task_count
+    print(f"Planos: {len(plans)} | Tarefas: {task_count}")
+    print(f"{'modelo':<12}{'MiB / 10k tarefas':>20}{'bytes / tarefa':>17}")
+    print(f"{'dict':<12}{dict_bytes * scale / 2**20:>20.2f}{dict_bytes / task_count:>17.0f}")
+    print(f"{'compacto':<12}{compact_bytes * scale / 2**20:>20.2f}{compact_bytes / task_count:>17.0f}")
+    print(f"\nRedução: {1 - compact_bytes / dict_bytes:.0%} ({dict_bytes / compact_bytes:.1f}x)")
+    print(f"Conversão por 10k tarefas: from_dict {from_dict_ms * scale:.1f} ms | to_dict {to_dict_ms * scale:.1f} ms")
+    print(f"Conversão sem perdas: {'✅' if lossless else '❌'}")
+
+if __name__ == "__main__":
+    main()
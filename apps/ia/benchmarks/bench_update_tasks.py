@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replanejamento incremental (update_tasks) vs geração completa
+
+Para pares de goals editados, compara a latência de ``generate_tasks`` no goal
+novo com a de ``update_tasks`` a partir do plano anterior, e o tamanho do
+documento completo com o do patch (JSON compacto).
+
+Uso:
+    python -m benchmarks.bench_update_tasks [--iterations 500]
+"""
+
+import argparse
+import os
+import time
+
+import serialization
+from plan_diff import apply_patch
+
+EDITS = [
+    ("Planejar uma viagem para o Japão de 2 semanas", "Planejar uma viagem para o Japão de 3 semanas"),
+    ("Planejar uma viagem para o Japão", "Planejar uma viagem para a França"),
+    ("Organizar uma festa de aniversário", "Organizar uma festa de aniversário surpresa"),
+    ("Criar um aplicativo mobile", "Implementar sistema de gestão de tarefas"),
+]
+
+def mean_ms(call, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) / iterations * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+    from task_generator_agent import TaskGeneratorAgent
+
+    agent = TaskGeneratorAgent()
+    print(f"{'goal editado':<44}{'generate (ms)':>14}{'update (ms)':>13}{'doc (B)':>9}{'patch (B)':>11}{'ids mantidos':>14}")
+    for old_goal, new_goal in EDITS:
+        previous = agent.generate_tasks(old_goal)
+        update = agent.update_tasks(previous, new_goal)
+        full = agent.generate_tasks(new_goal)
+        assert [t["title"] for t in apply_patch(previous, update["patch"])["tasks"]] == [t["title"] for t in full["tasks"]]
+
+        generate_ms = mean_ms(lambda: agent.generate_tasks(new_goal), args.iterations)
+        update_ms = mean_ms(lambda: agent.update_tasks(previous, new_goal), args.iterations)
+        label = new_goal[:42]
+        print(
+            f"{label:<44}{generate_ms:>14.3f}{update_ms:>13.3f}{len(serialization.dumps_bytes(full)):>9}"
+            f"{len(serialization.dumps_bytes(update['patch'])):>11}"
+            f"{update['stats']['tasks_kept']:>9}/{len(full['tasks'])}"
+        )
+
+if __name__ == "__main__":
+    main()
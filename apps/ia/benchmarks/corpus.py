@@ -0,0 +1,85 @@
+"""
+Corpus sintético de goals para os benchmarks
+
+Gera goals com tamanho (em palavras) e mistura de intenções configuráveis.
+Cada goal contém a palavra-chave da intenção sorteada e é completado com
+palavras neutras; o resultado é conferido com o GOAL_KEYWORD_MATCHER, então a
+intenção detectada pelo pipeline é exatamente a sorteada.
+
+Uso em outros scripts:
+    from benchmarks.corpus import generate_corpus, parse_intention_mix
+    goals = generate_corpus(1000, parse_intention_mix("planejamento_viagem=3,geral=1"))
+"""
+
+import random
+from typing import Dict, List, Optional
+
+from task_generator_agent import GOAL_KEYWORD_MATCHER, INTENTION_KEYWORDS
+
+# Intenção -> palavra-chave que a dispara (a primeira registrada)
+INTENTION_TRIGGERS: Dict[str, str] = {}
+for _keyword, _intention in INTENTION_KEYWORDS.items():
+    INTENTION_TRIGGERS.setdefault(_intention, _keyword)
+
+INTENTIONS = tuple(INTENTION_TRIGGERS) + ("geral",)
+
+# Palavras que não contêm nenhuma palavra-chave das tabelas
+NEUTRAL_WORDS = [
+    "uma", "meu", "nosso", "novo", "completo", "semanal", "para", "com", "família", "equipe",
+    "cliente", "casa", "trabalho", "final", "ano", "mês", "grande", "pequeno", "bem", "detalhado",
+    "orçamento", "roteiro", "lista", "relatório", "reunião", "cronograma", "metas", "pessoal",
+]
+
+def parse_intention_mix(spec: Optional[str]) -> Optional[Dict[str, float]]:
+    """Converte ``"intencao=peso,..."`` em dicionário (None = mistura uniforme)"""
+    if not spec:
+        return None
+    mix = {}
+    for item in spec.split(","):
+        intention, _, weight = item.partition("=")
+        intention = intention.strip()
+        if intention not in INTENTIONS:
+            raise ValueError(f"Intenção desconhecida: {intention!r} (opções: {', '.join(INTENTIONS)})")
+        mix[intention] = float(weight or 1)
+    return mix
+
+def generate_corpus(
+    count: int,
+    intention_mix: Optional[Dict[str, float]] = None,
+    min_words: int = 4,
+    max_words: int = 12,
+    seed: int = 42
+) -> List[str]:
+    """
+    Gera ``count`` goals distintos e reprodutíveis.
+
+    Args:
+        count: Número de goals
+        intention_mix: Peso relativo de cada intenção (padrão: uniforme)
+        min_words: Tamanho mínimo do goal, em palavras
+        max_words: Tamanho máximo do goal, em palavras
+        seed: Semente do gerador
+
+    Returns:
+        Lista de goals
+    """
+
+    mix = intention_mix or {intention: 1.0 for intention in INTENTIONS}
+    intentions, weights = list(mix), list(mix.values())
+    rng = random.Random(seed)
+
+    goals = []
+    while len(goals) < count:
+        intention = rng.choices(intentions, weights)[0]
+        length = rng.randint(min_words, max_words)
+        words = rng.choices(NEUTRAL_WORDS, k=max(0, length - 2))
+        trigger = INTENTION_TRIGGERS.get(intention)
+        if trigger is not None:
+            words.insert(rng.randint(0, len(words)), trigger)
+        # Sufixo numérico garante goals distintos (sem acertos de cache)
+        goal = " ".join(words + [f"#{len(goals)}"])
+
+        if (GOAL_KEYWORD_MATCHER.match(goal).label or "geral") == intention:
+            goals.append(goal[0].upper() + goal[1:])
+
+    return goals
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Perfil por nó do grafo: onde o tempo de ``graph.invoke`` é gasto
+
+Executa o agente com um NodeProfiler sobre um conjunto de goals e imprime os
+percentis de tempo de parede, CPU e pico de memória por nó, incluindo o
+overhead do próprio LangGraph. Opcionalmente grava o resumo em JSON e as
+pilhas colapsadas para gerar um flamegraph.
+
+Uso:
+    python -m benchmarks.profile_nodes [--runs 500] [--no-memory]
+        [--json perfil.json] [--collapsed perfil.folded]
+
+    flamegraph.pl perfil.folded > perfil.svg
+"""
+
+import argparse
+import os
+
+from profiling import METRICS, NodeProfiler
+from task_generator_agent import TaskGeneratorAgent
+
+GOALS = [
+    "Planejar uma viagem para o Japão de 2 semanas",
+    "Criar um aplicativo mobile",
+    "Organizar uma festa de aniversário",
+    "Implementar sistema de gestão de tarefas",
+    "Desenvolver projeto de pesquisa",
+]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=500)
+    parser.add_argument("--no-memory", action="store_true", help="não usa tracemalloc (tempos mais precisos)")
+    parser.add_argument("--json", help="arquivo para o resumo em JSON")
+    parser.add_argument("--collapsed", help="arquivo para as pilhas colapsadas")
+    args = parser.parse_args()
+
+    # Mede só o custo local, sem envio de traces ao LangSmith
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+
+    profiler = NodeProfiler(trace_memory=not args.no_memory)
+    agent = TaskGeneratorAgent(profiler=profiler)
+
+    # Aquecimento (compilação do grafo e imports) fora das amostras
+    agent.generate_tasks(GOALS[0])
+    profiler.reset()
+
+    for i in range(args.runs):
+        agent.generate_tasks(GOALS[i % len(GOALS)])
+    profiler.close()
+
+    summary = profiler.summary()
+    print(f"{summary['runs']} execuções\n")
+    print(f"{'nó':<22}{'métrica':<10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for node, metrics in summary["nodes"].items():
+        for metric in METRICS:
+            if metric in metrics:
+                h = metrics[metric]
+                print(f"{node:<22}{metric:<10}{h['p50']:>10.3f}{h['p95']:>10.3f}{h['p99']:>10.3f}")
+
+    if args.json:
+        profiler.to_json(args.json)
+        print(f"\nResumo JSON: {args.json}")
+    if args.collapsed:
+        profiler.to_collapsed(args.collapsed)
+        print(f"Pilhas colapsadas: {args.collapsed}")
+
+if __name__ == "__main__":
+    main()
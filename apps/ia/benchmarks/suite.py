@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks do pipeline de geração de tarefas
+
+Camadas medidas:
+- micro: custo por chamada de cada ferramenta ``@tool`` (via ``invoke``) e da
+  função central correspondente
+- e2e: latência (p50/p95/p99) e vazão de ``generate_tasks`` em vários níveis
+  de concorrência (threads)
+- memória: pico de alocação por sessão e memória retida por resultado
+
+Os resultados são gravados em JSON (``--save``) e podem ser comparados com um
+baseline (``--compare``): métricas que pioram além de ``--threshold`` são
+marcadas como regressão e o script sai com código 1. Um baseline de outra
+``PIPELINE_VERSION`` ou de outros templates (``TEMPLATE_REGISTRY.version``)
+também faz a comparação falhar (precisa ser regenerado);
+diferenças de máquina (número de CPUs, Python) e de corpus geram avisos.
+
+Uso:
+    python -m benchmarks.suite --save benchmarks/baselines/local.json
+    python -m benchmarks.suite --compare benchmarks/baselines/reference.json [--threshold 0.15]
+    python -m benchmarks.suite --quick --intention-mix "planejamento_viagem=3,geral=1"
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from benchmarks.corpus import generate_corpus, parse_intention_mix
+
+def percentile(sorted_values: list, q: float) -> float:
+    """Percentil por ranking mais próximo"""
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    return {"value": value, "unit": unit, "better": better}
+
+def bench_micro(goals: list, number: int) -> dict:
+    """Custo médio por chamada, em µs, de cada ferramenta e função central"""
+    from task_generator_agent import (
+        analyze_goal_feasibility,
+        build_structured_plan,
+        build_task_steps,
+        generate_task_steps,
+        structure_tasks_json,
+        validate_goal_feasibility,
+    )
+
+    sample = goals[:number]
+    intentions = [analyze_goal_feasibility(goal)["detected_intention"] for goal in sample]
+    steps = [build_task_steps(goal, intention) for goal, intention in zip(sample, intentions)]
+    steps_json = [json.dumps(s, ensure_ascii=False) for s in steps]
+
+    cases = {
+        "validate_goal_feasibility": lambda i: validate_goal_feasibility.invoke({"goal": sample[i]}),
+        "generate_task_steps": lambda i: generate_task_steps.invoke({"goal": sample[i], "intention": intentions[i]}),
+        "structure_tasks_json": lambda i: structure_tasks_json.invoke({"goal": sample[i], "steps_data": steps_json[i]}),
+        "analyze_goal_feasibility": lambda i: analyze_goal_feasibility(sample[i]),
+        "build_task_steps": lambda i: build_task_steps(sample[i], intentions[i]),
+        "build_structured_plan": lambda i: build_structured_plan(sample[i], steps[i]),
+    }
+
+    results = {}
+    for name, call in cases.items():
+        # Melhor de 3 repetições, para reduzir o ruído de agendamento
+        best = min(timeit.repeat(lambda: [call(i) for i in range(len(sample))], repeat=3, number=1))
+        results[f"micro.{name}"] = metric(best / len(sample) * 1e6, "us/call")
+    return results
+
+def bench_e2e(agent, goals: list, concurrency_levels: list) -> dict:
+    """Latência e vazão de generate_tasks para cada nível de concorrência"""
+    results = {}
+    for workers in concurrency_levels:
+        def timed(goal):
+            started = time.perf_counter()
+            agent.generate_tasks(goal)
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            latencies = sorted(executor.map(timed, goals))
+        elapsed = time.perf_counter() - started
+
+        prefix = f"e2e.c{workers}"
+        results[f"{prefix}.p50_ms"] = metric(percentile(latencies, 0.50), "ms")
+        results[f"{prefix}.p95_ms"] = metric(percentile(latencies, 0.95), "ms")
+        results[f"{prefix}.p99_ms"] = metric(percentile(latencies, 0.99), "ms")
+        results[f"{prefix}.throughput"] = metric(len(goals) / elapsed, "goals/s", better="higher")
+    return results
+
+def bench_memory(agent, goals: list) -> dict:
+    """Pico de alocação por sessão e memória retida por resultado guardado"""
+    peaks = []
+    retained = []
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for goal in goals:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            retained.append(agent.generate_tasks(goal))
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "memory.peak_kib_per_session": metric(statistics.median(peaks) / 1024, "KiB"),
+        "memory.retained_kib_per_result": metric((current - baseline) / len(retained) / 1024, "KiB"),
+    }
+
+def run_suite(args) -> dict:
+    from task_generator_agent import PIPELINE_VERSION, TEMPLATE_REGISTRY, TaskGeneratorAgent, _results_version
+
+    goals = generate_corpus(
+        args.goals,
+        parse_intention_mix(args.intention_mix),
+        min_words=args.min_words,
+        max_words=args.max_words,
+        seed=args.seed,
+    )
+    agent = TaskGeneratorAgent()
+
+    # Aquecimento: imports tardios e compilação do grafo fora das medições
+    agent.generate_tasks(goals[0])
+
+    metrics = {}
+    metrics.update(bench_micro(goals, min(args.micro_calls, len(goals))))
+    metrics.update(bench_e2e(agent, goals, args.concurrency))
+    metrics.update(bench_memory(agent, goals[:args.memory_sessions]))
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "pipeline_version": PIPELINE_VERSION,
+            "template_version": TEMPLATE_REGISTRY.version,
+            # Versão combinada usada na chave do cache de planos
+            "results_version": _results_version(),
+            "corpus": {
+                "goals": args.goals,
+                "intention_mix": args.intention_mix or "uniforme",
+                "min_words": args.min_words,
+                "max_words": args.max_words,
+                "seed": args.seed,
+            },
+        },
+        "metrics": metrics,
+    }
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Imprime a comparação e retorna as métricas que regrediram"""
+    regressions = []
+    meta, reference_meta = current["meta"], baseline["meta"]
+    for key, label in (("pipeline_version", "PIPELINE_VERSION"), ("template_version", "templates")):
+        if meta[key] != reference_meta.get(key):
+            print(
+                f"\n❌ Baseline gerado com {label} {reference_meta.get(key)!r}, "
+                f"atual {meta[key]!r}: regenere o baseline com --save"
+            )
+            regressions.append(f"meta.{key}")
+    for key, label in (("cpu_count", "Número de CPUs"), ("python", "Versão do Python")):
+        if meta[key] != reference_meta.get(key):
+            print(
+                f"\n⚠️ {label} diferente do baseline ({reference_meta.get(key)} -> {meta[key]}); "
+                "latência e vazão não são comparáveis diretamente"
+            )
+    if meta["corpus"] != reference_meta.get("corpus"):
+        print("\n⚠️ Corpus diferente do baseline; a comparação pode não ser representativa")
+    print(f"\n{'métrica':<44}{'baseline':>12}{'atual':>12}{'variação':>10}")
+    for name, data in current["metrics"].items():
+        reference = baseline["metrics"].get(name)
+        if reference is None or not reference["value"]:
+            print(f"{name:<44}{'-':>12}{data['value']:>12.2f}{'novo':>10}")
+            continue
+
+        change = (data["value"] - reference["value"]) / reference["value"]
+        worse = change > threshold if data["better"] == "lower" else change < -threshold
+        flag = "  REGRESSÃO" if worse else ""
+        print(f"{name:<44}{reference['value']:>12.2f}{data['value']:>12.2f}{change:>+10.0%}{flag}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--goals", type=int, default=2000, help="tamanho do corpus sintético")
+    parser.add_argument("--intention-mix", help='pesos por intenção, ex.: "planejamento_viagem=3,geral=1"')
+    parser.add_argument("--min-words", type=int, default=4)
+    parser.add_argument("--max-words", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--micro-calls", type=int, default=1000)
+    parser.add_argument("--memory-sessions", type=int, default=200)
+    parser.add_argument("--quick", action="store_true", help="corpus e amostras reduzidos")
+    parser.add_argument("--save", help="grava os resultados em JSON")
+    parser.add_argument("--compare", help="baseline JSON para comparação")
+    parser.add_argument("--threshold", type=float, default=0.15, help="piora tolerada (fração)")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.goals, args.micro_calls, args.memory_sessions = 300, 200, 50
+
+    # Mede só o custo local, sem envio de traces ao LangSmith
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+
+    results = run_suite(args)
+
+    print(f"{'métrica':<44}{'valor':>12}  unidade")
+    for name, data in results["metrics"].items():
+        print(f"{name:<44}{data['value']:>12.2f}  {data['unit']}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nResultados gravados em {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nSem regressões acima de {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
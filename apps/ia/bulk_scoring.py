@@ -0,0 +1,112 @@
+"""
+Pontuação de viabilidade em lote com NumPy
+
+Reproduz a lógica de ``validate_goal_feasibility`` para milhões de goals de uma
+vez: cada goal é varrido uma única vez pelo GOAL_KEYWORD_MATCHER para montar a
+matriz de grupos atingidos, e os fatores, o score e a viabilidade são
+calculados como operações sobre colunas.
+
+Goals sem palavra-chave de intenção passam pela detecção semântica, quando
+ativa (``get_semantic_classifier``), em um único lote de embeddings.
+
+Os resultados são idênticos aos da ferramenta por goal
+(ver benchmarks/bench_bulk_scoring.py).
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from task_generator_agent import GOAL_KEYWORD_MATCHER, get_semantic_classifier
+
+# Colunas da matriz de palavras-chave (grupos de FEASIBILITY_KEYWORDS)
+_GROUP_COLUMNS = ("clarity_strong", "clarity_weak", "specific", "achievable", "urgent")
+_GROUP_BITS = {group: 1 << bit for bit, group in enumerate(_GROUP_COLUMNS)}
+
+FACTOR_COLUMNS = ("clarity", "specificity", "achievability", "timeframe")
+
+def _keyword_hits(goals: list):
+    """Varre cada goal distinto uma vez e retorna máscaras, palavras e intenções"""
+    seen = {}
+    masks = np.empty(len(goals), dtype=np.uint8)
+    word_counts = np.empty(len(goals), dtype=np.int64)
+
+    for i, goal in enumerate(goals):
+        hit = seen.get(goal)
+        if hit is None:
+            keyword_hits = GOAL_KEYWORD_MATCHER.match(goal)
+            mask = 0
+            for group in keyword_hits.groups:
+                mask |= _GROUP_BITS.get(group, 0)
+            hit = seen[goal] = (mask, len(goal.split()), keyword_hits.label)
+        masks[i], word_counts[i] = hit[0], hit[1]
+
+    # Como em analyze_goal_feasibility: sem palavra-chave, recorre à detecção semântica
+    labels = {goal: hit[2] for goal, hit in seen.items()}
+    classifier = get_semantic_classifier()
+    unlabeled = [goal for goal, label in labels.items() if label is None]
+    if classifier is not None and unlabeled:
+        for goal, prediction in zip(unlabeled, classifier.predict_many(unlabeled)):
+            labels[goal] = prediction.intention
+
+    intentions = [labels[goal] or "geral" for goal in goals]
+    return masks, word_counts, intentions
+
+def _python_round(values: np.ndarray, digits: int) -> np.ndarray:
+    """Aplica o round() do Python (np.round pode divergir no último dígito)"""
+    unique, inverse = np.unique(values, return_inverse=True)
+    rounded = np.array([round(float(value), digits) for value in unique])
+    return rounded[inverse]
+
+def score_goals_bulk(goals: Iterable[str], as_dataframe: bool = False):
+    """
+    Calcula a análise de viabilidade de vários goals de uma vez.
+
+    Args:
+        goals: Goals a pontuar
+        as_dataframe: Retorna um pandas.DataFrame em vez de um array estruturado
+
+    Returns:
+        Array estruturado (ou DataFrame) com as colunas clarity, specificity,
+        achievability, timeframe, feasibility_score, is_feasible e
+        detected_intention, na ordem de entrada
+    """
+
+    goals = list(goals)
+    masks, word_counts, intentions = _keyword_hits(goals)
+
+    def hit(group: str) -> np.ndarray:
+        return (masks & _GROUP_BITS[group]) != 0
+
+    # Mesmas faixas de analyze_goal_feasibility
+    clarity = np.where(hit("clarity_strong"), 0.8, np.where(hit("clarity_weak"), 0.6, 0.3))
+    specificity = np.where(hit("specific"), 0.9, np.where(word_counts > 3, 0.7, 0.4))
+    achievability = np.where(hit("achievable"), 0.85, 0.6)
+    timeframe = np.where(hit("urgent"), 0.7, 0.8)
+
+    # Mesma ordem de soma de sum(feasibility_factors.values())
+    total_score = (((clarity + specificity) + achievability) + timeframe) / len(FACTOR_COLUMNS)
+
+    intention_width = max((len(i) for i in intentions), default=1)
+    result = np.empty(len(goals), dtype=[
+        ("clarity", "f8"),
+        ("specificity", "f8"),
+        ("achievability", "f8"),
+        ("timeframe", "f8"),
+        ("feasibility_score", "f8"),
+        ("is_feasible", "?"),
+        ("detected_intention", f"U{intention_width}"),
+    ])
+    result["clarity"] = clarity
+    result["specificity"] = specificity
+    result["achievability"] = achievability
+    result["timeframe"] = timeframe
+    result["feasibility_score"] = _python_round(total_score, 2)
+    result["is_feasible"] = total_score > 0.6
+    result["detected_intention"] = intentions
+
+    if as_dataframe:
+        import pandas as pd
+        return pd.DataFrame(result)
+
+    return result
@@ -0,0 +1,51 @@
+"""
+Checkpointer SQLite para execução durável do grafo
+
+Cada execução usa o ``session_id`` como ``thread_id`` do LangGraph, então o
+estado é gravado após cada nó concluído. Se o worker cair ou reiniciar, a
+sessão continua a partir do último nó gravado (ver
+``TaskGeneratorAgent.resume_tasks``) em vez de recalcular tudo.
+
+Tudo roda sobre um arquivo local, sem servidor. Para manter o custo por nó
+baixo:
+- WAL + ``synchronous=NORMAL``: cada commit é um append no WAL, sem fsync
+  (o fsync acontece só no checkpoint do WAL); uma queda de energia pode
+  perder as últimas sessões, mas nunca corrompe o banco
+- durabilidade ``"async"`` (padrão): a gravação de um nó acontece em segundo
+  plano enquanto o próximo nó executa; ``"sync"`` espera cada gravação e
+  ``"exit"`` grava só ao final da execução (uma única escrita por sessão,
+  sem retomada no meio)
+
+O orçamento é ``CHECKPOINT_BUDGET_MS_PER_NODE`` de overhead médio por nó,
+medido por benchmarks/bench_checkpoint.py.
+"""
+
+import sqlite3
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+# Overhead máximo aceitável do checkpointing por nó, em milissegundos
+CHECKPOINT_BUDGET_MS_PER_NODE = 2.0
+
+CHECKPOINT_DURABILITY_MODES = ("sync", "async", "exit")
+
+def create_sqlite_checkpointer(path: str) -> SqliteSaver:
+    """
+    Cria um SqliteSaver sobre um arquivo local configurado para escrita rápida.
+
+    Args:
+        path: Caminho do arquivo SQLite (criado se não existir)
+
+    Returns:
+        Checkpointer pronto para ``StateGraph.compile(checkpointer=...)``
+    """
+
+    # O SqliteSaver serializa o acesso com um lock próprio, então a conexão
+    # pode ser compartilhada entre threads
+    conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    checkpointer = SqliteSaver(conn)
+    checkpointer.setup()
+    return checkpointer
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline das consultas em lote (MotorConsultas)
+
+Usa o embedding local determinístico, uma busca exata em NumPy sobre um
+acervo sintético e um LLM falso com latência fixa (``ExtratorFalso``).
+Compara, para um lote de consultas com repetições:
+
+- consultas sequenciais, uma a uma, sem cache (como ``query_engine.query``)
+- ``query_batch`` com cache vazio (paralelismo limitado + repetições no lote)
+- ``query_batch`` de novo, com os caches já preenchidos
+
+Uso:
+    python benchmark_consultas.py [--consultas 200] [--distintas 40] [--latencia-ms 200]
+"""
+
+import argparse
+import random
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from cache_embeddings import vetores_deterministicos
+from consultas import ExtratorFalso, MotorConsultas
+
+CLIENTES = ["Corporação Acme", "Stark Industries", "TechCorp Solutions", "Wayne Enterprises", "Umbrella"]
+TIPOS = ["fatura", "proposta", "contrato"]
+
+class Resposta(BaseModel):
+    nome_cliente: Optional[str]
+    valor_total: Optional[float]
+
+class NoFalso(NamedTuple):
+    node_id: str
+    texto: str
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--consultas", type=int, default=200)
+    parser.add_argument("--distintas", type=int, default=40)
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--latencia-ms", type=float, default=200.0, help="latência simulada de cada extração pelo LLM")
+    parser.add_argument("--max-llm-simultaneas", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    nodes = [
+        NoFalso(f"no-{i}", f"{rng.choice(TIPOS)} {i} cliente {rng.choice(CLIENTES)} valor total {rng.randint(1, 10**6)}")
+        for i in range(args.chunks)
+    ]
+    matriz = np.asarray(vetores_deterministicos([node.texto for node in nodes]), dtype=np.float32)
+
+    def recuperar(consulta, embedding):
+        similaridades = matriz @ np.asarray(embedding, dtype=np.float32)
+        return [nodes[i] for i in np.argsort(-similaridades)[:2]]
+
+    def embed_consulta(consulta):
+        return vetores_deterministicos([consulta])[0]
+
+    distintas = [f"Qual o valor total da {rng.choice(TIPOS)} {i} para a {rng.choice(CLIENTES)}?" for i in range(args.distintas)]
+    lote = [rng.choice(distintas) for _ in range(args.consultas)]
+
+    def novo_motor():
+        extrator = ExtratorFalso(Resposta, latencia=args.latencia_ms / 1000)
+        return MotorConsultas(recuperar, extrator, embed_consulta, extrator.modelo, max_llm_simultaneas=args.max_llm_simultaneas)
+
+    print(
+        f"{args.consultas} consultas ({args.distintas} distintas) | {args.chunks} chunks | "
+        f"LLM falso com {args.latencia_ms:g} ms | até {args.max_llm_simultaneas} chamadas simultâneas\n"
+    )
+    print(f"{'cenário':<34}{'tempo (s)':>11}{'consultas/s':>13}{'chamadas LLM':>14}")
+
+    extrator = ExtratorFalso(Resposta, latencia=args.latencia_ms / 1000)
+    inicio = time.perf_counter()
+    for consulta in lote:
+        extrator(consulta, recuperar(consulta, embed_consulta(consulta)))
+    segundos = time.perf_counter() - inicio
+    print(f"{'sequencial, sem cache':<34}{segundos:>11.2f}{len(lote) / segundos:>13.1f}{extrator.chamadas:>14}")
+
+    motor = novo_motor()
+    for cenario in ("query_batch, cache vazio", "query_batch, cache preenchido"):
+        chamadas_antes = motor.stats()["chamadas_llm"]
+        inicio = time.perf_counter()
+        motor.query_batch(lote)
+        segundos = time.perf_counter() - inicio
+        chamadas = motor.stats()["chamadas_llm"] - chamadas_antes
+        print(f"{cenario:<34}{segundos:>11.2f}{len(lote) / segundos:>13.1f}{chamadas:>14}")
+
+    estatisticas = motor.stats()
+    print(
+        f"\nCache de recuperação: {estatisticas['recuperacao']['taxa_acerto']:.0%} de acerto | "
+        f"cache de extração: {estatisticas['extracao']['taxa_acerto']:.0%} de acerto"
+    )
+
+if __name__ == "__main__":
+    main()
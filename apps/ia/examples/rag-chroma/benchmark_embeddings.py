@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline do cache de embeddings
+
+Simula as reindexações de um acervo com o embedding local determinístico e
+uma latência fixa por chamada ao modelo (como uma API remota), e mede vazão
+(chunks/s), taxa de acerto do cache e chamadas ao modelo em quatro cenários:
+
+- primeira indexação (cache vazio)
+- reindexação completa sem alterações (ex.: coleção recriada)
+- reindexação após alterar ``--alterados`` dos chunks
+- reinício do processo (cache reaberto do disco)
+
+Uso:
+    python benchmark_embeddings.py [--chunks 20000] [--latencia-ms 50] [--alterados 0.05]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from cache_embeddings import CacheEmbeddingsSQLite, EmbeddingsEmCache, vetores_deterministicos
+
+PALAVRAS = (
+    "cliente projeto valor total proposta fatura contrato status pendente aprovado prazo serviço "
+    "manutenção sistema energia consultoria agentes pagamento vencimento duração início mensal"
+).split()
+
+def gerar_chunks(quantidade: int, semente: int = 42) -> list:
+    rng = random.Random(semente)
+    return [f"documento {i}: " + " ".join(rng.choices(PALAVRAS, k=60)) for i in range(quantidade)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=20_000)
+    parser.add_argument("--latencia-ms", type=float, default=50.0, help="latência simulada por chamada ao modelo")
+    parser.add_argument("--alterados", type=float, default=0.05, help="fração de chunks alterados")
+    parser.add_argument("--tamanho-lote", type=int, default=256)
+    parser.add_argument("--max-tokens-lote", type=int, default=8000)
+    args = parser.parse_args()
+
+    def modelo(textos):
+        time.sleep(args.latencia_ms / 1000)
+        return vetores_deterministicos(textos)
+
+    chunks = gerar_chunks(args.chunks)
+    alterados = list(chunks)
+    for i in random.Random(7).sample(range(len(chunks)), int(len(chunks) * args.alterados)):
+        alterados[i] = chunks[i] + " (revisado)"
+
+    caminho = os.path.join(tempfile.mkdtemp(), "cache_embeddings.sqlite")
+    cenarios = [("primeira indexação", chunks, False), ("sem alterações", chunks, False),
+                (f"{args.alterados:.0%} alterados", alterados, False), ("após reinício", alterados, True)]
+
+    cache = CacheEmbeddingsSQLite(caminho)
+    print(f"{args.chunks} chunks | {args.latencia_ms:g} ms por chamada | lotes de até {args.tamanho_lote} textos / {args.max_tokens_lote} tokens\n")
+    print(f"{'cenário':<22}{'tempo (s)':>11}{'chunks/s':>12}{'acerto':>9}{'chamadas':>10}")
+    for nome, textos, reabrir in cenarios:
+        if reabrir:
+            cache.close()
+            cache = CacheEmbeddingsSQLite(caminho)
+        embeddings = EmbeddingsEmCache(modelo, "deterministico-384", cache, args.tamanho_lote, args.max_tokens_lote)
+        inicio = time.perf_counter()
+        for posicao in range(0, len(textos), 2048):
+            embeddings.embed(textos[posicao:posicao + 2048])
+        segundos = time.perf_counter() - inicio
+        estatisticas = embeddings.stats()
+        print(
+            f"{nome:<22}{segundos:>11.2f}{len(textos) / segundos:>12,.0f}"
+            f"{estatisticas['taxa_acerto']:>9.0%}{estatisticas['chamadas_modelo']:>10}"
+        )
+    print(f"\nCache em disco: {len(cache)} vetores, {os.path.getsize(caminho) / 1024**2:.1f} MiB")
+    cache.close()
+    shutil.rmtree(os.path.dirname(caminho))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline do roteamento de consultas (RoteadorConsultas)
+
+Gera um acervo sintético de documentos com campos já extraídos e um tráfego em
+que ``--estruturadas`` das perguntas pedem um campo de um documento
+identificável, em vários formatos ("valor total da proposta para a Cliente
+123", "status da fatura 2025-000123"...). As demais são livres, e parte delas
+cita um campo e uma entidade mas muda o sentido ("...antes do desconto",
+"Quem assinou..."). Compara enviar tudo ao LLM (``MotorConsultas.query_batch``
+com um LLM falso) com o roteamento, que responde as estruturadas pelo índice
+de campos, e confere cada resposta: uma pergunta livre respondida pelo índice
+ou uma estruturada respondida com o documento errado é um erro.
+
+Uso:
+    python benchmark_roteador.py [--documentos 20000] [--consultas 500] [--estruturadas 0.7]
+"""
+
+import argparse
+import random
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+from cache_embeddings import vetores_deterministicos
+from consultas import ExtratorFalso, MotorConsultas
+from roteador_consultas import IndiceCampos, RoteadorConsultas
+
+TIPOS = ["fatura", "proposta", "contrato"]
+STATUS = ["Pendente", "Aprovado", "Cancelado"]
+
+# Perguntas que o índice responde: (modelo, campo pedido)
+ESTRUTURADAS = [
+    ("Qual o valor total da {tipo_documento} para a {nome_cliente}?", "valor_total"),
+    ("Qual o status da {tipo_documento} {numero_documento}?", "status"),
+    ("Quem é o cliente do {nome_projeto}?", "nome_cliente"),
+    ("Situação da {tipo_documento} do {nome_projeto}", "status"),
+    ("Qual o preço da {tipo_documento} {numero_documento}?", "valor_total"),
+]
+# Perguntas que precisam do LLM, inclusive as parecidas com as estruturadas
+LIVRES = [
+    "Resuma as condições de pagamento do {nome_projeto}",
+    "Quem assinou a {tipo_documento} do {nome_projeto}?",
+    "Qual o valor total da {tipo_documento} para a {nome_cliente} antes do desconto?",
+    "Qual o valor total da {tipo_documento} {numero_documento} sem impostos?",
+    "Quanto a {nome_cliente} já pagou?",
+    "Liste todos os documentos da {nome_cliente}",
+]
+
+class Entidade(BaseModel):
+    nome_cliente: Optional[str]
+    nome_projeto: Optional[str]
+    valor_total: Optional[float]
+    status: Optional[str]
+    tipo_documento: Optional[str]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documentos", type=int, default=20_000)
+    parser.add_argument("--consultas", type=int, default=500)
+    parser.add_argument("--estruturadas", type=float, default=0.7)
+    parser.add_argument("--latencia-ms", type=float, default=200.0, help="latência simulada de cada extração pelo LLM")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    linhas = {
+        f"doc_{i:06}.pdf": {
+            "nome_cliente": f"Cliente {i}",
+            "nome_projeto": f"Projeto {i}",
+            "valor_total": float(rng.randint(1_000, 2_000_000)),
+            "status": rng.choice(STATUS),
+            "tipo_documento": rng.choice(TIPOS),
+            "numero_documento": f"{2025}-{i:06}"
+        }
+        for i in range(args.documentos)
+    }
+    inicio = time.perf_counter()
+    indice = IndiceCampos(linhas)
+    montagem_ms = (time.perf_counter() - inicio) * 1000
+
+    # Arquivo esperado de cada pergunta (None: deve ir para o LLM)
+    consultas, esperados = [], []
+    arquivos = list(linhas)
+    for _ in range(args.consultas):
+        arquivo = rng.choice(arquivos)
+        if rng.random() < args.estruturadas:
+            modelo, _ = rng.choice(ESTRUTURADAS)
+            esperados.append(arquivo)
+        else:
+            modelo = rng.choice(LIVRES)
+            esperados.append(None)
+        consultas.append(modelo.format(**linhas[arquivo]))
+
+    def novo_motor():
+        extrator = ExtratorFalso(Entidade, latencia=args.latencia_ms / 1000)
+        return MotorConsultas(
+            recuperar=lambda consulta, embedding: [],
+            extrair=extrator,
+            embed_consulta=lambda consulta: vetores_deterministicos([consulta])[0],
+            modelo=extrator.modelo,
+            max_llm_simultaneas=8
+        )
+
+    print(
+        f"{args.documentos} documentos (índice montado em {montagem_ms:.0f} ms) | {args.consultas} consultas, "
+        f"{args.estruturadas:.0%} estruturadas | LLM falso com {args.latencia_ms:g} ms\n"
+    )
+    print(f"{'cenário':<26}{'tempo (s)':>11}{'chamadas LLM':>14}")
+
+    motor = novo_motor()
+    inicio = time.perf_counter()
+    motor.query_batch(consultas)
+    print(f"{'tudo pelo LLM':<26}{time.perf_counter() - inicio:>11.2f}{motor.stats()['chamadas_llm']:>14}")
+
+    motor = novo_motor()
+    roteador = RoteadorConsultas(indice, motor, Entidade)
+    inicio = time.perf_counter()
+    respostas = roteador.responder_lote(consultas)
+    print(f"{'roteado':<26}{time.perf_counter() - inicio:>11.2f}{motor.stats()['chamadas_llm']:>14}")
+
+    erros = sum(resposta.arquivo != esperado for resposta, esperado in zip(respostas, esperados))
+    livres_no_indice = sum(esperado is None and resposta.origem == "indice" for resposta, esperado in zip(respostas, esperados))
+    print(f"Respostas erradas: {erros} (perguntas livres respondidas pelo índice: {livres_no_indice})")
+    if erros:
+        raise SystemExit(1)
+
+    estruturadas = [consulta for consulta, resposta in zip(consultas, respostas) if resposta.origem == "indice"]
+    inicio = time.perf_counter()
+    for consulta in estruturadas:
+        roteador.localizar(consulta)
+    microssegundos = (time.perf_counter() - inicio) / max(len(estruturadas), 1) * 1e6
+    print(f"\nRoteamento: {roteador.stats()} | consulta pelo índice: {microssegundos:.1f} µs")
+
+if __name__ == "__main__":
+    main()
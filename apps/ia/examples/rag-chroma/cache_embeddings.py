@@ -0,0 +1,177 @@
+"""
+Cache persistente de embeddings, indexado pelo hash do conteúdo
+
+Cada reindexação recalculava o embedding de todos os chunks, mesmo quando o
+texto era idêntico ao de uma execução anterior (PDF editado em uma página,
+arquivo renomeado, coleção recriada). Aqui:
+
+- ``CacheEmbeddingsSQLite``: vetores float32 em um arquivo SQLite local,
+  chave = SHA-256 de (modelo, texto); sobrevive a reinícios
+- ``EmbeddingsEmCache``: recebe uma lista de textos, busca os vetores no
+  cache, calcula só os que faltam (sem repetir textos iguais da mesma
+  chamada) em lotes limitados por quantidade e por tokens estimados, e
+  grava os novos no cache
+- ``vetores_deterministicos``: embedding local determinístico (hashing de
+  palavras e trigramas), sem rede nem modelo, para medir vazão e taxa de
+  acerto offline
+
+Os adaptadores para o LlamaIndex (``Settings.embed_model``) ficam em
+``modelos_embedding.py``.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import zlib
+from typing import Callable, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+def chave_embedding(modelo: str, texto: str) -> str:
+    """Chave do cache: o mesmo texto em modelos diferentes não colide"""
+    return hashlib.sha256(f"{modelo}\0{texto}".encode("utf-8")).hexdigest()
+
+def estimar_tokens(texto: str) -> int:
+    """Estimativa grosseira (~4 caracteres por token), suficiente para montar lotes"""
+    return len(texto) // 4 + 1
+
+class CacheEmbeddingsSQLite:
+    """
+    Vetores em um arquivo SQLite (ou ``":memory:"``), seguro entre threads
+
+    Args:
+        caminho: Arquivo do banco
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute("CREATE TABLE IF NOT EXISTS embeddings (chave TEXT PRIMARY KEY, vetor BLOB NOT NULL)")
+        self._conexao.commit()
+
+    def buscar(self, chaves: Sequence[str]) -> Dict[str, List[float]]:
+        """Vetores encontrados, por chave (as ausentes ficam de fora)"""
+        encontrados = {}
+        with self._lock:
+            # Limite de parâmetros por consulta do SQLite
+            for inicio in range(0, len(chaves), 500):
+                parte = chaves[inicio:inicio + 500]
+                marcadores = ",".join("?" * len(parte))
+                for chave, vetor in self._conexao.execute(
+                    f"SELECT chave, vetor FROM embeddings WHERE chave IN ({marcadores})", parte
+                ):
+                    encontrados[chave] = np.frombuffer(vetor, dtype=np.float32).tolist()
+        return encontrados
+
+    def gravar(self, itens: Iterable[tuple]) -> None:
+        """Grava pares (chave, vetor)"""
+        linhas = [(chave, np.asarray(vetor, dtype=np.float32).tobytes()) for chave, vetor in itens]
+        with self._lock:
+            self._conexao.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", linhas)
+            self._conexao.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conexao.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conexao.close()
+
+class EmbeddingsEmCache:
+    """
+    Embeddings com cache e lotes
+
+    Args:
+        calcular: Função que recebe uma lista de textos e retorna os vetores
+        modelo: Nome do modelo (entra na chave do cache)
+        cache: CacheEmbeddingsSQLite (ou objeto com ``buscar``/``gravar``)
+        tamanho_lote: Máximo de textos por chamada a ``calcular``
+        max_tokens_lote: Máximo de tokens estimados por chamada
+    """
+
+    def __init__(
+        self,
+        calcular: Callable[[List[str]], List[List[float]]],
+        modelo: str,
+        cache,
+        tamanho_lote: int = 256,
+        max_tokens_lote: int = 8000
+    ):
+        self.calcular = calcular
+        self.modelo = modelo
+        self.cache = cache
+        self.tamanho_lote = tamanho_lote
+        self.max_tokens_lote = max_tokens_lote
+        self.acertos = 0
+        self.faltas = 0
+        self.chamadas = 0
+        self._lock = threading.Lock()
+
+    def embed(self, textos: Sequence[str]) -> List[List[float]]:
+        """Vetores na ordem de ``textos``"""
+        chaves = [chave_embedding(self.modelo, texto) for texto in textos]
+        vetores = self.cache.buscar(list(dict.fromkeys(chaves)))
+
+        # Textos repetidos na mesma chamada são calculados uma vez
+        faltando = {}
+        for chave, texto in zip(chaves, textos):
+            if chave not in vetores:
+                faltando.setdefault(chave, texto)
+
+        chamadas = 0
+        for lote in self._lotes(list(faltando.items())):
+            calculados = self.calcular([texto for _, texto in lote])
+            chamadas += 1
+            novos = list(zip((chave for chave, _ in lote), calculados))
+            self.cache.gravar(novos)
+            vetores.update(novos)
+
+        with self._lock:
+            self.chamadas += chamadas
+            self.faltas += len(faltando)
+            self.acertos += len(textos) - len(faltando)
+        return [list(vetores[chave]) for chave in chaves]
+
+    def _lotes(self, itens: List[tuple]) -> Iterable[List[tuple]]:
+        """Agrupa respeitando o máximo de textos e de tokens estimados por lote"""
+        lote, tokens = [], 0
+        for item in itens:
+            custo = estimar_tokens(item[1])
+            if lote and (len(lote) >= self.tamanho_lote or tokens + custo > self.max_tokens_lote):
+                yield lote
+                lote, tokens = [], 0
+            lote.append(item)
+            tokens += custo
+        if lote:
+            yield lote
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.acertos + self.faltas
+            return {
+                "acertos": self.acertos,
+                "faltas": self.faltas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "chamadas_modelo": self.chamadas
+            }
+
+def vetores_deterministicos(textos: Sequence[str], dimensao: int = 384) -> List[List[float]]:
+    """
+    Embedding local determinístico: palavras e trigramas de caracteres
+    distribuídos por hashing (crc32, estável entre processos) em um vetor
+    normalizado. Textos parecidos dão vetores parecidos, o que basta para
+    testar busca e cache sem um modelo real.
+    """
+    matriz = np.zeros((len(textos), dimensao), dtype=np.float32)
+    for linha, texto in enumerate(textos):
+        for palavra in texto.lower().split():
+            recortada = f"<{palavra}>"
+            for termo in [palavra] + [recortada[i:i + 3] for i in range(len(recortada) - 2)]:
+                hash_termo = zlib.crc32(termo.encode("utf-8"))
+                matriz[linha, hash_termo % dimensao] += 1.0 if hash_termo & 0x80000000 else -1.0
+    normas = np.linalg.norm(matriz, axis=1, keepdims=True)
+    return (matriz / np.maximum(normas, 1e-12)).tolist()
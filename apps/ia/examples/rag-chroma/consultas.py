@@ -0,0 +1,267 @@
+"""
+Consultas em lote com cache de recuperação e de extração
+
+``index.as_query_engine(output_cls=...)`` refaz a busca vetorial e a extração
+pelo LLM a cada consulta, mesmo quando a pergunta e o contexto recuperado são
+os mesmos de antes. ``MotorConsultas`` separa as duas etapas e guarda cada uma
+em um cache LRU:
+
+1. recuperação: chave = embedding da consulta (arredondado) + versão do
+   índice -> nodes recuperados
+2. extração: chave = consulta normalizada + ids dos nodes recuperados +
+   modelo do LLM -> objeto Pydantic extraído
+
+``query_batch`` executa várias consultas em paralelo com no máximo
+``max_llm_simultaneas`` chamadas ao LLM ao mesmo tempo; consultas iguais no
+mesmo lote (após normalizar espaços e maiúsculas) são executadas uma vez só,
+do embedding à extração. As etapas são funções simples
+(``recuperar``, ``extrair``, ``embed_consulta``), então o motor roda também
+com um LLM falso (``ExtratorFalso``) em testes e benchmarks.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+class CacheLRU:
+    """
+    Cache LRU com limite de itens e validade opcional, seguro entre threads
+
+    Args:
+        max_itens: Itens mantidos; os usados há mais tempo saem primeiro
+        ttl_segundos: Validade de cada item (None = sem validade)
+    """
+
+    def __init__(self, max_itens: int = 1024, ttl_segundos: Optional[float] = None):
+        self.max_itens = max_itens
+        self.ttl_segundos = ttl_segundos
+        self.acertos = 0
+        self.faltas = 0
+        self.removidos = 0
+        self._itens: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chave: str):
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is not None and (self.ttl_segundos is None or time.monotonic() - item[1] < self.ttl_segundos):
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[0]
+            if item is not None:
+                del self._itens[chave]
+            self.faltas += 1
+            return None
+
+    def put(self, chave: str, valor) -> None:
+        with self._lock:
+            self._itens[chave] = (valor, time.monotonic())
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+                self.removidos += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._itens.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.acertos + self.faltas
+            return {
+                "acertos": self.acertos,
+                "faltas": self.faltas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "itens": len(self._itens),
+                "removidos": self.removidos
+            }
+
+def _hash(*partes: str) -> str:
+    return hashlib.sha256("\0".join(partes).encode("utf-8")).hexdigest()
+
+def _normalizar(consulta: str) -> str:
+    return " ".join(consulta.split()).casefold()
+
+def _id_node(node) -> str:
+    """Id de um NodeWithScore (ou de um node simples)"""
+    return getattr(node, "node", node).node_id
+
+class ExtratorFalso:
+    """
+    LLM falso para testes: devolve ``output_cls`` com todos os campos vazios
+    após ``latencia`` segundos e conta as chamadas
+    """
+
+    def __init__(self, output_cls, latencia: float = 0.0, modelo: str = "falso"):
+        self.output_cls = output_cls
+        self.latencia = latencia
+        self.modelo = modelo
+        self.chamadas = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, consulta: str, nodes: list):
+        with self._lock:
+            self.chamadas += 1
+        time.sleep(self.latencia)
+        return self.output_cls(**{campo: None for campo in self.output_cls.model_fields})
+
+class MotorConsultas:
+    """
+    Consultas com extração estruturada, cache em dois níveis e lotes
+
+    Args:
+        recuperar: ``(consulta, embedding) -> nodes`` (ex.: retriever do índice)
+        extrair: ``(consulta, nodes) -> objeto Pydantic`` (chamada ao LLM)
+        embed_consulta: ``consulta -> embedding``
+        modelo: Identifica o LLM na chave do cache de extração
+        versao_indice: Retorna uma versão do índice; quando muda, as
+            recuperações antigas deixam de valer
+        max_llm_simultaneas: Chamadas simultâneas a ``extrair`` em query_batch
+        max_cache_recuperacao: Itens do cache de recuperação
+        max_cache_extracao: Itens do cache de extração
+        ttl_segundos: Validade dos itens dos dois caches (None = sem validade)
+        casas_decimais: Arredondamento do embedding na chave de recuperação
+    """
+
+    def __init__(
+        self,
+        recuperar: Callable[[str, List[float]], list],
+        extrair: Callable[[str, list], Any],
+        embed_consulta: Callable[[str], List[float]],
+        modelo: str,
+        versao_indice: Callable[[], str] = lambda: "",
+        max_llm_simultaneas: int = 4,
+        max_cache_recuperacao: int = 1024,
+        max_cache_extracao: int = 1024,
+        ttl_segundos: Optional[float] = None,
+        casas_decimais: int = 4
+    ):
+        self.recuperar = recuperar
+        self.extrair = extrair
+        self.embed_consulta = embed_consulta
+        self.modelo = modelo
+        self.versao_indice = versao_indice
+        self.max_llm_simultaneas = max_llm_simultaneas
+        self.casas_decimais = casas_decimais
+        self.cache_recuperacao = CacheLRU(max_cache_recuperacao, ttl_segundos)
+        self.cache_extracao = CacheLRU(max_cache_extracao, ttl_segundos)
+        self.chamadas_llm = 0
+        self._em_andamento: Dict[tuple, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def do_indice(cls, index, llm, output_cls, similarity_top_k: int = 2, **kwargs) -> "MotorConsultas":
+        """Motor sobre um VectorStoreIndex do LlamaIndex, com o mesmo sintetizador de ``as_query_engine``"""
+        from llama_index.core import QueryBundle, Settings, get_response_synthesizer
+
+        retriever = index.as_retriever(similarity_top_k=similarity_top_k)
+        sintetizador = get_response_synthesizer(llm=llm, output_cls=output_cls)
+        return cls(
+            recuperar=lambda consulta, embedding: retriever.retrieve(QueryBundle(consulta, embedding=embedding)),
+            extrair=lambda consulta, nodes: sintetizador.synthesize(consulta, nodes).response,
+            embed_consulta=Settings.embed_model.get_query_embedding,
+            modelo=llm.metadata.model_name,
+            **kwargs
+        )
+
+    def query(self, consulta: str):
+        """Uma consulta, usando os caches"""
+        nodes = self._recuperar(consulta)
+        chave = self._chave_extracao(consulta, nodes)
+        resultado = self.cache_extracao.get(chave)
+        if resultado is None:
+            resultado = self._extrair(consulta, nodes)
+            self.cache_extracao.put(chave, resultado)
+        return resultado
+
+    def query_batch(self, consultas: Sequence[str]) -> list:
+        """
+        Várias consultas em paralelo; resultados na ordem de ``consultas``
+
+        Cria o próprio event loop (``asyncio.run``), então não pode ser chamada
+        de dentro de um loop em execução (servidores async, Jupyter): nesses
+        casos use ``await motor.aquery_batch(consultas)``.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aquery_batch(consultas))
+        raise RuntimeError(
+            "query_batch não pode ser chamada dentro de um event loop em execução; "
+            "use 'await motor.aquery_batch(consultas)'"
+        )
+
+    async def aquery_batch(self, consultas: Sequence[str]) -> list:
+        """Versão assíncrona de query_batch"""
+        # Uma execução por consulta distinta: repetidas não refazem embedding nem recuperação
+        distintas: Dict[str, str] = {}
+        for consulta in consultas:
+            distintas.setdefault(_normalizar(consulta), consulta)
+        limite = asyncio.Semaphore(self.max_llm_simultaneas)
+        resultados = await asyncio.gather(*(self._aquery(consulta, limite) for consulta in distintas.values()))
+        por_consulta = dict(zip(distintas, resultados))
+        return [por_consulta[_normalizar(consulta)] for consulta in consultas]
+
+    async def _aquery(self, consulta: str, limite: asyncio.Semaphore):
+        nodes = await asyncio.to_thread(self._recuperar, consulta)
+        chave = self._chave_extracao(consulta, nodes)
+        resultado = self.cache_extracao.get(chave)
+        if resultado is not None:
+            return resultado
+
+        # Mesma consulta e mesmo contexto já em extração neste lote: aguarda o resultado
+        flight = (id(asyncio.get_running_loop()), chave)
+        futuro = self._em_andamento.get(flight)
+        if futuro is not None:
+            return await asyncio.shield(futuro)
+
+        futuro = self._em_andamento[flight] = asyncio.get_running_loop().create_future()
+        try:
+            async with limite:
+                resultado = await asyncio.to_thread(self._extrair, consulta, nodes)
+            self.cache_extracao.put(chave, resultado)
+            futuro.set_result(resultado)
+            return resultado
+        except asyncio.CancelledError:
+            futuro.cancel()
+            raise
+        except Exception as erro:
+            futuro.set_exception(erro)
+            # Evita o aviso de exceção não consumida quando ninguém aguardava
+            futuro.exception()
+            raise
+        finally:
+            del self._em_andamento[flight]
+
+    def _recuperar(self, consulta: str) -> list:
+        embedding = self.embed_consulta(consulta)
+        arredondado = np.round(np.asarray(embedding, dtype=np.float32), self.casas_decimais)
+        # "+ 0.0" troca -0.0 por 0.0, para a chave não depender do sinal do zero
+        chave = _hash(str(self.versao_indice()), (arredondado + 0.0).tobytes().hex())
+        nodes = self.cache_recuperacao.get(chave)
+        if nodes is None:
+            nodes = self.recuperar(consulta, embedding)
+            self.cache_recuperacao.put(chave, nodes)
+        return nodes
+
+    def _extrair(self, consulta: str, nodes: list):
+        with self._lock:
+            self.chamadas_llm += 1
+        return self.extrair(consulta, nodes)
+
+    def _chave_extracao(self, consulta: str, nodes: list) -> str:
+        return _hash(self.modelo, _normalizar(consulta), *sorted(_id_node(node) for node in nodes))
+
+    def stats(self) -> dict:
+        with self._lock:
+            chamadas_llm = self.chamadas_llm
+        return {
+            "recuperacao": self.cache_recuperacao.stats(),
+            "extracao": self.cache_extracao.stats(),
+            "chamadas_llm": chamadas_llm
+        }
@@ -0,0 +1,65 @@
+"""
+Extração dos campos fixos de cada documento na ingestão
+
+Os campos de ``EntidadeExtraida`` (cliente, projeto, valor total, status,
+tipo) não mudam entre perguntas: são extraídos uma vez, por expressões
+regulares sobre o texto do PDF, e gravados como metadados dos chunks no
+Chroma e no manifesto (de onde sai o índice colunar de
+``roteador_consultas.py``). Campos não encontrados ficam de fora.
+
+Além deles, ``numero_documento`` ("Fatura Nº: 2025-001") identifica o
+documento nas consultas.
+"""
+
+import re
+from typing import Optional
+
+TIPOS_DOCUMENTO = {"fatura": "fatura", "proposta": "proposta", "contrato": "contrato"}
+
+_ROTULO = r"^\s*{}\s*:\s*(.+?)\s*$"
+_PADROES_TEXTO = {
+    "nome_cliente": re.compile(_ROTULO.format(r"Cliente"), re.IGNORECASE | re.MULTILINE),
+    "nome_projeto": re.compile(_ROTULO.format(r"(?:Proposta de )?Projeto"), re.IGNORECASE | re.MULTILINE),
+    "status": re.compile(_ROTULO.format(r"Status"), re.IGNORECASE | re.MULTILINE),
+    # Sem IGNORECASE: "Plano:" e "Ano:" também terminam em "no"
+    "numero_documento": re.compile(_ROTULO.format(r"[^\n:]*?\b(?:N\.?[º°]|N\.?o\.?|N[úu]mero)"), re.MULTILINE),
+}
+_VALOR_TOTAL = re.compile(_ROTULO.format(r"Valor Total"), re.IGNORECASE | re.MULTILINE)
+_TIPO = re.compile(r"\b(fatura|proposta|contrato)\b", re.IGNORECASE)
+_NUMERO = re.compile(r"\d[\d.,]*")
+
+def converter_valor(texto: str) -> Optional[float]:
+    """
+    Valor monetário em float, no formato brasileiro ("R$ 1.200.000,00") ou
+    americano ("R$ 1,200,000.00"): o último separador seguido de 1 ou 2
+    dígitos é o decimal
+    """
+    numero = _NUMERO.search(texto)
+    if numero is None:
+        return None
+    digitos = numero.group().rstrip(".,")
+    separadores = [posicao for posicao, char in enumerate(digitos) if char in ".,"]
+    if separadores and len(digitos) - separadores[-1] - 1 in (1, 2):
+        inteiro, decimal = digitos[:separadores[-1]], digitos[separadores[-1] + 1:]
+    else:
+        inteiro, decimal = digitos, "0"
+    inteiro = inteiro.replace(".", "").replace(",", "")
+    return float(f"{inteiro or 0}.{decimal}")
+
+def extrair_campos(texto: str) -> dict:
+    """Campos encontrados no texto do documento (sem chaves para os ausentes)"""
+    campos = {}
+    for campo, padrao in _PADROES_TEXTO.items():
+        encontrado = padrao.search(texto)
+        if encontrado:
+            campos[campo] = encontrado.group(1)
+
+    valor = _VALOR_TOTAL.search(texto)
+    if valor and (convertido := converter_valor(valor.group(1))) is not None:
+        campos["valor_total"] = convertido
+
+    # O tipo vem da primeira menção no documento (normalmente o título)
+    tipo = _TIPO.search(texto)
+    if tipo:
+        campos["tipo_documento"] = TIPOS_DOCUMENTO[tipo.group(1).lower()]
+    return campos
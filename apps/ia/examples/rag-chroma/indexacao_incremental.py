@@ -0,0 +1,193 @@
+"""
+Indexação incremental dos PDFs no ChromaDB
+
+Um manifesto (JSON) guarda, para cada arquivo indexado, o hash SHA-256 do
+conteúdo, o mtime e o tamanho. A cada execução só os arquivos novos ou
+alterados são lidos e passam pelo embedding, e os chunks dos arquivos
+removidos saem da coleção. O custo é proporcional ao que mudou, não ao
+tamanho do acervo.
+
+- arquivos com mtime e tamanho iguais aos do manifesto não são nem lidos;
+  se só o mtime mudou (ex.: ``touch``), o hash confirma que o conteúdo é o
+  mesmo e nada é reindexado
+- cada chunk leva o caminho relativo do arquivo em ``arquivo_origem``, e é
+  por ele que os chunks antigos são apagados antes da reindexação
+- reindexar um arquivo é idempotente (apaga e insere de novo), então uma
+  execução interrompida é corrigida na próxima
+- a leitura, o chunking e os embeddings dos arquivos a reindexar passam pelo
+  pipeline em streaming de ``ingestao_streaming.py``
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional
+
+from ingestao_streaming import CHAVE_ARQUIVO, ingerir_pdfs
+
+# 2: entradas com os campos extraídos na ingestão (roteador_consultas.py)
+VERSAO_MANIFESTO = 2
+
+# Ids por chamada quando o cliente do Chroma não informa o próprio limite
+LOTE_REMOCAO_PADRAO = 5000
+
+class Alteracoes(NamedTuple):
+    """Caminhos relativos ao diretório de PDFs, por tipo de alteração"""
+    adicionados: List[str]
+    modificados: List[str]
+    removidos: List[str]
+    inalterados: List[str]
+
+    @property
+    def vazia(self) -> bool:
+        return not (self.adicionados or self.modificados or self.removidos)
+
+def hash_arquivo(caminho: str, tamanho_bloco: int = 1 << 20) -> str:
+    """SHA-256 do conteúdo do arquivo, lido em blocos"""
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as arquivo:
+        while bloco := arquivo.read(tamanho_bloco):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+def carregar_manifesto(caminho: str) -> dict:
+    """Manifesto salvo, ou um vazio se não existir (ou for de outra versão)"""
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            manifesto = json.load(arquivo)
+    except FileNotFoundError:
+        manifesto = None
+    if not manifesto or manifesto.get("versao") != VERSAO_MANIFESTO:
+        return {"versao": VERSAO_MANIFESTO, "arquivos": {}}
+    return manifesto
+
+def salvar_manifesto(manifesto: dict, caminho: str) -> None:
+    """Grava o manifesto de forma atômica (arquivo temporário + rename)"""
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(manifesto, arquivo, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(temporario, caminho)
+
+def listar_pdfs(diretorio: str) -> Dict[str, str]:
+    """Caminho relativo (com ``/``) -> caminho completo de cada PDF do diretório"""
+    pdfs = {}
+    for raiz, _, nomes in os.walk(diretorio):
+        for nome in nomes:
+            if nome.lower().endswith(".pdf"):
+                caminho = os.path.join(raiz, nome)
+                pdfs[os.path.relpath(caminho, diretorio).replace(os.sep, "/")] = caminho
+    return pdfs
+
+def detectar_alteracoes(diretorio: str, manifesto: dict) -> Alteracoes:
+    """
+    Compara o diretório com o manifesto. Arquivos só com mtime diferente
+    têm o hash conferido; se o conteúdo é o mesmo, o manifesto é atualizado
+    com o mtime novo e o arquivo conta como inalterado.
+    """
+    conhecidos = manifesto["arquivos"]
+    adicionados, modificados, inalterados = [], [], []
+    pdfs = listar_pdfs(diretorio)
+
+    for relativo, caminho in sorted(pdfs.items()):
+        info = os.stat(caminho)
+        entrada = conhecidos.get(relativo)
+        if entrada is None:
+            adicionados.append(relativo)
+        elif entrada["mtime_ns"] == info.st_mtime_ns and entrada["tamanho"] == info.st_size:
+            inalterados.append(relativo)
+        elif entrada["tamanho"] == info.st_size and entrada["sha256"] == hash_arquivo(caminho):
+            entrada["mtime_ns"] = info.st_mtime_ns
+            inalterados.append(relativo)
+        else:
+            modificados.append(relativo)
+
+    removidos = sorted(relativo for relativo in conhecidos if relativo not in pdfs)
+    return Alteracoes(adicionados, modificados, removidos, inalterados)
+
+def apagar_chunks(chroma_collection, relativo: str) -> None:
+    """Remove da coleção todos os chunks de um arquivo"""
+    chroma_collection.delete(where={CHAVE_ARQUIVO: relativo})
+
+def limpar_colecao(chroma_collection, tamanho_lote: Optional[int] = None) -> int:
+    """
+    Remove todos os chunks da coleção em lotes de no máximo ``tamanho_lote``
+    ids (padrão: o ``max_batch_size`` do cliente), sem carregar todos os ids de
+    uma vez. Retorna o número de chunks removidos
+    """
+    if tamanho_lote is None:
+        tamanho_lote = tamanho_maximo_lote(chroma_collection)
+    removidos = 0
+    while True:
+        ids = chroma_collection.get(include=[], limit=tamanho_lote)["ids"]
+        if not ids:
+            return removidos
+        chroma_collection.delete(ids=ids)
+        removidos += len(ids)
+
+def tamanho_maximo_lote(chroma_collection) -> int:
+    """Máximo de ids aceito pelo cliente do Chroma em uma única chamada"""
+    cliente = getattr(chroma_collection, "_client", None)
+    if cliente is None or not hasattr(cliente, "get_max_batch_size"):
+        return LOTE_REMOCAO_PADRAO
+    return cliente.get_max_batch_size()
+
+def abrir_colecao(db, nome: str, caminho_manifesto: str, modelo_embedding: str):
+    """
+    Coleção do Chroma para o índice. Se o modelo de embedding mudou desde a
+    última indexação, os vetores antigos não servem mais (e podem ter outra
+    dimensão): a coleção é recriada e o manifesto, zerado.
+    """
+    manifesto = carregar_manifesto(caminho_manifesto)
+    modelo_anterior = manifesto.get("modelo_embedding")
+    if manifesto["arquivos"] and modelo_anterior != modelo_embedding:
+        print(f"⚠️ Modelo de embedding mudou ({modelo_anterior} -> {modelo_embedding}). Recriando a coleção '{nome}'...")
+        db.delete_collection(nome)
+        manifesto["arquivos"] = {}
+    manifesto["modelo_embedding"] = modelo_embedding
+    salvar_manifesto(manifesto, caminho_manifesto)
+    return db.get_or_create_collection(nome)
+
+def sincronizar_indice(diretorio: str, chroma_collection, index, caminho_manifesto: str, **opcoes_ingestao) -> Alteracoes:
+    """
+    Atualiza a coleção para refletir o diretório de PDFs
+
+    Args:
+        diretorio: Diretório com os PDFs
+        chroma_collection: Coleção do ChromaDB usada pelo índice
+        index: VectorStoreIndex criado sobre a coleção
+        caminho_manifesto: Arquivo JSON do manifesto
+        **opcoes_ingestao: Repassadas a ``ingerir_pdfs`` (workers, lotes...)
+
+    Returns:
+        As alterações encontradas (e aplicadas)
+    """
+    manifesto = carregar_manifesto(caminho_manifesto)
+
+    # Coleção criada sem manifesto (versão antiga do exemplo): os chunks não têm
+    # arquivo_origem e não dá para apagá-los por arquivo, então recomeça do zero
+    if not manifesto["arquivos"] and chroma_collection.count() > 0:
+        print("⚠️ Coleção sem manifesto de indexação compatível. Reindexando todos os documentos...")
+        limpar_colecao(chroma_collection)
+    # Coleção apagada por fora: o manifesto não vale mais
+    elif manifesto["arquivos"] and chroma_collection.count() == 0:
+        manifesto["arquivos"] = {}
+
+    alteracoes = detectar_alteracoes(diretorio, manifesto)
+    for relativo in alteracoes.removidos:
+        apagar_chunks(chroma_collection, relativo)
+        del manifesto["arquivos"][relativo]
+
+    # Cada arquivo entra no manifesto quando todos os seus chunks foram gravados,
+    # e o manifesto é salvo também em caso de falha: arquivos concluídos não são refeitos
+    ingerir_pdfs(
+        diretorio,
+        alteracoes.modificados + alteracoes.adicionados,
+        index.vector_store,
+        chroma_collection,
+        manifesto,
+        salvar=lambda: salvar_manifesto(manifesto, caminho_manifesto),
+        **opcoes_ingestao
+    )
+
+    return alteracoes
@@ -0,0 +1,209 @@
+"""
+Ingestão paralela em streaming dos PDFs
+
+Substitui o ``SimpleDirectoryReader(...).load_data()`` seguido de
+``VectorStoreIndex.from_documents``, que lê e converte todos os PDFs na
+memória antes de gerar o primeiro embedding.
+
+Pipeline:
+1. extração do texto (pypdf) em um pool de processos, com no máximo
+   ``max_em_andamento`` arquivos em andamento: a leitura só avança quando a
+   etapa seguinte consome os resultados (backpressure)
+2. chunking (``Settings.node_parser``) no processo principal, à medida que
+   cada arquivo fica pronto
+3. embeddings em lotes de ``tamanho_lote`` chunks e gravação de cada lote na
+   coleção do Chroma (``vector_store.add``)
+4. os campos fixos do documento (cliente, valor total...) são extraídos nos
+   workers (``extracao_campos.py``) e gravados nos metadados dos chunks e na
+   entrada do arquivo no manifesto
+5. um arquivo só entra no manifesto depois que todos os seus chunks foram
+   gravados; o manifesto é salvo a cada ``salvar_a_cada`` arquivos, e uma
+   execução interrompida retoma dos arquivos que faltaram
+
+A memória fica limitada pelo texto de ``max_em_andamento`` arquivos mais um
+lote de chunks, qualquer que seja o tamanho do acervo.
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from extracao_campos import extrair_campos
+
+CHAVE_ARQUIVO = "arquivo_origem"
+
+class PdfExtraido(NamedTuple):
+    """Texto de cada página, campos extraídos e a identificação do conteúdo lido"""
+    sha256: str
+    mtime_ns: int
+    tamanho: int
+    paginas: List[str]
+    campos: dict
+
+class ResultadoIngestao(NamedTuple):
+    arquivos: int
+    chunks: int
+    falhas: Dict[str, str]
+
+def extrair_pdf(caminho: str) -> PdfExtraido:
+    """Lê o PDF uma vez: hash do conteúdo, texto por página e campos (executa nos workers)"""
+    from pypdf import PdfReader
+
+    info = os.stat(caminho)
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    paginas = [pagina.extract_text() or "" for pagina in PdfReader(io.BytesIO(dados)).pages]
+    campos = extrair_campos("\n".join(paginas))
+    return PdfExtraido(hashlib.sha256(dados).hexdigest(), info.st_mtime_ns, info.st_size, paginas, campos)
+
+def documentos_do_pdf(relativo: str, extraido: PdfExtraido) -> list:
+    """
+    Um Document por página, com os metadados do SimpleDirectoryReader e os
+    campos do documento (filtráveis no Chroma)
+    """
+    from llama_index.core import Document
+
+    documentos = []
+    for numero, texto in enumerate(extraido.paginas, start=1):
+        documentos.append(Document(
+            text=texto,
+            metadata={
+                "file_name": os.path.basename(relativo),
+                "page_label": str(numero),
+                CHAVE_ARQUIVO: relativo,
+                **extraido.campos
+            },
+            # arquivo_origem só localiza os chunks, e os campos já estão no texto:
+            # ficam fora do embedding (arquivo_origem também fica fora do prompt)
+            excluded_embed_metadata_keys=[CHAVE_ARQUIVO, *extraido.campos],
+            excluded_llm_metadata_keys=[CHAVE_ARQUIVO]
+        ))
+    return documentos
+
+def ingerir_pdfs(
+    diretorio: str,
+    relativos: Iterable[str],
+    vector_store,
+    chroma_collection,
+    manifesto: dict,
+    salvar: Callable[[], None],
+    embed_model=None,
+    node_parser=None,
+    max_workers: Optional[int] = None,
+    max_em_andamento: Optional[int] = None,
+    tamanho_lote: int = 256,
+    salvar_a_cada: int = 50
+) -> ResultadoIngestao:
+    """
+    (Re)indexa os arquivos indicados, em streaming
+
+    Args:
+        diretorio: Diretório dos PDFs
+        relativos: Caminhos relativos a ``diretorio`` a indexar
+        vector_store: ChromaVectorStore onde os chunks são gravados
+        chroma_collection: Coleção do Chroma (para apagar chunks antigos)
+        manifesto: Manifesto da indexação incremental, atualizado por arquivo
+        salvar: Grava o manifesto (chamada periodicamente e ao final)
+        embed_model: Modelo de embeddings (padrão: Settings.embed_model)
+        node_parser: Divisor de chunks (padrão: Settings.node_parser)
+        max_workers: Processos de extração (padrão: número de CPUs)
+        max_em_andamento: Arquivos extraídos ou em extração aguardando o
+            restante do pipeline (padrão: 2 por worker)
+        tamanho_lote: Chunks por chamada de embedding e por gravação
+        salvar_a_cada: Arquivos concluídos entre gravações do manifesto
+
+    Returns:
+        Arquivos e chunks gravados, e as falhas por arquivo (que ficam fora
+        do manifesto e são tentadas de novo na próxima execução)
+    """
+    from llama_index.core import Settings
+    from llama_index.core.schema import MetadataMode
+
+    embed_model = embed_model or Settings.embed_model
+    node_parser = node_parser or Settings.node_parser
+    max_workers = max_workers or os.cpu_count() or 1
+    max_em_andamento = max_em_andamento or 2 * max_workers
+
+    lote = []            # chunks aguardando embedding
+    pendentes = {}       # arquivo -> chunks ainda não gravados
+    entradas = {}        # arquivo -> entrada do manifesto, aplicada ao concluir
+    contagem = {"arquivos": 0, "chunks": 0, "desde_salvar": 0}
+    falhas = {}
+
+    def concluir(relativo: str) -> None:
+        manifesto["arquivos"][relativo] = entradas.pop(relativo)
+        del pendentes[relativo]
+        contagem["arquivos"] += 1
+        contagem["desde_salvar"] += 1
+        if contagem["desde_salvar"] >= salvar_a_cada:
+            salvar()
+            contagem["desde_salvar"] = 0
+
+    def gravar_lote() -> None:
+        textos = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in lote]
+        for node, embedding in zip(lote, embed_model.get_text_embedding_batch(textos)):
+            node.embedding = embedding
+        vector_store.add(lote)
+        contagem["chunks"] += len(lote)
+
+        for node in lote:
+            relativo = node.metadata[CHAVE_ARQUIVO]
+            pendentes[relativo] -= 1
+            if pendentes[relativo] == 0:
+                concluir(relativo)
+        lote.clear()
+
+    def processar(relativo: str, extraido: PdfExtraido) -> None:
+        # Apaga chunks antigos (ou de uma execução interrompida) antes de gravar os novos
+        chroma_collection.delete(where={CHAVE_ARQUIVO: relativo})
+        nodes = node_parser.get_nodes_from_documents(documentos_do_pdf(relativo, extraido))
+        entradas[relativo] = {
+            "sha256": extraido.sha256,
+            "mtime_ns": extraido.mtime_ns,
+            "tamanho": extraido.tamanho,
+            "chunks": len(nodes),
+            "campos": extraido.campos
+        }
+        pendentes[relativo] = len(nodes)
+        if not nodes:
+            concluir(relativo)
+        for node in nodes:
+            lote.append(node)
+            if len(lote) >= tamanho_lote:
+                gravar_lote()
+
+    fila = iter(relativos)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        em_andamento = {}
+        try:
+            while True:
+                # Backpressure: só lê novos arquivos quando há vaga no pipeline
+                while len(em_andamento) < max_em_andamento:
+                    relativo = next(fila, None)
+                    if relativo is None:
+                        break
+                    em_andamento[executor.submit(extrair_pdf, os.path.join(diretorio, relativo))] = relativo
+                if not em_andamento:
+                    break
+
+                prontos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    relativo = em_andamento.pop(futuro)
+                    try:
+                        extraido = futuro.result()
+                    except Exception as e:
+                        falhas[relativo] = str(e)
+                        print(f"⚠️ Falha ao ler {relativo}: {e}")
+                        continue
+                    processar(relativo, extraido)
+
+            if lote:
+                gravar_lote()
+        finally:
+            for futuro in em_andamento:
+                futuro.cancel()
+            salvar()
+
+    return ResultadoIngestao(contagem["arquivos"], contagem["chunks"], falhas)
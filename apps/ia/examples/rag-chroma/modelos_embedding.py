@@ -0,0 +1,79 @@
+"""
+Modelos de embedding para o LlamaIndex (``Settings.embed_model``)
+
+- ``EmbeddingComCache``: envolve qualquer modelo do LlamaIndex com o cache
+  persistente de ``cache_embeddings.py``; cache hits não ocupam espaço nos
+  lotes enviados ao modelo
+- ``EmbeddingDeterministico``: modelo local determinístico, sem rede, para
+  rodar o exemplo e medir o pipeline offline
+"""
+
+from typing import Any, List
+
+from llama_index.core.embeddings import BaseEmbedding
+from pydantic import PrivateAttr
+
+from cache_embeddings import EmbeddingsEmCache, vetores_deterministicos
+
+class EmbeddingDeterministico(BaseEmbedding):
+    """Embedding por hashing (ver ``vetores_deterministicos``)"""
+
+    dimensao: int = 384
+
+    def __init__(self, dimensao: int = 384, **kwargs: Any):
+        super().__init__(model_name=f"deterministico-{dimensao}", dimensao=dimensao, **kwargs)
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return vetores_deterministicos([query], self.dimensao)[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return vetores_deterministicos([text], self.dimensao)[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return vetores_deterministicos(texts, self.dimensao)
+
+class EmbeddingComCache(BaseEmbedding):
+    """
+    Modelo do LlamaIndex com cache persistente de vetores
+
+    Args:
+        base: Modelo real (ex.: OpenAIEmbedding)
+        cache: CacheEmbeddingsSQLite compartilhado por textos e consultas
+        tamanho_lote: Máximo de textos por chamada ao modelo real
+        max_tokens_lote: Máximo de tokens estimados por chamada
+    """
+
+    _base: BaseEmbedding = PrivateAttr()
+    _textos: EmbeddingsEmCache = PrivateAttr()
+    _consultas: EmbeddingsEmCache = PrivateAttr()
+
+    def __init__(self, base: BaseEmbedding, cache, tamanho_lote: int = 256, max_tokens_lote: int = 8000, **kwargs: Any):
+        # Lotes grandes chegam inteiros aqui; o corte em lotes é feito depois do cache
+        super().__init__(model_name=base.model_name, embed_batch_size=2048, **kwargs)
+        self._base = base
+        self._textos = EmbeddingsEmCache(
+            base.get_text_embedding_batch, base.model_name, cache, tamanho_lote, max_tokens_lote
+        )
+        # Alguns modelos usam instruções diferentes para consultas: chave separada
+        self._consultas = EmbeddingsEmCache(
+            lambda consultas: [base.get_query_embedding(consulta) for consulta in consultas],
+            f"{base.model_name}:consulta", cache, tamanho_lote, max_tokens_lote
+        )
+
+    def stats(self) -> dict:
+        return {"textos": self._textos.stats(), "consultas": self._consultas.stats()}
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._consultas.embed([query])[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._textos.embed([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._textos.embed(texts)
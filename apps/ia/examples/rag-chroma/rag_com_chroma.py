@@ -4,7 +4,7 @@ from reportlab.lib.pagesizes import letter
 from typing import List, Optional
 
 # --- LlamaIndex & ChromaDB Imports ---
-from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, StorageContext
+from llama_index.core import Settings, VectorStoreIndex
 from llama_index.vector_stores.chroma import ChromaVectorStore
 from llama_index.llms.openai import OpenAI
 import chromadb
@@ -12,6 +12,12 @@ import chromadb
 # --- Pydantic para Saída Estruturada ---
 from pydantic import BaseModel, Field
 
+from cache_embeddings import CacheEmbeddingsSQLite
+from consultas import MotorConsultas
+from indexacao_incremental import abrir_colecao, carregar_manifesto, sincronizar_indice
+from modelos_embedding import EmbeddingComCache, EmbeddingDeterministico
+from roteador_consultas import IndiceCampos, RoteadorConsultas
+
 # ==============================================================================
 # 1. FUNÇÕES AUXILIARES PARA CRIAR PDFs DE EXEMPLO
 # ==============================================================================
@@ -77,6 +83,8 @@ def main():
     PDF_DIRECTORY = "./documentos_pdf"
     DB_PATH = "./chroma_db"
     COLLECTION_NAME = "documentos_collection"
+    MANIFEST_PATH = os.path.join(DB_PATH, "manifesto_indexacao.json")
+    EMBEDDING_CACHE_PATH = os.path.join(DB_PATH, "cache_embeddings.sqlite")
 
     print("🚀 Iniciando Sistema RAG com ChromaDB")
     print("=" * 50)
@@ -90,55 +98,68 @@ def main():
     # Ele criará o diretório DB_PATH se não existir
     db = chromadb.PersistentClient(path=DB_PATH)
     
+    # Embeddings com cache persistente: textos já vistos não voltam ao modelo.
+    # RAG_EMBEDDINGS_LOCAIS=1 usa um modelo local determinístico (sem rede)
+    modelo_base = EmbeddingDeterministico() if os.getenv("RAG_EMBEDDINGS_LOCAIS") == "1" else Settings.embed_model
+    Settings.embed_model = EmbeddingComCache(modelo_base, CacheEmbeddingsSQLite(EMBEDDING_CACHE_PATH))
+    
     # Passo 3: Obter ou criar a coleção no ChromaDB
-    # Esta é a chave para a persistência!
-    chroma_collection = db.get_or_create_collection(COLLECTION_NAME)
+    # Esta é a chave para a persistência! (recriada se o modelo de embedding mudar)
+    chroma_collection = abrir_colecao(db, COLLECTION_NAME, MANIFEST_PATH, Settings.embed_model.model_name)
 
     # Passo 4: Criar o LlamaIndex VectorStore em cima da coleção do Chroma
     vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
     
-    # --- Lógica de "Save" vs "Load" ---
-    # Verificamos se a coleção já tem documentos.
-    # Se count() for 0, é a primeira vez, então precisamos indexar.
-    if chroma_collection.count() == 0:
-        print("🔄 Coleção vazia. Indexando novos documentos...")
-        
-        # Carregar documentos do diretório
-        documents = SimpleDirectoryReader(PDF_DIRECTORY).load_data()
-        
-        # Criar o StorageContext e o Index
-        storage_context = StorageContext.from_defaults(vector_store=vector_store)
-        index = VectorStoreIndex.from_documents(
-            documents, storage_context=storage_context
-        )
-        print(f"✅ Indexação concluída. {len(documents)} documentos adicionados à coleção '{COLLECTION_NAME}'.")
+    # O índice usa a coleção diretamente (vazia ou não)
+    index = VectorStoreIndex.from_vector_store(vector_store=vector_store)
+    
+    # --- Indexação incremental ---
+    # O manifesto registra hash e mtime de cada PDF: só arquivos novos ou
+    # alterados são reindexados, e os chunks de arquivos removidos são apagados
+    print(f"🔄 Sincronizando '{PDF_DIRECTORY}' com a coleção '{COLLECTION_NAME}'...")
+    alteracoes = sincronizar_indice(PDF_DIRECTORY, chroma_collection, index, MANIFEST_PATH)
+    if alteracoes.vazia:
+        print(f"⚡ Nenhuma alteração. {len(alteracoes.inalterados)} documentos já indexados.")
     else:
-        print(f"⚡ Carregando índice a partir do ChromaDB existente na coleção '{COLLECTION_NAME}'...")
-        # Se a coleção já tem dados, LlamaIndex pode usá-la diretamente
-        index = VectorStoreIndex.from_vector_store(
-            vector_store=vector_store,
+        print(
+            f"✅ Índice atualizado: {len(alteracoes.adicionados)} adicionados, "
+            f"{len(alteracoes.modificados)} modificados, {len(alteracoes.removidos)} removidos, "
+            f"{len(alteracoes.inalterados)} inalterados."
+        )
+        estatisticas = Settings.embed_model.stats()["textos"]
+        print(
+            f"🧮 Cache de embeddings: {estatisticas['acertos']} acertos, {estatisticas['faltas']} calculados "
+            f"em {estatisticas['chamadas_modelo']} chamadas ao modelo."
         )
-        print("✅ Índice carregado com sucesso.")
 
-    # Passo 5: Criar o Query Engine para extrair dados estruturados
-    print("🧠 Configurando Query Engine...")
-    query_engine = index.as_query_engine(
-        output_cls=EntidadeExtraida,
+    # Passo 5: Criar o motor de consultas para extrair dados estruturados
+    # Busca e extração ficam em caches separados: a mesma pergunta sobre o
+    # mesmo contexto não volta ao LLM, e query_batch limita as chamadas simultâneas
+    print("🧠 Configurando Motor de Consultas...")
+    motor = MotorConsultas.do_indice(
+        index,
         llm=OpenAI(model="gpt-4-turbo"), # Modelos fortes são melhores para extração
+        output_cls=EntidadeExtraida,
+        versao_indice=lambda: str(os.stat(MANIFEST_PATH).st_mtime_ns),
+        max_llm_simultaneas=4
     )
+    # Campos fixos (cliente, valor total, status...) foram extraídos na ingestão:
+    # perguntas diretas sobre um documento são respondidas pelo índice, sem LLM
+    roteador = RoteadorConsultas(IndiceCampos.do_manifesto(carregar_manifesto(MANIFEST_PATH)), motor, EntidadeExtraida)
 
-    # Passo 6: Fazer a consulta
-    # A query é projetada para forçar o RAG a olhar os dois documentos
+    # Passo 6: Fazer as consultas, em lote
+    # A primeira query é projetada para forçar o RAG a olhar os dois documentos
     query_str = "Qual o valor total da proposta para a Stark Industries e quem é o cliente da fatura 2025-001?"
+    query_str2 = "Liste todos os clientes mencionados nos documentos e seus respectivos valores."
+    query_str3 = "Qual o valor total da proposta para a Stark Industries?"
     
-    print("\n🔍 Executando Consulta")
+    print("\n🔍 Executando Consultas")
     print("=" * 30)
     print(f"Query: {query_str}")
     
-    response = query_engine.query(query_str)
-    
-    # O resultado já é um objeto Pydantic
-    dados_extraidos = response.response
+    # Os resultados já são objetos Pydantic; as perguntas livres vão em lote para o LLM
+    resposta, resposta2, resposta3 = roteador.responder_lote([query_str, query_str2, query_str3])
+    dados_extraidos, dados_extraidos2 = resposta.resultado, resposta2.resultado
     
     print("\n📊 Dados Estruturados Extraídos (JSON)")
     print("=" * 40)
@@ -148,14 +169,25 @@ def main():
     print("\n🔍 Consulta Adicional: Listar todos os clientes")
     print("=" * 45)
     
-    query_str2 = "Liste todos os clientes mencionados nos documentos e seus respectivos valores."
-    response2 = query_engine.query(query_str2)
-    dados_extraidos2 = response2.response
-    
     print(f"Query: {query_str2}")
     print("\n📊 Resultado:")
     print(dados_extraidos2.model_dump_json(indent=2))
 
+    # Exemplo adicional: Consulta respondida pelos metadados
+    print("\n🔍 Consulta Adicional: Campo conhecido de um documento")
+    print("=" * 45)
+    
+    print(f"Query: {query_str3}")
+    print(f"\n📊 Resultado (via {resposta3.origem}, {resposta3.arquivo}):")
+    print(resposta3.resultado.model_dump_json(indent=2))
+    
+    estatisticas_consultas = motor.stats()
+    print(
+        f"\n🧮 Roteamento: {roteador.stats()} | chamadas ao LLM: {estatisticas_consultas['chamadas_llm']} | "
+        f"cache de extração: {estatisticas_consultas['extracao']['acertos']} acertos, "
+        f"{estatisticas_consultas['extracao']['faltas']} faltas"
+    )
+
     print("\n🎉 Execução concluída com sucesso!")
     print(f"💾 Dados persistidos em: {DB_PATH}")
     print(f"📁 Documentos em: {PDF_DIRECTORY}")
@@ -0,0 +1,203 @@
+"""
+Consultas estruturadas respondidas pelos metadados, sem LLM
+
+Os campos de cada documento já foram extraídos na ingestão
+(``extracao_campos.py``) e estão no manifesto. ``IndiceCampos`` organiza esses
+campos em colunas (uma lista por campo, uma posição por documento) e em um
+dicionário de entidades (cliente, projeto, número do documento -> documentos).
+
+``RoteadorConsultas`` decide, para cada pergunta:
+- pergunta sobre um campo conhecido ("valor total", "cliente", "status") de
+  um único documento identificável por entidade e tipo ("valor total da
+  proposta para a Stark Industries"): responde pelo índice, em microssegundos
+- qualquer outra (listas, comparações, várias entidades, campo ausente):
+  segue para o MotorConsultas (busca + LLM)
+
+Uma pergunta só é estruturada se for inteiramente coberta por nomes de campo,
+entidades, tipos de documento e palavras neutras ("qual", "o", "da"...). Basta
+uma palavra a mais ("Quem assinou...", "...antes do desconto", "...sem
+impostos") para mudar o sentido, e a pergunta vai para o LLM.
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from extracao_campos import TIPOS_DOCUMENTO
+
+CAMPOS = ("nome_cliente", "nome_projeto", "valor_total", "status", "tipo_documento", "numero_documento")
+CAMPOS_ENTIDADE = ("nome_cliente", "nome_projeto", "numero_documento")
+
+# Nome do campo na pergunta (palavras sem acentos) -> campo pedido
+FRASES_CAMPO = {
+    ("valor", "total"): "valor_total",
+    ("valor",): "valor_total",
+    ("preco",): "valor_total",
+    ("cliente",): "nome_cliente",
+    ("status",): "status",
+    ("situacao",): "status",
+    ("projeto",): "nome_projeto",
+    ("tipo",): "tipo_documento",
+}
+_MAIOR_FRASE = max(len(frase) for frase in FRASES_CAMPO)
+# Palavras que não mudam o sentido da pergunta (interrogativas, artigos, preposições)
+PALAVRAS_NEUTRAS = {
+    "qual", "quem", "e", "o", "a", "os", "as", "de", "da", "do", "das", "dos", "para", "pra",
+    "em", "na", "no", "nas", "nos", "ao", "atual", "documento",
+}
+
+def tokens(texto: str) -> List[str]:
+    """Palavras em minúsculas e sem acentos (hífen preservado: "2025-001")"""
+    sem_acentos = unicodedata.normalize("NFKD", texto.casefold())
+    sem_acentos = "".join(char for char in sem_acentos if not unicodedata.combining(char))
+    return re.findall(r"[\w]+(?:-[\w]+)*", sem_acentos)
+
+class IndiceCampos:
+    """
+    Índice colunar dos campos por documento
+
+    Args:
+        linhas: Arquivo -> campos extraídos
+    """
+
+    def __init__(self, linhas: Dict[str, dict]):
+        self.arquivos = sorted(linhas)
+        self.colunas = {campo: [linhas[arquivo].get(campo) for arquivo in self.arquivos] for campo in CAMPOS}
+        self._entidades: Dict[tuple, Set[int]] = {}
+        for campo in CAMPOS_ENTIDADE:
+            for posicao, valor in enumerate(self.colunas[campo]):
+                if valor:
+                    self._entidades.setdefault(tuple(tokens(str(valor))), set()).add(posicao)
+        self._maior_entidade = max((len(chave) for chave in self._entidades), default=0)
+
+    @classmethod
+    def do_manifesto(cls, manifesto: dict) -> "IndiceCampos":
+        return cls({arquivo: entrada.get("campos", {}) for arquivo, entrada in manifesto["arquivos"].items()})
+
+    def __len__(self) -> int:
+        return len(self.arquivos)
+
+    def linha(self, posicao: int) -> dict:
+        return {campo: coluna[posicao] for campo, coluna in self.colunas.items()}
+
+    def entidades_em(self, palavras: Sequence[str]) -> Tuple[List[Set[int]], List[str]]:
+        """
+        Documentos de cada entidade citada, buscando as sequências de palavras
+        da pergunta no dicionário (a mais longa em cada posição), e as
+        palavras que não fazem parte de nenhuma entidade
+        """
+        encontradas, restantes = [], []
+        inicio = 0
+        while inicio < len(palavras):
+            for tamanho in range(min(self._maior_entidade, len(palavras) - inicio), 0, -1):
+                posicoes = self._entidades.get(tuple(palavras[inicio:inicio + tamanho]))
+                if posicoes:
+                    encontradas.append(posicoes)
+                    inicio += tamanho
+                    break
+            else:
+                restantes.append(palavras[inicio])
+                inicio += 1
+        return encontradas, restantes
+
+class Resposta(NamedTuple):
+    resultado: object
+    origem: str                 # "indice" ou "llm"
+    arquivo: Optional[str]
+
+class RoteadorConsultas:
+    """
+    Responde pelo índice quando possível e usa o LLM no restante
+
+    Args:
+        indice: IndiceCampos dos documentos
+        motor: MotorConsultas usado nas perguntas livres
+        output_cls: Modelo Pydantic das respostas (ex.: EntidadeExtraida)
+    """
+
+    def __init__(self, indice: IndiceCampos, motor, output_cls):
+        self.indice = indice
+        self.motor = motor
+        self.output_cls = output_cls
+        self.via_indice = 0
+        self.via_llm = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def interpretar(palavras: Sequence[str]) -> Optional[Tuple[Set[str], Set[str]]]:
+        """
+        Campos e tipos de documento pedidos pelas palavras fora das entidades,
+        ou None se sobrar alguma palavra que não seja campo, tipo ou neutra
+        """
+        pedidos, tipos = set(), set()
+        inicio = 0
+        while inicio < len(palavras):
+            for tamanho in range(min(_MAIOR_FRASE, len(palavras) - inicio), 0, -1):
+                campo = FRASES_CAMPO.get(tuple(palavras[inicio:inicio + tamanho]))
+                if campo:
+                    pedidos.add(campo)
+                    inicio += tamanho
+                    break
+            else:
+                palavra = palavras[inicio]
+                if palavra in TIPOS_DOCUMENTO:
+                    tipos.add(TIPOS_DOCUMENTO[palavra])
+                elif palavra not in PALAVRAS_NEUTRAS:
+                    return None
+                inicio += 1
+        return pedidos, tipos
+
+    def localizar(self, consulta: str) -> Optional[int]:
+        """Posição do documento que responde à pergunta pelo índice, ou None"""
+        entidades, restantes = self.indice.entidades_em(tokens(consulta))
+        interpretacao = self.interpretar(restantes)
+        if not entidades or interpretacao is None:
+            return None
+        pedidos, tipos = interpretacao
+        if not pedidos or len(tipos) > 1:
+            return None
+
+        # Todas as entidades citadas precisam apontar para o mesmo documento
+        candidatos = set.intersection(*entidades)
+        if tipos:
+            coluna_tipo = self.indice.colunas["tipo_documento"]
+            candidatos = {posicao for posicao in candidatos if coluna_tipo[posicao] in tipos}
+        if len(candidatos) != 1:
+            return None
+
+        posicao = candidatos.pop()
+        if any(self.indice.colunas[campo][posicao] is None for campo in pedidos):
+            return None
+        return posicao
+
+    def responder(self, consulta: str) -> Resposta:
+        return self.responder_lote([consulta])[0]
+
+    def responder_lote(self, consultas: Sequence[str]) -> List[Resposta]:
+        """Respostas na ordem de ``consultas``; as livres vão juntas para ``motor.query_batch``"""
+        respostas: List[Optional[Resposta]] = []
+        livres = []
+        for consulta in consultas:
+            posicao = self.localizar(consulta)
+            if posicao is None:
+                livres.append(len(respostas))
+                respostas.append(None)
+            else:
+                linha = self.indice.linha(posicao)
+                resultado = self.output_cls(**{campo: linha.get(campo) for campo in self.output_cls.model_fields})
+                respostas.append(Resposta(resultado, "indice", self.indice.arquivos[posicao]))
+
+        if livres:
+            resultados = self.motor.query_batch([consultas[posicao] for posicao in livres])
+            for posicao, resultado in zip(livres, resultados):
+                respostas[posicao] = Resposta(resultado, "llm", None)
+
+        with self._lock:
+            self.via_llm += len(livres)
+            self.via_indice += len(consultas) - len(livres)
+        return respostas
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"via_indice": self.via_indice, "via_llm": self.via_llm}
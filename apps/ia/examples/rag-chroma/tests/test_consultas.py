@@ -0,0 +1,54 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from cache_embeddings import vetores_deterministicos
+from consultas import ExtratorFalso, MotorConsultas
+
+class Entidade(BaseModel):
+    nome_cliente: Optional[str]
+
+def novo_motor(chamadas: dict) -> MotorConsultas:
+    def embed_consulta(consulta):
+        chamadas["embed"] = chamadas.get("embed", 0) + 1
+        return vetores_deterministicos([consulta])[0]
+
+    def recuperar(consulta, embedding):
+        chamadas["recuperar"] = chamadas.get("recuperar", 0) + 1
+        return []
+
+    extrator = ExtratorFalso(Entidade)
+    return MotorConsultas(recuperar, extrator, embed_consulta, modelo=extrator.modelo)
+
+def test_consultas_repetidas_no_lote_executam_uma_vez():
+    chamadas = {}
+    motor = novo_motor(chamadas)
+    consultas = ["Quem é o cliente?", "quem é  o CLIENTE?", "Qual o valor?", "Quem é o cliente?"]
+
+    resultados = motor.query_batch(consultas)
+
+    assert len(resultados) == len(consultas)
+    assert resultados[0] is resultados[1] is resultados[3]
+    assert chamadas == {"embed": 2, "recuperar": 2}
+    assert motor.stats()["chamadas_llm"] == 2
+
+def test_lote_seguinte_usa_os_caches():
+    chamadas = {}
+    motor = novo_motor(chamadas)
+    motor.query_batch(["Quem é o cliente?"])
+    motor.query_batch(["Quem é o cliente?", "Quem é o cliente?"])
+
+    assert chamadas == {"embed": 2, "recuperar": 1}
+    assert motor.stats()["chamadas_llm"] == 1
+
+def test_query_batch_dentro_de_um_loop_aponta_para_aquery_batch():
+    motor = novo_motor({})
+
+    async def dentro_do_loop():
+        with pytest.raises(RuntimeError, match="aquery_batch"):
+            motor.query_batch(["Quem é o cliente?"])
+        return await motor.aquery_batch(["Quem é o cliente?"])
+
+    assert len(asyncio.run(dentro_do_loop())) == 1
@@ -0,0 +1,35 @@
+import pytest
+
+from extracao_campos import converter_valor, extrair_campos
+
+FATURA = """Fatura Nº: 2025-001
+Cliente: Wayne Enterprises
+Valor Total: R$ 35.000,00
+Status: Pago
+"""
+
+def test_extrai_os_campos_da_fatura():
+    assert extrair_campos(FATURA) == {
+        "numero_documento": "2025-001",
+        "nome_cliente": "Wayne Enterprises",
+        "valor_total": 35000.0,
+        "status": "Pago",
+        "tipo_documento": "fatura",
+    }
+
+@pytest.mark.parametrize("rotulo", ["Fatura Nº", "Contrato N°", "Proposta No.", "Fatura N.º", "Número", "Numero"])
+def test_rotulos_de_numero(rotulo):
+    assert extrair_campos(f"{rotulo}: 2025-001")["numero_documento"] == "2025-001"
+
+@pytest.mark.parametrize("texto", ["Plano: Premium", "Ano: 2024", "Termo: 12 meses", "Nome: Bruce"])
+def test_rotulos_terminados_em_no_nao_sao_numero(texto):
+    assert "numero_documento" not in extrair_campos(f"Proposta\n{texto}\n")
+
+@pytest.mark.parametrize("texto, valor", [
+    ("R$ 1.200.000,00", 1200000.0),
+    ("R$ 1,200,000.00", 1200000.0),
+    ("R$ 1.200", 1200.0),
+    ("sem valor", None),
+])
+def test_converter_valor(texto, valor):
+    assert converter_valor(texto) == valor
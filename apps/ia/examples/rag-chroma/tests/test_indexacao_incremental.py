@@ -0,0 +1,29 @@
+from indexacao_incremental import limpar_colecao
+
+class ColecaoFalsa:
+    def __init__(self, total: int, max_batch_size: int):
+        self.ids = [f"chunk-{i}" for i in range(total)]
+        self.max_batch_size = max_batch_size
+        self.chamadas = []
+        self._client = self
+
+    def get_max_batch_size(self) -> int:
+        return self.max_batch_size
+
+    def get(self, include, limit=None):
+        ids = self.ids[:limit]
+        assert len(ids) <= self.max_batch_size
+        return {"ids": ids}
+
+    def delete(self, ids):
+        assert len(ids) <= self.max_batch_size
+        self.chamadas.append(len(ids))
+        removidos = set(ids)
+        self.ids = [i for i in self.ids if i not in removidos]
+
+def test_limpar_colecao_apaga_em_lotes():
+    colecao = ColecaoFalsa(total=25, max_batch_size=10)
+
+    assert limpar_colecao(colecao) == 25
+    assert colecao.ids == []
+    assert colecao.chamadas == [10, 10, 5]
@@ -0,0 +1,82 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from roteador_consultas import IndiceCampos, RoteadorConsultas
+
+LINHAS = {
+    "proposta_phoenix.pdf": {
+        "nome_cliente": "Stark Industries",
+        "nome_projeto": "Phoenix",
+        "valor_total": 1200000.0,
+        "status": "Pendente",
+        "tipo_documento": "proposta",
+    },
+    "fatura_2025_001.pdf": {
+        "nome_cliente": "Wayne Enterprises",
+        "valor_total": 35000.0,
+        "status": "Pago",
+        "tipo_documento": "fatura",
+        "numero_documento": "2025-001",
+    },
+    "contrato_stark.pdf": {
+        "nome_cliente": "Stark Industries",
+        "tipo_documento": "contrato",
+    },
+}
+
+class Entidade(BaseModel):
+    nome_cliente: Optional[str]
+    valor_total: Optional[float]
+    status: Optional[str]
+
+class MotorFalso:
+    def __init__(self):
+        self.consultas = []
+
+    def query_batch(self, consultas):
+        self.consultas.extend(consultas)
+        return [None] * len(consultas)
+
+@pytest.fixture
+def roteador():
+    return RoteadorConsultas(IndiceCampos(LINHAS), MotorFalso(), Entidade)
+
+@pytest.mark.parametrize("consulta, arquivo", [
+    ("Qual o valor total da proposta para a Stark Industries?", "proposta_phoenix.pdf"),
+    ("Qual o status da fatura 2025-001?", "fatura_2025_001.pdf"),
+    ("Quem é o cliente da fatura 2025-001?", "fatura_2025_001.pdf"),
+    ("Qual o valor do projeto Phoenix?", "proposta_phoenix.pdf"),
+    ("Situação atual da Fatura Nº 2025-001", "fatura_2025_001.pdf"),
+])
+def test_perguntas_estruturadas_vao_para_o_indice(roteador, consulta, arquivo):
+    assert roteador.indice.arquivos[roteador.localizar(consulta)] == arquivo
+
+@pytest.mark.parametrize("consulta", [
+    # palavras fora de campo/entidade/tipo mudam o sentido da pergunta
+    "Quem assinou a proposta Phoenix?",
+    "Qual o valor total da proposta para a Stark Industries antes do desconto?",
+    "Qual o valor total da fatura 2025-001 sem impostos?",
+    "Quanto a Wayne Enterprises pagou na fatura 2025-001?",
+    "Liste todos os clientes mencionados nos documentos",
+    # sem campo pedido, sem entidade, ou ambígua
+    "Fatura 2025-001",
+    "Qual o valor total da proposta?",
+    "Qual o status da Stark Industries?",
+    # entidades de documentos diferentes
+    "Qual o valor total da proposta para a Stark Industries e quem é o cliente da fatura 2025-001?",
+    # campo ausente no documento
+    "Qual o valor total do contrato da Stark Industries?",
+])
+def test_perguntas_livres_vao_para_o_llm(roteador, consulta):
+    assert roteador.localizar(consulta) is None
+
+def test_responder_lote_mantem_a_ordem(roteador):
+    consultas = ["Quem assinou a proposta Phoenix?", "Qual o status da fatura 2025-001?"]
+    livre, estruturada = roteador.responder_lote(consultas)
+
+    assert (livre.origem, estruturada.origem) == ("llm", "indice")
+    assert estruturada.resultado.status == "Pago"
+    assert roteador.motor.consultas == consultas[:1]
+    assert roteador.stats() == {"via_indice": 1, "via_llm": 1}
@@ -6,7 +6,8 @@ Baseado na estratégia definida nos documentos do projeto.
 """
 
 from task_generator_agent import TaskGeneratorAgent
-import json
+from telemetry import ConsoleSink, Telemetry
+import serialization
 from datetime import datetime
 
 def exemplo_viagem_japao():
@@ -15,8 +16,8 @@ def exemplo_viagem_japao():
     print("🗾 EXEMPLO: PLANEJAMENTO DE VIAGEM PARA O JAPÃO")
     print("=" * 60)
     
-    # Inicializa o agente
-    agent = TaskGeneratorAgent()
+    # Inicializa o agente (spans de cada etapa exibidos no console)
+    agent = TaskGeneratorAgent(telemetry=Telemetry([ConsoleSink()]))
     
     # Goal específico para viagem ao Japão
     goal = "Planejar uma viagem para o Japão de 2 semanas visitando Tóquio, Kyoto e Osaka"
@@ -26,6 +27,7 @@ def exemplo_viagem_japao():
     
     # Gera as tarefas
     resultado = agent.generate_tasks(goal)
+    agent.telemetry.flush()
     
     if "error" in resultado:
         print(f"❌ Erro: {resultado['error']}")
@@ -79,7 +81,7 @@ def exemplo_viagem_japao():
     # Exibe JSON estruturado completo
     print("\n📄 JSON ESTRUTURADO COMPLETO:")
     print("─" * 40)
-    print(json.dumps(resultado, ensure_ascii=False, indent=2))
+    print(serialization.dumps(resultado, pretty=True))
     
     # Exibe estatísticas
     print(f"\n📊 ESTATÍSTICAS DO PLANEJAMENTO:")
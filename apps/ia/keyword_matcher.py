@@ -0,0 +1,164 @@
+"""
+Matcher de palavras-chave pré-compilado
+
+Agrupa todas as tabelas de palavras-chave em uma única expressão regular
+construída a partir de uma trie, de modo que um texto é percorrido uma única
+vez para descobrir todos os grupos atingidos e o rótulo de maior prioridade.
+
+A comparação é feita sobre o texto normalizado (sem acentos e em casefold),
+então "japao", "Japão" e "JAPÃO" são equivalentes. A semântica é de substring,
+igual ao ``keyword in texto`` que ela substitui.
+
+Quando o pacote opcional ``pyahocorasick`` está instalado, a varredura usa um
+autômato Aho-Corasick em C; caso contrário, usa a regex em trie do ``re``.
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - dependência opcional
+    ahocorasick = None
+
+# Marcas diacríticas combinantes que sobram após a decomposição NFKD
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+def normalize_text(text: str) -> str:
+    """Remove acentos e aplica casefold para comparação de palavras-chave"""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    # Caminho rápido para texto latino: cada caractere acentuado se decompõe em
+    # exatamente uma letra ASCII + marcas, então o tamanho se preserva
+    stripped = decomposed.encode("ascii", "ignore")
+    if len(stripped) == len(text):
+        return stripped.decode("ascii").lower()
+    return _COMBINING_MARKS.sub("", decomposed).casefold()
+
+class KeywordMatch(NamedTuple):
+    """Resultado de uma varredura: grupos atingidos e rótulo prioritário"""
+    groups: FrozenSet[str]
+    label: Optional[str]
+
+_NO_MATCH = KeywordMatch(frozenset(), None)
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Monta um padrão regex em forma de trie (prefixos comuns compartilhados)"""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Palavra que termina aqui e continua em outra: a continuação é opcional
+        # e gulosa, então cada posição captura a palavra mais longa
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """
+    Índice de palavras-chave com varredura linear única.
+
+    - Grupos: conjuntos de palavras (ex.: "clarity_strong"); ``match`` informa
+      todos os grupos com pelo menos uma palavra presente no texto.
+    - Rótulos ranqueados: palavra -> rótulo, onde vence a palavra registrada
+      primeiro (ex.: "viagem" -> "planejamento_viagem").
+
+    As tabelas podem ser estendidas em tempo de execução; o padrão é
+    recompilado sob demanda na próxima varredura.
+    """
+
+    def __init__(self, groups: Optional[Dict[str, Iterable[str]]] = None):
+        self._groups: Dict[str, set] = {}
+        self._ranked: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._compiled = None
+
+        for group, keywords in (groups or {}).items():
+            self.add_keywords(group, keywords)
+
+    def add_keywords(self, group: str, keywords: Iterable[str]) -> None:
+        """Adiciona palavras-chave a um grupo (criando o grupo se necessário)"""
+        with self._lock:
+            self._groups.setdefault(group, set()).update(normalize_text(k) for k in keywords)
+            self._compiled = None
+
+    def add_ranked(self, keyword: str, label: str) -> None:
+        """Associa uma palavra a um rótulo, com prioridade menor que as anteriores"""
+        with self._lock:
+            self._ranked.append((normalize_text(keyword), label))
+            self._compiled = None
+
+    def match(self, text: str) -> KeywordMatch:
+        """Percorre o texto uma única vez e retorna grupos e rótulo detectados"""
+        scanner, labels = self._compiled or self._compile()
+        if scanner is None:
+            return _NO_MATCH
+
+        groups: set = set()
+        best_rank = None
+        for keyword_groups, rank in scanner(normalize_text(text)):
+            groups |= keyword_groups
+            if rank is not None and (best_rank is None or rank < best_rank):
+                best_rank = rank
+
+        label = labels[best_rank] if best_rank is not None else None
+        return KeywordMatch(frozenset(groups), label)
+
+    def _compile(self):
+        """Gera o scanner (texto -> iterável de (grupos, rank)) e a lista de rótulos"""
+        with self._lock:
+            if self._compiled is not None:
+                return self._compiled
+
+            entries: Dict[str, Tuple[set, Optional[int]]] = {}
+            for group, keywords in self._groups.items():
+                for keyword in keywords:
+                    entries.setdefault(keyword, (set(), None))[0].add(group)
+            for rank, (keyword, _) in enumerate(self._ranked):
+                keyword_groups, current = entries.get(keyword, (set(), None))
+                entries[keyword] = (keyword_groups, rank if current is None else current)
+            entries.pop("", None)
+
+            labels = [label for _, label in self._ranked]
+            if not entries:
+                self._compiled = (None, labels)
+                return self._compiled
+
+            if ahocorasick is not None:
+                # O autômato reporta todas as ocorrências, inclusive sobrepostas
+                automaton = ahocorasick.Automaton()
+                for keyword, (keyword_groups, rank) in entries.items():
+                    automaton.add_word(keyword, (frozenset(keyword_groups), rank))
+                automaton.make_automaton()
+                self._compiled = (lambda text: (value for _, value in automaton.iter(text)), labels)
+                return self._compiled
+
+            # O regex captura só a palavra mais longa em cada posição; as palavras
+            # que são prefixo dela também estão presentes e entram no resultado
+            table = {}
+            for keyword in entries:
+                keyword_groups: set = set()
+                best_rank = None
+                for prefix in (keyword[:i] for i in range(1, len(keyword) + 1)):
+                    if prefix in entries:
+                        prefix_groups, rank = entries[prefix]
+                        keyword_groups |= prefix_groups
+                        if rank is not None and (best_rank is None or rank < best_rank):
+                            best_rank = rank
+                table[keyword] = (frozenset(keyword_groups), best_rank)
+
+            # Lookahead permite casamentos sobrepostos em posições vizinhas
+            pattern = re.compile("(?=(" + _trie_pattern(entries) + "))")
+            self._compiled = (lambda text: (table[found.group(1)] for found in pattern.finditer(text)), labels)
+            return self._compiled
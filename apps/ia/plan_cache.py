@@ -0,0 +1,257 @@
+"""
+Cache de resultados do pipeline de geração de tarefas
+
+O pipeline é determinístico para um mesmo goal (exceto ids e timestamp), então
+a análise de intenção e os passos gerados podem ser reaproveitados. A chave é
+o hash do goal normalizado junto com a versão do pipeline; a cada acerto o
+agente gera o JSON final de novo, com ids e ``created_at`` novos.
+
+Backends:
+- MemoryPlanCache: LRU em memória com TTL e limite de bytes
+- SQLitePlanCache: mesmo contrato, persistido em um arquivo SQLite local
+
+Os dois guardam a entrada serializada e ``get`` devolve sempre uma cópia nova:
+quem altera um resultado (ou o valor guardado depois do ``put``) não muda os
+acertos seguintes.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import serialization
+
+def normalize_goal(goal: str) -> str:
+    """Normaliza espaços e caixa (as regras do pipeline ignoram caixa)"""
+    return " ".join(goal.split()).casefold()
+
+def plan_cache_key(goal: str, pipeline_version: str) -> str:
+    """Chave de conteúdo: sha256 da versão do pipeline + goal normalizado"""
+    payload = f"{pipeline_version}\x00{normalize_goal(goal)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+class PlanCache:
+    """Contrato comum dos backends de cache, com contadores de acerto/erro"""
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Cópia independente do valor guardado, ou None"""
+        raise NotImplementedError
+
+    def put(self, key: str, value: dict) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """Contadores de uso do cache"""
+        entries = len(self)
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": entries,
+            }
+
+    def _count(self, hit: bool = False, miss: bool = False, evicted: int = 0, expired: int = 0):
+        with self._stats_lock:
+            self.hits += hit
+            self.misses += miss
+            self.evictions += evicted
+            self.expirations += expired
+
+class MemoryPlanCache(PlanCache):
+    """Cache LRU em memória, com TTL opcional e limite de entradas e de bytes"""
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None
+    ):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._count(miss=True)
+                return None
+
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.current_bytes -= size
+                self._count(miss=True, expired=1)
+                return None
+
+            self._entries.move_to_end(key)
+            self._count(hit=True)
+        return serialization.loads(value)
+
+    def put(self, key: str, value: dict) -> None:
+        # Guarda o JSON (UTF-8), não o dict: o tamanho é exato e nada é compartilhado
+        encoded = serialization.dumps_bytes(value)
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+
+            self._entries[key] = (encoded, size, expires_at)
+            self.current_bytes += size
+
+            evicted = 0
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                evicted += 1
+            if evicted:
+                self._count(evicted=evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SQLitePlanCache(PlanCache):
+    """
+    Cache persistido em SQLite, compartilhável entre processos na mesma máquina.
+
+    A ordem LRU é mantida pela coluna ``last_access``; o limite de bytes e de
+    entradas é aplicado após cada escrita.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None
+    ):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS plan_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS plan_cache_lru ON plan_cache (last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM plan_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count(miss=True)
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM plan_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._count(miss=True, expired=1)
+                return None
+
+            self._conn.execute("UPDATE plan_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        self._count(hit=True)
+        return serialization.loads(value)
+
+    def put(self, key: str, value: dict) -> None:
+        encoded = serialization.dumps_bytes(value)
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plan_cache (key, value, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, encoded.decode("utf-8"), size, expires_at, now)
+            )
+            evicted = self._evict()
+            self._conn.commit()
+        if evicted:
+            self._count(evicted=evicted)
+
+    def _evict(self) -> int:
+        """Remove as entradas menos usadas até respeitar os limites"""
+        count, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM plan_cache"
+        ).fetchone()
+        evicted = 0
+        while count > self.max_entries or total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, size FROM plan_cache ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM plan_cache WHERE key = ?", (row[0],))
+            count -= 1
+            total_bytes -= row[1]
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM plan_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM plan_cache").fetchone()[0]
@@ -0,0 +1,109 @@
+"""
+Diff e patch de planos estruturados no formato JSON Patch (RFC 6902)
+
+``diff(antigo, novo)`` produz a lista de operações que transforma um plano no
+outro; ``apply_patch(antigo, ops)`` reconstrói o novo plano. Usado por
+``TaskGeneratorAgent.update_tasks`` para devolver só o que mudou quando um goal
+é editado.
+
+Regras do diff:
+- dicts: chaves removidas (``remove``), novas (``add``) e alteradas (recursivo)
+- listas: comparação posição a posição no trecho comum; sobras no fim viram
+  ``remove`` (do último para o primeiro) ou ``add`` (anexadas com ``/-``).
+  Objetos com ``id`` diferente na mesma posição (outra tarefa) são trocados
+  inteiros, em vez de campo a campo
+- demais valores: ``replace`` quando diferentes
+"""
+
+import copy
+from typing import Any, List
+
+def _escape(token) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+def diff(old: Any, new: Any, path: str = "") -> List[dict]:
+    """Operações JSON Patch que transformam ``old`` em ``new``"""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            before, after = old[index], new[index]
+            if before == after:
+                continue
+            if isinstance(before, dict) and isinstance(after, dict) and before.get("id") != after.get("id"):
+                ops.append({"op": "replace", "path": f"{path}/{index}", "value": after})
+            else:
+                ops.extend(diff(before, after, f"{path}/{index}"))
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        for value in new[common:]:
+            ops.append({"op": "add", "path": f"{path}/-", "value": value})
+        return ops
+
+    return [] if old == new else [{"op": "replace", "path": path, "value": new}]
+
+def apply_patch(document: Any, ops: List[dict]) -> Any:
+    """
+    Aplica as operações (add, remove, replace) a uma cópia de ``document``.
+
+    Raises:
+        ValueError: Operação não suportada ou caminho inexistente
+    """
+    document = copy.deepcopy(document)
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            if op["op"] != "replace":
+                raise ValueError(f"Operação {op['op']!r} na raiz não suportada")
+            document = copy.deepcopy(op["value"])
+            continue
+
+        parent = document
+        try:
+            for token in tokens[:-1]:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+            last = tokens[-1]
+            if isinstance(parent, list):
+                if op["op"] == "add":
+                    value = copy.deepcopy(op["value"])
+                    if last == "-":
+                        parent.append(value)
+                    else:
+                        parent.insert(int(last), value)
+                elif op["op"] == "remove":
+                    del parent[int(last)]
+                elif op["op"] == "replace":
+                    parent[int(last)] = copy.deepcopy(op["value"])
+                else:
+                    raise ValueError(f"Operação não suportada: {op['op']!r}")
+            else:
+                if op["op"] in ("add", "replace"):
+                    if op["op"] == "replace" and last not in parent:
+                        raise KeyError(last)
+                    parent[last] = copy.deepcopy(op["value"])
+                elif op["op"] == "remove":
+                    del parent[last]
+                else:
+                    raise ValueError(f"Operação não suportada: {op['op']!r}")
+        except (KeyError, IndexError, TypeError) as error:
+            raise ValueError(f"Caminho inválido em {op['path']!r}: {error}") from None
+    return document
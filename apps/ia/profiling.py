@@ -0,0 +1,199 @@
+"""
+Profiling por nó do grafo do agente
+
+Mede, para cada nó em cada execução, o tempo de parede, o tempo de CPU da
+thread e o pico de memória alocada (tracemalloc). O que sobra do tempo total
+de ``graph.invoke`` além da soma dos nós é atribuído ao pseudo-nó
+``langgraph_overhead``: agendamento, merge de estado pelos reducers (ex.: o
+``operator.add`` de ``messages``) e checkpoints.
+
+As amostras são agregadas em percentis (p50/p95/p99) e podem ser exportadas
+em JSON ou no formato de pilhas colapsadas (``flamegraph.pl``, speedscope).
+
+Observações:
+- tracemalloc deixa a execução mais lenta; use ``trace_memory=False`` para
+  medir só tempos
+- o pico de memória é global ao processo, então execuções concorrentes
+  contaminam as medições umas das outras; o mesmo vale para os tempos de
+  execuções intercaladas no mesmo event loop
+"""
+
+import contextvars
+import json
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+OVERHEAD_NODE = "langgraph_overhead"
+
+METRICS = ("wall_ms", "cpu_ms", "peak_kib")
+
+# Tempos dos nós da execução corrente (compartilhado com as tasks/threads
+# filhas, que herdam uma cópia do contexto apontando para a mesma lista)
+_current_run: contextvars.ContextVar = contextvars.ContextVar("profiler_current_run", default=None)
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Percentil por ranking mais próximo"""
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+class NodeProfiler:
+    """
+    Coleta amostras por nó e as agrega em histogramas.
+
+    Args:
+        trace_memory: Mede o pico de alocação com tracemalloc
+        max_samples: Amostras mantidas por nó e métrica (as mais recentes)
+        root_name: Raiz das pilhas no formato colapsado
+    """
+
+    def __init__(self, trace_memory: bool = True, max_samples: int = 10_000, root_name: str = "graph.invoke"):
+        self.trace_memory = trace_memory
+        self.root_name = root_name
+        self.runs = 0
+        self._samples: Dict[str, Dict[str, deque]] = defaultdict(
+            lambda: {metric: deque(maxlen=max_samples) for metric in METRICS}
+        )
+        self._order: List[str] = []
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def run(self):
+        """Mede uma execução completa do grafo e calcula o overhead do framework"""
+        self._ensure_tracemalloc()
+        node_times: List[tuple] = []
+        token = _current_run.set(node_times)
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall = (time.perf_counter() - wall_start) * 1000
+            cpu = (time.thread_time() - cpu_start) * 1000
+            _current_run.reset(token)
+
+            # Em execuções assíncronas os nós podem rodar em outras threads;
+            # o CPU da thread chamadora não os inclui, então o overhead de CPU
+            # não é descontado abaixo de zero
+            nodes_wall = sum(node_wall for node_wall, _ in node_times)
+            nodes_cpu = sum(node_cpu for _, node_cpu in node_times)
+            self._record(OVERHEAD_NODE, max(0.0, wall - nodes_wall), max(0.0, cpu - nodes_cpu), None)
+            with self._lock:
+                self.runs += 1
+
+    @contextmanager
+    def node(self, name: str):
+        """Mede um nó; chamado pelo wrapper dos nós em create_task_generator_graph"""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall = (time.perf_counter() - wall_start) * 1000
+            cpu = (time.thread_time() - cpu_start) * 1000
+            peak = None
+            if tracing:
+                _, peak_bytes = tracemalloc.get_traced_memory()
+                peak = max(0, peak_bytes - baseline) / 1024
+
+            node_times = _current_run.get()
+            if node_times is not None:
+                node_times.append((wall, cpu))
+            self._record(name, wall, cpu, peak)
+
+    def summary(self) -> dict:
+        """Percentis por nó e métrica: {nó: {métrica: {count, mean, p50, p95, p99, max}}}"""
+        with self._lock:
+            snapshot = {node: {m: sorted(v) for m, v in self._samples[node].items()} for node in self._order}
+            runs = self.runs
+
+        nodes = {}
+        for node, metrics in snapshot.items():
+            nodes[node] = {}
+            for metric, values in metrics.items():
+                if not values:
+                    continue
+                nodes[node][metric] = {
+                    "count": len(values),
+                    "mean": sum(values) / len(values),
+                    "p50": _percentile(values, 0.50),
+                    "p95": _percentile(values, 0.95),
+                    "p99": _percentile(values, 0.99),
+                    "max": values[-1],
+                }
+        return {"runs": runs, "nodes": nodes}
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Exporta o resumo em JSON (e grava em ``path``, se informado)"""
+        data = json.dumps(self.summary(), ensure_ascii=False, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        return data
+
+    def to_collapsed(self, path: Optional[str] = None) -> str:
+        """
+        Exporta pilhas colapsadas (``raiz;nó peso``), com o peso igual ao tempo
+        de parede total do nó em microssegundos
+        """
+        with self._lock:
+            totals = {node: sum(self._samples[node]["wall_ms"]) for node in self._order}
+        data = "".join(
+            f"{self.root_name};{node} {round(total * 1000)}\n" for node, total in totals.items() if total > 0
+        )
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        return data
+
+    def export_samples(self) -> dict:
+        """Amostras brutas ``{"runs": n, "nodes": {nó: {métrica: [valores]}}}``"""
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "nodes": {node: {m: list(v) for m, v in self._samples[node].items()} for node in self._order},
+            }
+
+    def merge(self, exported: dict) -> None:
+        """Acrescenta amostras de ``export_samples`` de outro profiler (ex.: workers de processo)"""
+        with self._lock:
+            for node, metrics in exported["nodes"].items():
+                if node not in self._samples:
+                    self._order.append(node)
+                for metric, values in metrics.items():
+                    self._samples[node][metric].extend(values)
+            self.runs += exported["runs"]
+
+    def reset(self) -> None:
+        """Descarta as amostras coletadas"""
+        with self._lock:
+            self._samples.clear()
+            self._order.clear()
+            self.runs = 0
+
+    def close(self) -> None:
+        """Para o tracemalloc, se foi iniciado por este profiler"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _ensure_tracemalloc(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def _record(self, node: str, wall: float, cpu: float, peak: Optional[float]) -> None:
+        with self._lock:
+            if node not in self._samples:
+                self._order.append(node)
+            samples = self._samples[node]
+            samples["wall_ms"].append(wall)
+            samples["cpu_ms"].append(cpu)
+            if peak is not None:
+                samples["peak_kib"].append(peak)
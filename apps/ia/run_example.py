@@ -5,8 +5,9 @@ Execute este arquivo para ver o agente em ação!
 """
 
 import sys
-import json
+import serialization
 from task_generator_agent import TaskGeneratorAgent
+from telemetry import ConsoleSink, Telemetry
 
 def main():
     """Execução principal com exemplo interativo"""
@@ -19,7 +20,7 @@ def main():
     
     # Inicializa o agente
     try:
-        agent = TaskGeneratorAgent()
+        agent = TaskGeneratorAgent(telemetry=Telemetry([ConsoleSink()]))
         print("✅ Agente inicializado com sucesso!")
     except Exception as e:
         print(f"❌ Erro ao inicializar agente: {e}")
@@ -36,6 +37,7 @@ def main():
     try:
         # Executa o agente
         resultado = agent.generate_tasks(goal_exemplo)
+        agent.telemetry.flush()
         
         if "error" in resultado:
             print(f"❌ Erro durante execução: {resultado['error']}")
@@ -71,10 +73,9 @@ def main():
         
         # Salva resultado em arquivo para análise
         output_file = "resultado_exemplo.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        size = serialization.dump(resultado, output_file)
         
-        print(f"\n💾 Resultado completo salvo em: {output_file}")
+        print(f"\n💾 Resultado completo salvo em: {output_file} ({size} bytes, {serialization.get_serializer().name})")
         
         # Estatísticas técnicas
         print(f"\n🔧 ESTATÍSTICAS TÉCNICAS:")
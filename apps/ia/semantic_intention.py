@@ -0,0 +1,251 @@
+"""
+Detecção semântica de intenção com índice local de embeddings
+
+Complementa as palavras-chave de INTENTION_KEYWORDS: quando nenhuma palavra
+casa, o goal é comparado (similaridade de cosseno) com frases de exemplo de
+cada intenção, declaradas em ``exemplars`` nos arquivos de ``templates/``.
+
+- Embeddings locais, só CPU: ``SentenceTransformerEmbedder`` usa um modelo
+  local do ``sentence-transformers`` (ex.:
+  ``paraphrase-multilingual-MiniLM-L12-v2``, via TASK_AGENT_EMBEDDING_MODEL);
+  ``HashingEmbedder`` (n-gramas de caracteres e palavras em um vetor de
+  tamanho fixo, sem download) só reconhece flexões das palavras dos exemplos
+  e precisa ser escolhido explicitamente
+- índice: matriz NumPy normalizada com todos os exemplos; uma consulta é um
+  produto matriz-vetor (busca exata, suficiente para milhares de exemplos)
+- resultado: top-k intenções (melhor exemplo de cada) e limiar de confiança,
+  calibrado por embedder (``default_threshold``); abaixo do limiar, o goal
+  fica sem intenção (``geral``)
+- cache LRU por goal normalizado: goals repetidos não recalculam embeddings
+
+O índice é reconstruído quando os templates mudam (TEMPLATE_REGISTRY.version).
+Ativação: ``TASK_AGENT_SEMANTIC_INTENTION=1`` com TASK_AGENT_EMBEDDING_MODEL, ou
+``task_generator_agent.set_semantic_classifier(SemanticIntentionClassifier(embedder=...))``.
+Acerto e precisão em goals fora dos exemplos: ``benchmarks/bench_semantic_intention.py``.
+"""
+
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from keyword_matcher import normalize_text
+
+class IntentionPrediction(NamedTuple):
+    """Intenção prevista (None abaixo do limiar) e as k melhores candidatas"""
+    intention: Optional[str]
+    score: float
+    candidates: Tuple[Tuple[str, float], ...]
+
+# Palavras sem conteúdo (artigos, preposições, pronomes) e verbos genéricos,
+# presentes em goals de todas as intenções: no HashingEmbedder elas dominariam
+# a similaridade ("Fazer bolo" ~ "Fazer um mochilão pela América do Sul")
+STOPWORDS = frozenset(
+    "a as o os um uma uns umas de da das do dos dum duma em na nas no nos num numa "
+    "ao aos para pra pro pela pelas pelo pelos por com sem sobre ate entre e ou "
+    "que meu minha meus minhas seu sua seus suas nosso nossa mais menos muito "
+    "fazer ter ser estar ir ficar dar passar tirar montar cuidar comecar "
+    "quero queria preciso precisar conseguir poder vou".split()
+)
+
+class HashingEmbedder:
+    """
+    Embedding por hashing de n-gramas de caracteres (dentro de cada palavra,
+    com bordas) e das próprias palavras, sobre o texto sem acentos e sem
+    STOPWORDS. Captura variações de grafia e flexões ("férias"/"feriado"),
+    não sinônimos: é um modelo léxico, indicado para testes e benchmarks, não
+    para a detecção em produção.
+
+    Args:
+        dim: Dimensão do vetor
+        ngram_range: Tamanhos mínimo e máximo dos n-gramas de caracteres
+    """
+
+    # Calibrado em benchmarks/bench_semantic_intention.py (goals fora dos exemplos
+    # e negativos como "Fazer bolo"): prioriza não atribuir intenção errada,
+    # deixando parte dos goals válidos em "geral"
+    default_threshold = 0.25
+
+    def __init__(self, dim: int = 1024, ngram_range: Tuple[int, int] = (3, 5)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.name = f"hashing-{dim}-{ngram_range[0]}-{ngram_range[1]}-stop"
+
+    def _features(self, text: str) -> List[str]:
+        features = []
+        low, high = self.ngram_range
+        for word in normalize_text(text).split():
+            word = "".join(char for char in word if char.isalnum())
+            if len(word) < 2 or word in STOPWORDS:
+                continue
+            features.append(word)
+            padded = f"<{word}>"
+            for size in range(low, high + 1):
+                features.extend(padded[i:i + size] for i in range(len(padded) - size + 1))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Vetores normalizados (linhas da matriz), um por texto"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                # crc32 é estável entre processos (hash() do Python não é)
+                bucket = zlib.crc32(feature.encode("utf-8"))
+                matrix[row, bucket % self.dim] += 1.0 if bucket & 0x80000000 else -1.0
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+class SentenceTransformerEmbedder:
+    """Modelo local do sentence-transformers, executado na CPU"""
+
+    default_threshold = 0.5
+
+    def __init__(self, model_name: str = "paraphrase-multilingual-MiniLM-L12-v2"):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.name = f"st-{model_name}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+def default_embedder():
+    """Modelo do sentence-transformers indicado em TASK_AGENT_EMBEDDING_MODEL"""
+    model_name = os.environ.get("TASK_AGENT_EMBEDDING_MODEL")
+    if not model_name:
+        raise ValueError(
+            "Defina TASK_AGENT_EMBEDDING_MODEL (ex.: paraphrase-multilingual-MiniLM-L12-v2) "
+            "ou passe embedder=HashingEmbedder() explicitamente"
+        )
+    return SentenceTransformerEmbedder(model_name)
+
+class ExemplarIndex:
+    """Matriz de embeddings dos exemplos, com o rótulo (intenção) de cada linha"""
+
+    def __init__(self, embedder, exemplars: Dict[str, Sequence[str]]):
+        labels, texts = [], []
+        for intention, phrases in exemplars.items():
+            for phrase in phrases:
+                labels.append(intention)
+                texts.append(phrase)
+        self.intentions = sorted(set(labels))
+        self._label_ids = np.array([self.intentions.index(label) for label in labels], dtype=np.int64)
+        self._matrix = embedder.embed(texts) if texts else None
+
+    def scores(self, vector: np.ndarray) -> np.ndarray:
+        """Melhor similaridade de cosseno por intenção (ordem de ``intentions``)"""
+        best = np.full(len(self.intentions), -1.0, dtype=np.float32)
+        if self._matrix is not None:
+            np.maximum.at(best, self._label_ids, self._matrix @ vector)
+        return best
+
+class SemanticIntentionClassifier:
+    """
+    Classificador de intenção por similaridade com os exemplos dos templates.
+
+    Args:
+        registry: StepTemplateRegistry de onde vêm os exemplos (padrão: o do
+            agente)
+        embedder: Modelo de embeddings (padrão: default_embedder())
+        threshold: Similaridade mínima para aceitar a intenção (padrão: o
+            ``default_threshold`` do embedder)
+        top_k: Candidatas retornadas em ``candidates``
+        cache_size: Goals mantidos no cache LRU de previsões
+    """
+
+    def __init__(self, registry=None, embedder=None, threshold: Optional[float] = None, top_k: int = 3, cache_size: int = 4096):
+        if registry is None:
+            from task_generator_agent import TEMPLATE_REGISTRY as registry
+        self.registry = registry
+        self.embedder = embedder or default_embedder()
+        self.threshold = self.embedder.default_threshold if threshold is None else threshold
+        self.top_k = top_k
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, IntentionPrediction]" = OrderedDict()
+        self._index: Optional[ExemplarIndex] = None
+        self._index_version = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """Identifica modelo e limiar (entra na chave do cache de planos)"""
+        return f"{self.embedder.name}@{self.threshold:g}"
+
+    def predict(self, goal: str) -> IntentionPrediction:
+        """Intenção mais provável do goal, com cache por goal normalizado"""
+        return self.predict_many([goal])[0]
+
+    def predict_many(self, goals: Sequence[str]) -> List[IntentionPrediction]:
+        """
+        Previsões de vários goals, na ordem de entrada. Os goals fora do cache
+        são calculados em uma única chamada ao embedder, e cada um recebe a
+        mesma previsão que ``predict`` daria
+        """
+        index = self._current_index()
+        keys = [" ".join(goal.split()).casefold() for goal in goals]
+        predictions: Dict[str, IntentionPrediction] = {}
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for key, goal in zip(keys, goals):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    predictions[key] = cached
+                    self.hits += 1
+                elif key in missing:
+                    self.hits += 1
+                else:
+                    missing[key] = goal
+                    self.misses += 1
+
+        if missing:
+            vectors = self.embedder.embed(list(missing.values()))
+            computed = {key: self._prediction(index, vector) for key, vector in zip(missing, vectors)}
+            with self._lock:
+                self._cache.update(computed)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            predictions.update(computed)
+        return [predictions[key] for key in keys]
+
+    def _prediction(self, index: ExemplarIndex, vector: np.ndarray) -> IntentionPrediction:
+        scores = index.scores(vector)
+        top = np.argsort(-scores)[:self.top_k]
+        candidates = tuple((index.intentions[i], round(float(scores[i]), 4)) for i in top)
+        best_intention, best_score = candidates[0] if candidates else (None, 0.0)
+        return IntentionPrediction(best_intention if best_score >= self.threshold else None, best_score, candidates)
+
+    def __getstate__(self) -> dict:
+        # Enviado aos workers do lote: sem o lock e sem o cache de previsões
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache)}
+
+    def _current_index(self) -> ExemplarIndex:
+        """Índice dos exemplos atuais; reconstruído quando os templates mudam"""
+        version = self.registry.version
+        if self._index is None or version != self._index_version:
+            with self._lock:
+                if self._index is None or version != self._index_version:
+                    self._index = ExemplarIndex(self.embedder, self.registry.exemplars())
+                    self._index_version = version
+                    self._cache.clear()
+        return self._index
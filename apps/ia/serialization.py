@@ -0,0 +1,139 @@
+"""
+Serialização JSON dos planos estruturados
+
+Backends, em ordem de preferência:
+- orjson: encoder em Rust, o mais rápido (``pip install orjson``)
+- msgspec: encoder em C (``pip install msgspec``)
+- json da biblioteca padrão: sempre disponível
+
+A saída é compacta por padrão (sem espaços, UTF-8 sem escapes ``\\uXXXX``);
+indentação de 2 espaços só com ``pretty=True``, para exibição a pessoas.
+Todos os backends produzem o mesmo JSON para os tipos do plano (dict, list,
+str, int, float, bool, None), então trocar de backend não muda o conteúdo.
+
+O backend padrão é o primeiro disponível, ou o indicado pela variável de
+ambiente ``TASK_AGENT_JSON_BACKEND`` (``orjson``, ``msgspec`` ou ``json``),
+lida na primeira serialização; ``set_default_backend`` troca em execução.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - dependência opcional
+    msgspec = None
+
+class Serializer:
+    """Contrato comum dos backends: bytes UTF-8 na saída, str ou bytes na entrada"""
+
+    name = ""
+
+    def dumps(self, value: Any, pretty: bool = False) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        raise NotImplementedError
+
+class OrjsonSerializer(Serializer):
+    name = "orjson"
+
+    def dumps(self, value: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+class MsgspecSerializer(Serializer):
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any, pretty: bool = False) -> bytes:
+        data = self._encoder.encode(value)
+        return msgspec.json.format(data, indent=2) if pretty else data
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+class StdlibSerializer(Serializer):
+    name = "json"
+
+    def dumps(self, value: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            text = json.dumps(value, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+_BACKENDS = {
+    "orjson": (OrjsonSerializer, orjson),
+    "msgspec": (MsgspecSerializer, msgspec),
+    "json": (StdlibSerializer, json),
+}
+
+_instances: Dict[str, Serializer] = {}
+_default: Optional[Serializer] = None
+
+def available_backends() -> list:
+    """Backends instalados, em ordem de preferência"""
+    return [name for name, (_, module) in _BACKENDS.items() if module is not None]
+
+def get_serializer(name: Optional[str] = None) -> Serializer:
+    """
+    Retorna o serializer do backend ``name`` (padrão: o preferido disponível).
+
+    Raises:
+        ValueError: Backend desconhecido ou não instalado
+    """
+    global _default
+    if name is None:
+        if _default is None:
+            _default = get_serializer(os.environ.get("TASK_AGENT_JSON_BACKEND") or available_backends()[0])
+        return _default
+
+    serializer = _instances.get(name)
+    if serializer is None:
+        if name not in _BACKENDS:
+            raise ValueError(f"Backend JSON desconhecido: {name!r} (opções: {', '.join(_BACKENDS)})")
+        cls, module = _BACKENDS[name]
+        if module is None:
+            raise ValueError(f"Backend JSON {name!r} não está instalado")
+        serializer = _instances[name] = cls()
+    return serializer
+
+def set_default_backend(name: Optional[str]) -> Serializer:
+    """Define o backend padrão (None volta à escolha automática)"""
+    global _default
+    _default = None
+    _default = get_serializer(name)
+    return _default
+
+def dumps(value: Any, pretty: bool = False) -> str:
+    """Serializa para texto (compacto por padrão)"""
+    return get_serializer().dumps(value, pretty).decode("utf-8")
+
+def dumps_bytes(value: Any, pretty: bool = False) -> bytes:
+    """Serializa para bytes UTF-8, sem a decodificação de ``dumps``"""
+    return get_serializer().dumps(value, pretty)
+
+def loads(data: Union[str, bytes]) -> Any:
+    return get_serializer().loads(data)
+
+def dump(value: Any, path: str, pretty: bool = False) -> int:
+    """Grava ``value`` em ``path`` em uma única passada; retorna os bytes escritos"""
+    data = get_serializer().dumps(value, pretty)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
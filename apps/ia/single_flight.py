@@ -0,0 +1,109 @@
+"""
+Coalescência de requisições concorrentes iguais (single-flight)
+
+Enquanto uma computação para uma chave está em andamento, novas chamadas com
+a mesma chave esperam por ela em vez de repetir o trabalho. Quando termina, o
+resultado (ou a exceção) é entregue a todos, e a chave é liberada: chamadas
+posteriores executam de novo (cache fica a cargo do PlanCache).
+
+- SingleFlight: para threads (generate_tasks, lotes em threads)
+- AsyncSingleFlight: para corrotinas (agenerate_tasks); a computação roda em
+  uma task própria, então cancelar quem a iniciou não cancela os demais
+
+``do`` retorna ``(resultado, compartilhado)``: ``compartilhado`` indica que a
+chamada reaproveitou a computação de outra, e quem chama é responsável por
+não devolver o mesmo objeto mutável a dois clientes.
+
+asyncio só é importado na primeira chamada de ``AsyncSingleFlight.do``: o
+agente cria as duas classes, mas o caminho síncrono não paga o import.
+"""
+
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class _FlightStats:
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def _count(self, coalesced: bool) -> None:
+        with self._stats_lock:
+            if coalesced:
+                self.coalesced += 1
+            else:
+                self.executed += 1
+
+    def stats(self) -> dict:
+        """Computações executadas e chamadas que reaproveitaram uma em andamento"""
+        with self._stats_lock:
+            return {"executed": self.executed, "coalesced": self.coalesced}
+
+class SingleFlight(_FlightStats):
+    """Single-flight entre threads"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        self._count(coalesced=not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+class AsyncSingleFlight(_FlightStats):
+    """Single-flight entre corrotinas (por event loop)"""
+
+    def __init__(self):
+        super().__init__()
+        self._tasks: Dict[Tuple[int, Hashable], "asyncio.Future"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        import asyncio
+
+        flight_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(flight_key)
+        leader = task is None
+        if leader:
+            task = self._tasks[flight_key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finished(flight_key, done))
+        self._count(coalesced=not leader)
+
+        # shield: o cancelamento de um cliente não cancela a computação compartilhada
+        return await asyncio.shield(task), not leader
+
+    def _finished(self, flight_key: Tuple[int, Hashable], task: "asyncio.Future") -> None:
+        if self._tasks.get(flight_key) is task:
+            del self._tasks[flight_key]
+        # Marca a exceção como consumida caso todos os clientes tenham desistido
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,269 @@
+"""
+Registro de templates de passos por intenção
+
+Os templates ficam em arquivos JSON (ou YAML, com PyYAML instalado) no
+diretório ``templates/``. Cada arquivo declara uma intenção com seus passos
+e/ou regras de personalização; vários arquivos da mesma intenção somam regras
+(ex.: um arquivo por destino), mas só um deles pode declarar os passos:
+
+    {
+      "intention": "planejamento_viagem",
+      "steps": [
+        {"description": "Definir datas da viagem", "depends_on": []},
+        {"description": "Reservar voos", "depends_on": [1], "estimated_time": "2 days"}
+      ],
+      "personalization": [
+        {"name": "japão", "keywords": ["japão"], "overrides": {"voos": "Reservar voos para Tóquio"}}
+      ],
+      "exemplars": ["Conhecer Paris nas férias", "Fazer um mochilão pela Europa"]
+    }
+
+``estimated_time`` e ``priority`` são opcionais (padrão pela posição do passo).
+Uma regra de personalização se aplica quando o goal contém uma das palavras
+(sem diferenciar acentos); cada override troca a descrição do primeiro passo
+que contém o trecho indicado. ``exemplars`` são frases de exemplo da intenção,
+usadas pela detecção semântica (semantic_intention.py).
+
+Tudo o que não depende do goal é pré-calculado na carga: o cronograma de cada
+template (task_dag) e os passos já personalizados de cada regra. Por goal, o
+custo é uma varredura do KeywordMatcher da intenção e a cópia dos passos,
+independente da quantidade de intenções e destinos cadastrados.
+
+Recarga a quente: a cada ``check_interval`` segundos, ``get`` confere o mtime
+dos arquivos e recarrega o registro se algo mudou. Uma recarga com erro mantém
+os templates anteriores e guarda a exceção em ``last_error``. ``version`` é um
+hash do conteúdo dos arquivos, usado na chave do cache de planos para que
+planos gerados com templates antigos não sejam reaproveitados.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from keyword_matcher import KeywordMatcher
+from task_dag import TaskGraph, format_duration, parse_duration
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - dependência opcional
+    yaml = None
+
+DEFAULT_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+FALLBACK_INTENTION = "geral"
+
+_EXTENSIONS = (".json", ".yaml", ".yml")
+
+class StepSpec(NamedTuple):
+    """Passo de um template (depends_on: números dos passos, a partir de 1)"""
+    description: str
+    estimated_time: str
+    priority: str
+    depends_on: Tuple[int, ...]
+
+class StepTemplate(NamedTuple):
+    """Template compilado de uma intenção"""
+    intention: str
+    category: str
+    steps: Tuple[StepSpec, ...]
+    estimated_completion: str
+    critical_path: Tuple[int, ...]
+    descriptions: Tuple[str, ...]
+    exemplars: Tuple[str, ...]
+    # Descrições já personalizadas por regra e o matcher que escolhe a regra
+    variants: Dict[str, Tuple[str, ...]]
+    matcher: Optional[KeywordMatcher]
+
+    def descriptions_for(self, goal: str) -> Tuple[str, ...]:
+        """Descrições dos passos para o goal (personalizadas, se alguma regra casar)"""
+        if self.matcher is not None:
+            rule = self.matcher.match(goal).label
+            if rule is not None:
+                return self.variants[rule]
+        return self.descriptions
+
+def default_estimated_time(index: int) -> str:
+    return f"{1 + (index % 3)} days"
+
+def default_priority(index: int) -> str:
+    return "alta" if index < 3 else "média" if index < 6 else "baixa"
+
+def _read_file(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        if yaml is None:
+            raise ValueError(f"{path}: instale PyYAML para carregar templates YAML")
+        return yaml.safe_load(f)
+
+def _compile_template(intention: str, steps: List[dict], rules: List[dict], exemplars: List[str], source: str) -> StepTemplate:
+    specs = tuple(
+        StepSpec(
+            description=step["description"],
+            estimated_time=step.get("estimated_time") or default_estimated_time(i),
+            priority=step.get("priority") or default_priority(i),
+            depends_on=tuple(step.get("depends_on", [i] if i else [])),
+        )
+        for i, step in enumerate(steps)
+    )
+
+    # Valida durações e dependências (DependencyCycleError em ciclos)
+    try:
+        schedule = TaskGraph(
+            range(1, len(specs) + 1),
+            [parse_duration(spec.estimated_time) for spec in specs],
+            [spec.depends_on for spec in specs]
+        ).schedule()
+    except ValueError as error:
+        raise ValueError(f"{source}: template {intention!r} inválido: {error}") from error
+
+    variants = {}
+    matcher = KeywordMatcher() if rules else None
+    for rule in rules:
+        name = rule["name"]
+        overrides = [(fragment.casefold(), text) for fragment, text in rule.get("overrides", {}).items()]
+        descriptions = []
+        for spec in specs:
+            lowered = spec.description.casefold()
+            descriptions.append(next((text for fragment, text in overrides if fragment in lowered), spec.description))
+        variants[name] = tuple(descriptions)
+        for keyword in rule.get("keywords", [name]):
+            matcher.add_ranked(keyword, name)
+
+    return StepTemplate(
+        intention=intention,
+        category=intention.replace("_", " ").title(),
+        steps=specs,
+        estimated_completion=format_duration(schedule.makespan),
+        critical_path=tuple(schedule.critical_path),
+        descriptions=tuple(spec.description for spec in specs),
+        exemplars=tuple(exemplars),
+        variants=variants,
+        matcher=matcher,
+    )
+
+def load_templates(directory: str) -> Dict[str, StepTemplate]:
+    """
+    Carrega e compila todos os templates de ``directory``.
+
+    Raises:
+        ValueError: Arquivo inválido, passos declarados duas vezes, intenção
+            sem passos ou sem o template de fallback ``geral``
+    """
+    steps: Dict[str, Tuple[List[dict], str]] = {}
+    rules: Dict[str, List[dict]] = {}
+    exemplars: Dict[str, List[str]] = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(_EXTENSIONS):
+            continue
+        path = os.path.join(directory, name)
+        data = _read_file(path)
+        intention = data.get("intention")
+        if not intention:
+            raise ValueError(f"{path}: campo 'intention' ausente")
+        if "steps" in data:
+            if intention in steps:
+                raise ValueError(f"{path}: passos de {intention!r} já declarados em {steps[intention][1]}")
+            steps[intention] = (data["steps"], path)
+        rules.setdefault(intention, []).extend(data.get("personalization", []))
+        exemplars.setdefault(intention, []).extend(data.get("exemplars", []))
+
+    orphans = set(rules) - set(steps)
+    if orphans:
+        raise ValueError(f"Regras de personalização ou exemplos sem template: {', '.join(sorted(orphans))}")
+    if FALLBACK_INTENTION not in steps:
+        raise ValueError(f"{directory}: template {FALLBACK_INTENTION!r} (fallback) ausente")
+
+    return {
+        intention: _compile_template(intention, intention_steps, rules[intention], exemplars[intention], source)
+        for intention, (intention_steps, source) in steps.items()
+    }
+
+class StepTemplateRegistry:
+    """
+    Templates indexados por intenção, carregados no primeiro uso.
+
+    Args:
+        directory: Diretório dos arquivos de template
+        check_interval: Intervalo mínimo, em segundos, entre verificações de
+            mudança nos arquivos (None desativa a recarga a quente)
+    """
+
+    def __init__(self, directory: str = DEFAULT_TEMPLATES_DIR, check_interval: Optional[float] = 2.0):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.last_error: Optional[Exception] = None
+        self.reloads = 0
+        self._version = ""
+        self._templates: Optional[Dict[str, StepTemplate]] = None
+        self._signature = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, intention: str) -> StepTemplate:
+        """Template da intenção, ou o template ``geral`` se ela não tiver um"""
+        templates = self._templates
+        if templates is None or (self.check_interval is not None and time.monotonic() >= self._next_check):
+            templates = self._refresh()
+        return templates.get(intention) or templates[FALLBACK_INTENTION]
+
+    def intentions(self) -> List[str]:
+        self.get(FALLBACK_INTENTION)
+        return list(self._templates)
+
+    def exemplars(self) -> Dict[str, Tuple[str, ...]]:
+        """Frases de exemplo por intenção (só as intenções que têm exemplos)"""
+        self.get(FALLBACK_INTENTION)
+        return {intention: t.exemplars for intention, t in self._templates.items() if t.exemplars}
+
+    @property
+    def version(self) -> str:
+        """Hash do conteúdo dos templates em uso"""
+        self.get(FALLBACK_INTENTION)
+        return self._version
+
+    def __reduce__(self):
+        # Em outro processo (ex.: workers do lote) os templates são relidos do mesmo diretório
+        return (type(self), (self.directory, self.check_interval))
+
+    def reload(self) -> None:
+        """Recarrega os arquivos imediatamente (erros são propagados)"""
+        with self._lock:
+            self._load(self._file_signature())
+
+    def _refresh(self) -> Dict[str, StepTemplate]:
+        with self._lock:
+            if self.check_interval is not None:
+                self._next_check = time.monotonic() + self.check_interval
+            signature = self._file_signature()
+            if self._templates is None:
+                self._load(signature)
+            elif signature != self._signature:
+                try:
+                    self._load(signature)
+                except Exception as error:
+                    # Mantém os templates em uso; não tenta de novo até o próximo mtime
+                    self.last_error = error
+                    self._signature = signature
+            return self._templates
+
+    def _load(self, signature) -> None:
+        self._templates = load_templates(self.directory)
+        digest = hashlib.sha256()
+        for name, _ in signature:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                digest.update(name.encode("utf-8") + b"\x00" + f.read() + b"\x00")
+        self._version = digest.hexdigest()[:12]
+        self._signature = signature
+        self.last_error = None
+        self.reloads += 1
+
+    def _file_signature(self) -> tuple:
+        """Nome e mtime de cada arquivo de template, para detectar mudanças"""
+        with os.scandir(self.directory) as entries:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.name.endswith(_EXTENSIONS)
+            ))
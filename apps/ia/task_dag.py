@@ -0,0 +1,176 @@
+"""
+Grafo de dependências das tarefas geradas
+
+Interpreta ``estimated_time`` como duração, ordena as tarefas (Kahn), detecta
+ciclos e calcula o cronograma com paralelismo ilimitado: início e fim mais
+cedo de cada tarefa (ES/EF), duração total (makespan) e caminho crítico.
+
+Todos os algoritmos são O(tarefas + dependências): os ids são convertidos em
+índices uma única vez e o grafo é percorrido em listas de adjacência (ver
+benchmarks/bench_task_dag.py).
+
+Uso com um plano já gerado:
+    from task_dag import schedule_plan
+    schedule = schedule_plan(result)
+    schedule.earliest_start[task_id], schedule.critical_path
+"""
+
+import re
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Sequence
+
+# Unidade -> dias (dias corridos)
+DURATION_UNITS = {
+    "min": 1 / 1440, "minute": 1 / 1440, "minutes": 1 / 1440, "minuto": 1 / 1440, "minutos": 1 / 1440,
+    "h": 1 / 24, "hour": 1 / 24, "hours": 1 / 24, "hora": 1 / 24, "horas": 1 / 24,
+    "d": 1, "day": 1, "days": 1, "dia": 1, "dias": 1,
+    "w": 7, "week": 7, "weeks": 7, "semana": 7, "semanas": 7,
+    "month": 30, "months": 30, "mês": 30, "mes": 30, "meses": 30,
+}
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:[.,]\d+)?)\s*([^\d\s]*)\s*$")
+
+class DependencyCycleError(ValueError):
+    """As dependências formam um ciclo; ``cycle`` lista os ids envolvidos, em ordem"""
+
+    def __init__(self, cycle: List[Hashable]):
+        self.cycle = cycle
+        super().__init__(f"Ciclo de dependências: {' -> '.join(map(str, cycle + cycle[:1]))}")
+
+def parse_duration(text: str) -> float:
+    """
+    Converte ``estimated_time`` em dias: "2 days", "3 dias", "4h", "1 semana".
+
+    Raises:
+        ValueError: Formato ou unidade desconhecidos
+    """
+    match = _DURATION_PATTERN.match(text)
+    unit = match.group(2).casefold() if match else None
+    if unit is None or (unit and unit not in DURATION_UNITS):
+        raise ValueError(f"Duração não reconhecida: {text!r}")
+    return float(match.group(1).replace(",", ".")) * DURATION_UNITS.get(unit or "d")
+
+def format_duration(days: float) -> str:
+    """Formata dias no padrão de ``estimated_completion`` ("N days")"""
+    return f"{days:g} {'day' if days == 1 else 'days'}"
+
+class Schedule(NamedTuple):
+    """Cronograma com paralelismo ilimitado, em dias a partir do início do plano"""
+    order: List[Hashable]
+    earliest_start: Dict[Hashable, float]
+    earliest_finish: Dict[Hashable, float]
+    makespan: float
+    critical_path: List[Hashable]
+
+class TaskGraph:
+    """
+    DAG de tarefas: ids, durações (em dias) e dependências.
+
+    Args:
+        ids: Ids das tarefas, na ordem do plano
+        durations: Duração de cada tarefa, na mesma ordem
+        dependencies: Para cada tarefa, os ids de que ela depende
+
+    Raises:
+        ValueError: Id duplicado ou dependência para id inexistente
+    """
+
+    def __init__(self, ids: Sequence[Hashable], durations: Sequence[float], dependencies: Sequence[Iterable[Hashable]]):
+        self.ids = list(ids)
+        self.durations = list(durations)
+        index = {task_id: i for i, task_id in enumerate(self.ids)}
+        if len(index) != len(self.ids):
+            raise ValueError("Ids de tarefa duplicados no plano")
+
+        # predecessors[i]: índices de que i depende; successors[i]: dependentes de i
+        try:
+            self.predecessors: List[List[int]] = [[index[dep] for dep in deps] for deps in dependencies]
+        except KeyError as error:
+            raise ValueError(f"Dependência para id inexistente: {error.args[0]!r}") from None
+        self.successors: List[List[int]] = [[] for _ in self.ids]
+        for i, preds in enumerate(self.predecessors):
+            for j in preds:
+                self.successors[j].append(i)
+
+    @classmethod
+    def from_tasks(cls, tasks: Sequence[dict]) -> "TaskGraph":
+        """Monta o grafo a partir das tarefas de ``structured_json``"""
+        return cls(
+            [task["id"] for task in tasks],
+            [parse_duration(task.get("estimated_time", "1 day")) for task in tasks],
+            [task.get("dependencies", ()) for task in tasks],
+        )
+
+    def _topological_indices(self) -> List[int]:
+        """Kahn: índices em ordem topológica, estável pela ordem do plano"""
+        indegree = [len(preds) for preds in self.predecessors]
+        ready = deque(i for i, degree in enumerate(indegree) if degree == 0)
+        order = []
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for j in self.successors[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    ready.append(j)
+
+        if len(order) != len(self.ids):
+            raise DependencyCycleError(self._find_cycle(indegree))
+        return order
+
+    def _find_cycle(self, indegree: List[int]) -> List[Hashable]:
+        """
+        Extrai um ciclo entre as tarefas que sobraram no Kahn (indegree > 0).
+        Toda tarefa restante tem um predecessor restante, então seguir
+        predecessores acaba revisitando um nó do ciclo.
+        """
+        position = {}
+        path = []
+        i = next(i for i, degree in enumerate(indegree) if degree > 0)
+        while i not in position:
+            position[i] = len(path)
+            path.append(i)
+            i = next(j for j in self.predecessors[i] if indegree[j] > 0)
+        # O caminho segue predecessores; inverte para a ordem de execução
+        return [self.ids[k] for k in reversed(path[position[i]:])]
+
+    def topological_order(self) -> List[Hashable]:
+        """Ids em ordem de execução possível (DependencyCycleError se houver ciclo)"""
+        return [self.ids[i] for i in self._topological_indices()]
+
+    def schedule(self) -> Schedule:
+        """ES/EF de cada tarefa, makespan e caminho crítico (um deles, se houver empate)"""
+        order = self._topological_indices()
+        start = [0.0] * len(self.ids)
+        finish = [0.0] * len(self.ids)
+        # Predecessor que determina o início mais cedo (para reconstruir o caminho)
+        critical_pred = [-1] * len(self.ids)
+
+        durations = self.durations
+        for i in order:
+            preds = self.predecessors[i]
+            if preds:
+                j = max(preds, key=finish.__getitem__)
+                start[i] = finish[j]
+                critical_pred[i] = j
+            finish[i] = start[i] + durations[i]
+
+        path = []
+        if order:
+            last = max(order, key=finish.__getitem__)
+            while last != -1:
+                path.append(self.ids[last])
+                last = critical_pred[last]
+            path.reverse()
+
+        return Schedule(
+            order=[self.ids[i] for i in order],
+            earliest_start=dict(zip(self.ids, start)),
+            earliest_finish=dict(zip(self.ids, finish)),
+            makespan=max(finish, default=0.0),
+            critical_path=path,
+        )
+
+def schedule_plan(plan: dict) -> Schedule:
+    """Cronograma das tarefas de um ``structured_json``"""
+    return TaskGraph.from_tasks(plan.get("tasks", [])).schedule()
@@ -8,26 +8,42 @@ Seguindo as estratégias definidas nos documentos:
 - Streaming
 - Human-in-the-Loop
 - Memory
+
+Importar este módulo não carrega LangGraph, LangChain nem LangSmith: esses
+pacotes são importados no primeiro uso (compilação do grafo, acesso às
+ferramentas ou ao cliente LangSmith), o que reduz o cold start de workers
+serverless. Ver benchmarks/bench_cold_start.py.
 """
 
-from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.tools import tool
-from langchain.chat_models import init_chat_model
-from typing_extensions import TypedDict, Annotated
+from typing_extensions import TypedDict, Annotated, NotRequired
+import copy
 import operator
-import json
+import os
+import threading
 import uuid
 from datetime import datetime
+from contextlib import ExitStack, contextmanager, nullcontext
 from enum import Enum
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple
 
-# Configuração do LangSmith para observabilidade
-import os
-from langsmith import Client
+from keyword_matcher import KeywordMatcher
+from plan_cache import PlanCache, plan_cache_key
+from single_flight import AsyncSingleFlight, SingleFlight
+from plan_diff import diff
+from profiling import NodeProfiler
+from step_templates import DEFAULT_TEMPLATES_DIR, StepTemplateRegistry
+import serialization
+from telemetry import Telemetry
 
-# Configurar LangSmith (em produção, usar variáveis de ambiente)
-os.environ["LANGCHAIN_TRACING_V2"] = "true"
-os.environ["LANGCHAIN_PROJECT"] = "task-generator-agent"
+def configure_langsmith_env():
+    """
+    Configura o LangSmith para observabilidade
+    
+    O tracing é opt-in: só é ativado com ``LANGCHAIN_TRACING_V2=true`` no
+    ambiente. Aqui apenas o projeto recebe um padrão (``setdefault``: valores
+    já definidos no ambiente têm precedência).
+    """
+    os.environ.setdefault("LANGCHAIN_PROJECT", "task-generator-agent")
 
 # Estados do processo
 class TaskStatus(str, Enum):
@@ -37,20 +53,111 @@ class TaskStatus(str, Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+# Estruturas trafegadas entre os nós (dicts nativos, sem serialização)
+class FeasibilityAnalysis(TypedDict):
+    feasibility_score: float
+    factors: dict
+    detected_intention: str
+    is_feasible: bool
+    recommendations: list
+    # Só com a detecção semântica ativa: "keyword", "semantic" ou "default"
+    intention_source: NotRequired[str]
+    intention_candidates: NotRequired[list]
+
+class TaskStepsPlan(TypedDict):
+    goal: str
+    intention: str
+    total_steps: int
+    estimated_completion: str
+    critical_path: list
+    steps: list
+
+class StructuredPlan(TypedDict):
+    id: str
+    goal: str
+    created_at: str
+    status: str
+    metadata: dict
+    tasks: list
+
 # Estado do agente
 class TaskGeneratorState(TypedDict):
     messages: Annotated[list, operator.add]
     goal: str
-    intention_analysis: dict
-    task_steps: list
-    structured_json: dict
+    intention_analysis: FeasibilityAnalysis
+    task_steps: TaskStepsPlan
+    structured_json: StructuredPlan
     status: TaskStatus
     confidence_score: float
     session_id: str
 
-# Ferramentas do agente
-@tool
-def validate_goal_feasibility(goal: str) -> str:
+# Versão das regras do pipeline. Faz parte da chave do cache de planos, junto
+# com TEMPLATE_REGISTRY.version (hash dos arquivos de template): incremente ao
+# mudar qualquer regra no código que altere o resultado gerado.
+PIPELINE_VERSION = "4"
+
+# Tabelas de palavras-chave da análise de viabilidade
+FEASIBILITY_KEYWORDS = {
+    "clarity_strong": ["planejar", "organizar", "criar", "desenvolver", "implementar"],
+    "clarity_weak": ["fazer", "ter", "ser"],
+    "specific": ["viagem", "japão", "projeto", "aplicação", "sistema"],
+    "achievable": ["viagem", "planejamento", "organização", "criação"],
+    "urgent": ["rápido", "urgente", "hoje", "amanhã"]
+}
+
+# Ordem importa: vence a primeira palavra presente no goal
+INTENTION_KEYWORDS = {
+    "viagem": "planejamento_viagem",
+    "projeto": "desenvolvimento_projeto", 
+    "organizar": "organização_atividade",
+    "criar": "criação_conteudo",
+    "implementar": "implementação_sistema"
+}
+
+# Matcher compilado uma única vez; pode ser estendido em tempo de execução com
+# GOAL_KEYWORD_MATCHER.add_keywords(grupo, palavras) ou .add_ranked(palavra, intenção)
+GOAL_KEYWORD_MATCHER = KeywordMatcher(FEASIBILITY_KEYWORDS)
+for _keyword, _intention in INTENTION_KEYWORDS.items():
+    GOAL_KEYWORD_MATCHER.add_ranked(_keyword, _intention)
+
+# Templates de passos por intenção (arquivos em templates/), carregados no
+# primeiro uso e recarregados quando os arquivos mudam
+TEMPLATE_REGISTRY = StepTemplateRegistry(os.environ.get("TASK_AGENT_TEMPLATES_DIR", DEFAULT_TEMPLATES_DIR))
+
+# Detecção semântica de intenção (opcional): consultada só quando nenhuma
+# palavra de INTENTION_KEYWORDS casa. Desativada por padrão.
+_semantic_classifier = None
+_semantic_configured = False
+
+def set_semantic_classifier(classifier) -> None:
+    """Ativa (SemanticIntentionClassifier) ou desativa (None) a detecção semântica"""
+    global _semantic_classifier, _semantic_configured
+    _semantic_classifier = classifier
+    _semantic_configured = True
+
+def get_semantic_classifier():
+    """
+    Classificador em uso; criado no primeiro acesso se
+    TASK_AGENT_SEMANTIC_INTENTION=1 (exige TASK_AGENT_EMBEDDING_MODEL)
+    """
+    global _semantic_classifier, _semantic_configured
+    if not _semantic_configured:
+        if os.environ.get("TASK_AGENT_SEMANTIC_INTENTION", "").lower() in ("1", "true"):
+            from semantic_intention import SemanticIntentionClassifier
+            _semantic_classifier = SemanticIntentionClassifier(TEMPLATE_REGISTRY)
+        _semantic_configured = True
+    return _semantic_classifier
+
+def _results_version() -> str:
+    """Versão de tudo o que determina o resultado (chave do cache de planos)"""
+    version = f"{PIPELINE_VERSION}+{TEMPLATE_REGISTRY.version}"
+    classifier = get_semantic_classifier()
+    return version if classifier is None else f"{version}+{classifier.version}"
+
+# Lógica do agente
+# Os nós usam estas funções diretamente e trocam dicts nativos; a serialização
+# para JSON acontece apenas na fronteira (ferramentas e consumidores da API).
+def analyze_goal_feasibility(goal: str) -> FeasibilityAnalysis:
     """
     Valida a viabilidade de um goal e calcula porcentagem de viabilidade.
     
@@ -58,7 +165,7 @@ def validate_goal_feasibility(goal: str) -> str:
         goal: O objetivo a ser analisado
     
     Returns:
-        JSON string com análise de viabilidade
+        Dicionário com análise de viabilidade
     """
     
     # Análise básica de viabilidade
@@ -69,20 +176,20 @@ def validate_goal_feasibility(goal: str) -> str:
         "timeframe": 0.0
     }
     
-    goal_lower = goal.lower()
+    # Uma única varredura do texto encontra todos os grupos e a intenção
+    keyword_hits = GOAL_KEYWORD_MATCHER.match(goal)
+    hit_groups = keyword_hits.groups
     
     # Verifica clareza
-    clear_keywords = ["planejar", "organizar", "criar", "desenvolver", "implementar"]
-    if any(keyword in goal_lower for keyword in clear_keywords):
+    if "clarity_strong" in hit_groups:
         feasibility_factors["clarity"] = 0.8
-    elif any(word in goal_lower for word in ["fazer", "ter", "ser"]):
+    elif "clarity_weak" in hit_groups:
         feasibility_factors["clarity"] = 0.6
     else:
         feasibility_factors["clarity"] = 0.3
     
     # Verifica especificidade
-    specific_keywords = ["viagem", "japão", "projeto", "aplicação", "sistema"]
-    if any(keyword in goal_lower for keyword in specific_keywords):
+    if "specific" in hit_groups:
         feasibility_factors["specificity"] = 0.9
     elif len(goal.split()) > 3:
         feasibility_factors["specificity"] = 0.7
@@ -90,15 +197,13 @@ def validate_goal_feasibility(goal: str) -> str:
         feasibility_factors["specificity"] = 0.4
     
     # Verifica alcançabilidade
-    achievable_goals = ["viagem", "planejamento", "organização", "criação"]
-    if any(keyword in goal_lower for keyword in achievable_goals):
+    if "achievable" in hit_groups:
         feasibility_factors["achievability"] = 0.85
     else:
         feasibility_factors["achievability"] = 0.6
     
     # Verifica enquadramento temporal
-    time_keywords = ["rápido", "urgente", "hoje", "amanhã"]
-    if any(keyword in goal_lower for keyword in time_keywords):
+    if "urgent" in hit_groups:
         feasibility_factors["timeframe"] = 0.7
     else:
         feasibility_factors["timeframe"] = 0.8
@@ -106,29 +211,31 @@ def validate_goal_feasibility(goal: str) -> str:
     # Calcula score final
     total_score = sum(feasibility_factors.values()) / len(feasibility_factors)
     
-    # Determina intenção provável
-    intention_map = {
-        "viagem": "planejamento_viagem",
-        "projeto": "desenvolvimento_projeto", 
-        "organizar": "organização_atividade",
-        "criar": "criação_conteudo",
-        "implementar": "implementação_sistema"
-    }
-    
-    detected_intention = "geral"
-    for keyword, intention in intention_map.items():
-        if keyword in goal_lower:
-            detected_intention = intention
-            break
+    # Determina intenção provável (primeira palavra de INTENTION_KEYWORDS
+    # presente); sem palavra-chave, recorre à detecção semântica, se ativa
+    detected_intention = keyword_hits.label
+    classifier = get_semantic_classifier()
+    prediction = None
+    if detected_intention is None and classifier is not None:
+        prediction = classifier.predict(goal)
+        detected_intention = prediction.intention
     
-    analysis = {
+    analysis: FeasibilityAnalysis = {
         "feasibility_score": round(total_score, 2),
         "factors": feasibility_factors,
-        "detected_intention": detected_intention,
+        "detected_intention": detected_intention or "geral",
         "is_feasible": total_score > 0.6,
         "recommendations": []
     }
     
+    if classifier is not None:
+        if prediction is None:
+            analysis["intention_source"] = "keyword"
+            analysis["intention_candidates"] = [[keyword_hits.label, 1.0]]
+        else:
+            analysis["intention_source"] = "semantic" if prediction.intention else "default"
+            analysis["intention_candidates"] = [list(candidate) for candidate in prediction.candidates]
+    
     # Adiciona recomendações
     if total_score < 0.5:
         analysis["recommendations"].append("Goal muito vago, adicione mais detalhes")
@@ -137,10 +244,9 @@ def validate_goal_feasibility(goal: str) -> str:
     if total_score > 0.8:
         analysis["recommendations"].append("Goal bem definido e viável")
     
-    return json.dumps(analysis, ensure_ascii=False)
+    return analysis
 
-@tool 
-def generate_task_steps(goal: str, intention: str) -> str:
+def build_task_steps(goal: str, intention: str) -> TaskStepsPlan:
     """
     Gera passos específicos para alcançar o goal baseado na intenção detectada.
     
@@ -149,114 +255,58 @@ def generate_task_steps(goal: str, intention: str) -> str:
         intention: A intenção detectada
     
     Returns:
-        JSON string com lista de passos
+        Dicionário com lista de passos
     """
     
-    # Templates de passos baseados na intenção
-    step_templates = {
-        "planejamento_viagem": [
-            "Definir datas da viagem",
-            "Pesquisar destinos específicos",
-            "Verificar documentação necessária",
-            "Reservar voos",
-            "Reservar acomodação", 
-            "Planejar itinerário diário",
-            "Pesquisar cultura e costumes locais",
-            "Organizar orçamento da viagem",
-            "Fazer seguro viagem",
-            "Preparar bagagem"
-        ],
-        "desenvolvimento_projeto": [
-            "Definir escopo do projeto",
-            "Identificar recursos necessários",
-            "Criar cronograma",
-            "Formar equipe",
-            "Definir metodologia",
-            "Estabelecer marcos principais",
-            "Implementar fases do projeto",
-            "Testar deliverables",
-            "Documentar resultados",
-            "Apresentar projeto final"
-        ],
-        "organização_atividade": [
-            "Definir objetivos da atividade",
-            "Listar tarefas necessárias",
-            "Priorizar por importância",
-            "Estimar tempo para cada tarefa",
-            "Alocar recursos",
-            "Criar cronograma",
-            "Executar atividades",
-            "Monitorar progresso",
-            "Ajustar conforme necessário",
-            "Finalizar e avaliar"
-        ],
-        "geral": [
-            "Analisar o objetivo",
-            "Quebrar em subtarefas",
-            "Definir prioridades",
-            "Criar plano de ação",
-            "Executar primeiro passo",
-            "Monitorar progresso",
-            "Ajustar estratégia",
-            "Finalizar objetivo"
-        ]
-    }
-    
-    # Seleciona template baseado na intenção
-    base_steps = step_templates.get(intention, step_templates["geral"])
-    
-    # Personaliza passos baseado no goal específico
-    personalized_steps = []
-    goal_lower = goal.lower()
+    # Template da intenção (ou "geral"), com a personalização por destino
+    # escolhida em uma única varredura do goal
+    template = TEMPLATE_REGISTRY.get(intention)
+    category = template.category if template.intention == intention else intention.replace("_", " ").title()
     
-    for i, step in enumerate(base_steps):
-        # Personaliza passos para viagem ao Japão
-        if intention == "planejamento_viagem" and "japão" in goal_lower:
-            if "documentação" in step.lower():
-                step = "Verificar visto para o Japão (se necessário)"
-            elif "cultura" in step.lower():
-                step = "Estudar etiqueta e cultura japonesa"
-            elif "itinerário" in step.lower():
-                step = "Planejar roteiro por cidades japonesas"
-        
-        personalized_steps.append({
+    personalized_steps = [
+        {
             "step_number": i + 1,
-            "description": step,
-            "estimated_time": f"{1 + (i % 3)} days",
-            "priority": "alta" if i < 3 else "média" if i < 6 else "baixa",
-            "category": intention.replace("_", " ").title()
-        })
+            "description": description,
+            "estimated_time": spec.estimated_time,
+            "priority": spec.priority,
+            "category": category,
+            "depends_on": list(spec.depends_on)
+        }
+        for i, (spec, description) in enumerate(zip(template.steps, template.descriptions_for(goal)))
+    ]
     
-    task_structure = {
+    task_structure: TaskStepsPlan = {
         "goal": goal,
         "intention": intention,
         "total_steps": len(personalized_steps),
-        "estimated_completion": f"{len(personalized_steps) * 2} days",
+        "estimated_completion": template.estimated_completion,
+        "critical_path": list(template.critical_path),
         "steps": personalized_steps
     }
     
-    return json.dumps(task_structure, ensure_ascii=False)
+    return task_structure
 
-@tool
-def structure_tasks_json(goal: str, steps_data: str) -> str:
+def iter_structured_plan(goal: str, steps_dict: TaskStepsPlan) -> Iterator[Tuple[str, dict]]:
     """
-    Converte os passos em JSON estruturado final para o preview.
+    Gera a estrutura final incrementalmente, para streaming.
+    
+    Emite ``("plan_started", cabeçalho)`` e em seguida ``("task", tarefa)``
+    para cada passo, à medida que as tarefas são montadas.
     
     Args:
         goal: O objetivo original
-        steps_data: JSON string com os passos gerados
-    
-    Returns:
-        JSON estruturado final para preview
+        steps_dict: Passos gerados por build_task_steps
     """
     
-    try:
-        steps_dict = json.loads(steps_data)
-    except:
-        steps_dict = {"steps": [], "total_steps": 0}
+    # Ids gerados antes das tarefas: dependências podem apontar para qualquer passo
+    steps = steps_dict.get("steps", [])
+    task_ids = [str(uuid.uuid4()) for _ in steps]
     
-    # Estrutura final para o preview
-    final_structure = {
+    def step_task_ids(step_numbers) -> list:
+        return [task_ids[n - 1] for n in step_numbers if 0 < n <= len(task_ids)]
+    
+    # Cabeçalho do plano para o preview
+    yield "plan_started", {
         "id": str(uuid.uuid4()),
         "goal": goal,
         "created_at": datetime.now().isoformat(),
@@ -264,17 +314,18 @@ def structure_tasks_json(goal: str, steps_data: str) -> str:
         "metadata": {
             "total_tasks": steps_dict.get("total_steps", 0),
             "estimated_completion": steps_dict.get("estimated_completion", "Unknown"),
-            "intention": steps_dict.get("intention", "geral")
-        },
-        "tasks": []
+            "intention": steps_dict.get("intention", "geral"),
+            "critical_path": step_task_ids(steps_dict.get("critical_path", []))
+        }
     }
     
     # Converte passos em tarefas estruturadas
-    for step in steps_dict.get("steps", []):
+    for index, step in enumerate(steps):
         task = {
-            "id": str(uuid.uuid4()),
+            "id": task_ids[index],
             "title": step.get("description", "Tarefa sem título"),
-            "description": f"Passo {step.get('step_number', '?')} para alcançar: {goal}",
+            # O goal fica só no nível do plano: editar o goal não altera as tarefas
+            "description": f"Passo {step.get('step_number', '?')} para alcançar o goal do plano",
             "priority": step.get("priority", "média"),
             "category": step.get("category", "Geral"),
             "estimated_time": step.get("estimated_time", "1 day"),
@@ -286,25 +337,118 @@ def structure_tasks_json(goal: str, steps_data: str) -> str:
             ]
         }
         
-        # Adiciona dependências simples (tarefa depende da anterior)
-        if step.get("step_number", 1) > 1:
-            prev_task_index = step.get("step_number", 1) - 2
-            if prev_task_index >= 0 and prev_task_index < len(final_structure["tasks"]):
-                task["dependencies"] = [final_structure["tasks"][prev_task_index]["id"]]
+        # Dependências declaradas no template; sem declaração, a tarefa
+        # depende da anterior
+        step_number = step.get("step_number", 1)
+        task["dependencies"] = step_task_ids(step.get("depends_on", [step_number - 1]))
         
-        final_structure["tasks"].append(task)
+        yield "task", task
+
+def build_structured_plan(
+    goal: str,
+    steps_dict: TaskStepsPlan,
+    on_event: Optional[Callable[[str, dict], None]] = None
+) -> StructuredPlan:
+    """
+    Converte os passos na estrutura final para o preview.
+    
+    Args:
+        goal: O objetivo original
+        steps_dict: Passos gerados por build_task_steps
+        on_event: Callback opcional chamado com cada evento de
+            iter_structured_plan assim que ele é produzido
     
-    return json.dumps(final_structure, ensure_ascii=False, indent=2)
+    Returns:
+        Dicionário estruturado final para preview
+    """
+    
+    final_structure = None
+    for event, data in iter_structured_plan(goal, steps_dict):
+        if on_event is not None:
+            on_event(event, data)
+        final_structure = _collect_plan_event(final_structure, event, data)
+    
+    return final_structure
+
+def _collect_plan_event(plan: Optional[StructuredPlan], event: str, data: dict) -> StructuredPlan:
+    """Acumula um evento de iter_structured_plan no plano final"""
+    if event == "plan_started":
+        return dict(data, tasks=[])
+    plan["tasks"].append(data)
+    return plan
+
+# Ferramentas do agente (adaptadores JSON para tool-calling de LLMs)
+# São expostas como ``BaseTool`` sob os nomes públicos, criadas no primeiro
+# acesso via ``__getattr__`` do módulo (evita importar langchain_core no import)
+def _validate_goal_feasibility(goal: str) -> str:
+    """
+    Valida a viabilidade de um goal e calcula porcentagem de viabilidade.
+    
+    Args:
+        goal: O objetivo a ser analisado
+    
+    Returns:
+        JSON string com análise de viabilidade
+    """
+    return serialization.dumps(analyze_goal_feasibility(goal))
+
+def _generate_task_steps(goal: str, intention: str) -> str:
+    """
+    Gera passos específicos para alcançar o goal baseado na intenção detectada.
+    
+    Args:
+        goal: O objetivo principal
+        intention: A intenção detectada
+    
+    Returns:
+        JSON string com lista de passos
+    """
+    return serialization.dumps(build_task_steps(goal, intention))
+
+def _structure_tasks_json(goal: str, steps_data: str) -> str:
+    """
+    Converte os passos em JSON estruturado final para o preview.
+    
+    Args:
+        goal: O objetivo original
+        steps_data: JSON string com os passos gerados
+    
+    Returns:
+        JSON estruturado final para preview
+    """
+    
+    try:
+        steps_dict = serialization.loads(steps_data)
+    except:
+        steps_dict = {"steps": [], "total_steps": 0}
+    
+    return serialization.dumps(build_structured_plan(goal, steps_dict))
+
+_TOOL_FUNCTIONS = {
+    "validate_goal_feasibility": _validate_goal_feasibility,
+    "generate_task_steps": _generate_task_steps,
+    "structure_tasks_json": _structure_tasks_json,
+}
+
+def __getattr__(name: str):
+    """Cria as ferramentas sob demanda (``from task_generator_agent import validate_goal_feasibility``)"""
+    if name not in _TOOL_FUNCTIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from langchain_core.tools import tool
+    
+    # Em uma corrida entre threads a ferramenta pode ser criada duas vezes (equivalentes)
+    globals()[name] = tool(name)(_TOOL_FUNCTIONS[name])
+    return globals()[name]
 
 # Nós do agente
 def intention_validation_node(state: TaskGeneratorState):
     """Nó para validação de intenção e cálculo de viabilidade"""
     
-    print(f"🧠 Analisando intenção para goal: '{state['goal']}'...")
+    from langchain_core.messages import AIMessage
     
     # Executa validação
-    validation_result = validate_goal_feasibility(state["goal"])
-    intention_analysis = json.loads(validation_result)
+    intention_analysis = analyze_goal_feasibility(state["goal"])
     
     confidence_score = intention_analysis["feasibility_score"]
     
@@ -322,16 +466,14 @@ def intention_validation_node(state: TaskGeneratorState):
 def task_processing_node(state: TaskGeneratorState):
     """Nó para processamento dos passos da tarefa"""
     
-    print(f"⚙️ Processando passos para a intenção: {state['intention_analysis']['detected_intention']}")
+    from langchain_core.messages import AIMessage
     
     # Gera passos baseado na intenção
-    steps_result = generate_task_steps(
+    task_steps = build_task_steps(
         state["goal"], 
         state["intention_analysis"]["detected_intention"]
     )
     
-    task_steps = json.loads(steps_result)
-    
     return {
         "messages": [AIMessage(content=f"✅ {task_steps['total_steps']} passos gerados com sucesso")],
         "task_steps": task_steps,
@@ -341,15 +483,55 @@ def task_processing_node(state: TaskGeneratorState):
 def json_structuring_node(state: TaskGeneratorState):
     """Nó para estruturação do JSON final"""
     
-    print(f"📄 Estruturando JSON final para {len(state['task_steps']['steps'])} tarefas...")
+    from langchain_core.messages import AIMessage
+    from langgraph.config import get_stream_writer
     
-    # Estrutura JSON final
-    structured_result = structure_tasks_json(
+    # Estrutura JSON final; cada tarefa é emitida no stream "custom" assim que
+    # fica pronta (no-op quando o grafo não está em modo streaming)
+    stream_writer = get_stream_writer()
+    structured_json = build_structured_plan(
         state["goal"],
-        json.dumps(state["task_steps"])
+        state["task_steps"],
+        on_event=lambda event, data: stream_writer({"event": event, "data": data})
     )
     
-    structured_json = json.loads(structured_result)
+    return {
+        "messages": [AIMessage(content="✅ JSON estruturado criado com sucesso")],
+        "structured_json": structured_json,
+        "status": TaskStatus.COMPLETED
+    }
+
+# Variantes assíncronas dos nós
+# Os nós são puramente CPU-bound (sem I/O), então executá-los inline no event
+# loop evita que o ``ainvoke`` despache cada nó síncrono para uma thread do
+# executor. Assim milhares de goals podem ficar em voo em um único loop.
+async def aintention_validation_node(state: TaskGeneratorState):
+    """Versão assíncrona de intention_validation_node"""
+    return intention_validation_node(state)
+
+async def atask_processing_node(state: TaskGeneratorState):
+    """Versão assíncrona de task_processing_node"""
+    return task_processing_node(state)
+
+async def ajson_structuring_node(state: TaskGeneratorState):
+    """
+    Versão assíncrona de json_structuring_node
+    
+    Cede o event loop após cada tarefa, para que ``astream`` entregue as
+    tarefas ao consumidor à medida que são montadas.
+    """
+    
+    import asyncio
+    
+    from langchain_core.messages import AIMessage
+    from langgraph.config import get_stream_writer
+    
+    stream_writer = get_stream_writer()
+    structured_json = None
+    for event, data in iter_structured_plan(state["goal"], state["task_steps"]):
+        stream_writer({"event": event, "data": data})
+        structured_json = _collect_plan_event(structured_json, event, data)
+        await asyncio.sleep(0)
     
     return {
         "messages": [AIMessage(content="✅ JSON estruturado criado com sucesso")],
@@ -360,6 +542,8 @@ def json_structuring_node(state: TaskGeneratorState):
 def route_processing(state: TaskGeneratorState):
     """Roteamento baseado no status atual"""
     
+    from langgraph.graph import END
+    
     if state["status"] == TaskStatus.ANALYZING:
         return "intention_validation"
     elif state["status"] == TaskStatus.PROCESSING:
@@ -369,15 +553,83 @@ def route_processing(state: TaskGeneratorState):
     else:
         return END
 
-def create_task_generator_graph():
-    """Cria o grafo do agente gerador de tarefas"""
+@contextmanager
+def _observe_node(name: str, state: TaskGeneratorState, configurable: dict):
+    """Abre o span de telemetria e a medição do profiler configurados para o nó"""
+    telemetry = configurable.get("telemetry")
+    profiler = configurable.get("profiler")
+    
+    with ExitStack() as stack:
+        span = None
+        if telemetry is not None:
+            span = stack.enter_context(
+                telemetry.span(name, state["session_id"], configurable.get("parent_span_id"))
+            )
+        # O profiler fica dentro do span para não medir o custo da telemetria
+        if profiler is not None:
+            stack.enter_context(profiler.node(name))
+        yield span
+
+def _instrumented_node(name: str, func, afunc):
+    """
+    Envolve um nó com telemetria e profiling
+    
+    Ambos chegam por ``config["configurable"]`` (``telemetry`` e
+    ``profiler``), então o mesmo grafo compilado atende agentes com e sem
+    instrumentação.
+    """
+    
+    from langchain_core.runnables import RunnableLambda
+    
+    def run(state: TaskGeneratorState, config):
+        configurable = config.get("configurable", {})
+        if "telemetry" not in configurable and "profiler" not in configurable:
+            return func(state)
+        with _observe_node(name, state, configurable) as span:
+            update = func(state)
+        if span is not None:
+            span.set(message=update["messages"][-1].content)
+        return update
+    
+    async def arun(state: TaskGeneratorState, config):
+        configurable = config.get("configurable", {})
+        if "telemetry" not in configurable and "profiler" not in configurable:
+            return await afunc(state)
+        with _observe_node(name, state, configurable) as span:
+            update = await afunc(state)
+        if span is not None:
+            span.set(message=update["messages"][-1].content)
+        return update
+    
+    return RunnableLambda(run, afunc=arun, name=name)
+
+def create_task_generator_graph(checkpointer=None):
+    """
+    Cria o grafo do agente gerador de tarefas
+    
+    Args:
+        checkpointer: Checkpointer opcional (ver checkpointing.py); com ele,
+            o estado de cada sessão é gravado após cada nó
+    """
+    
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import StateGraph, START, END
     
     builder = StateGraph(TaskGeneratorState)
     
-    # Adiciona nós
-    builder.add_node("intention_validation", intention_validation_node)
-    builder.add_node("task_processing", task_processing_node)
-    builder.add_node("json_structuring", json_structuring_node)
+    # Adiciona nós (invoke usa a versão síncrona, ainvoke/astream a assíncrona)
+    builder.add_node(
+        "intention_validation",
+        _instrumented_node("intention_validation", intention_validation_node, aintention_validation_node)
+    )
+    builder.add_node(
+        "task_processing",
+        _instrumented_node("task_processing", task_processing_node, atask_processing_node)
+    )
+    builder.add_node(
+        "json_structuring",
+        _instrumented_node("json_structuring", json_structuring_node, ajson_structuring_node)
+    )
     
     # Adiciona arestas
     builder.add_edge(START, "intention_validation")
@@ -385,87 +637,717 @@ def create_task_generator_graph():
     builder.add_edge("task_processing", "json_structuring")
     builder.add_edge("json_structuring", END)
     
-    return builder.compile()
+    return builder.compile(checkpointer=checkpointer)
+
+# Grafo compilado compartilhado pelas instâncias sem checkpointer (o grafo é
+# imutável e não guarda estado entre execuções)
+_shared_graph = None
+_shared_graph_lock = threading.Lock()
+
+def get_task_generator_graph():
+    """Retorna o grafo compilado compartilhado, compilando-o no primeiro uso"""
+    global _shared_graph
+    if _shared_graph is None:
+        with _shared_graph_lock:
+            if _shared_graph is None:
+                _shared_graph = create_task_generator_graph()
+    return _shared_graph
 
 # Classe principal do agente
 class TaskGeneratorAgent:
     """Agente gerador de tarefas com observabilidade LangSmith"""
     
-    def __init__(self):
-        self.graph = create_task_generator_graph()
-        self.langsmith_client = None
+    def __init__(
+        self,
+        cache: Optional[PlanCache] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_durability: str = "async",
+        telemetry: Optional[Telemetry] = None,
+        profiler: Optional[NodeProfiler] = None,
+        single_flight: bool = True
+    ):
+        """
+        Args:
+            cache: Cache opcional de resultados (MemoryPlanCache ou
+                SQLitePlanCache); acertos pulam a execução do grafo
+            checkpoint_path: Arquivo SQLite para checkpoints por sessão;
+                permite retomar execuções interrompidas com resume_tasks
+            checkpoint_durability: Quando gravar cada checkpoint
+                ("sync", "async" ou "exit", ver checkpointing.py)
+            telemetry: Spans por requisição e por nó (ver telemetry.py);
+                o padrão é silencioso e não emite nada
+            profiler: Profiling opcional de tempo, CPU e memória por nó
+                (ver profiling.py); cobre generate_tasks, agenerate_tasks e
+                os lotes em threads
+            single_flight: Requisições simultâneas para o mesmo goal
+                normalizado compartilham uma única execução do grafo (ver
+                single_flight.py); cada uma recebe ids próprios. Desativado
+                com checkpointing, que precisa de uma execução por sessão
+        """
+        self.checkpointer = None
+        self.checkpoint_durability = checkpoint_durability
+        if checkpoint_path is not None:
+            from checkpointing import CHECKPOINT_DURABILITY_MODES, create_sqlite_checkpointer
+            
+            if checkpoint_durability not in CHECKPOINT_DURABILITY_MODES:
+                raise ValueError(f"checkpoint_durability inválido: {checkpoint_durability!r}")
+            self.checkpointer = create_sqlite_checkpointer(checkpoint_path)
         
-        # Inicializa LangSmith se configurado
-        try:
-            self.langsmith_client = Client()
-            print("📊 LangSmith configurado para observabilidade")
-        except:
-            print("⚠️ LangSmith não configurado (usar variáveis de ambiente)")
+        # Sem checkpointer, o grafo compartilhado é compilado no primeiro uso
+        self._graph = create_task_generator_graph(self.checkpointer) if self.checkpointer else None
+        self.cache = cache
+        self.telemetry = telemetry or Telemetry.quiet()
+        self.profiler = profiler
+        use_single_flight = single_flight and self.checkpointer is None
+        self._flight = SingleFlight() if use_single_flight else None
+        self._aflight = AsyncSingleFlight() if use_single_flight else None
+        # Pool de processos de generate_tasks_batch, reaproveitado entre chamadas
+        self._batch_pool = None
+        self._batch_pool_config = None
+        self._batch_pool_lock = threading.Lock()
+        configure_langsmith_env()
+    
+    @property
+    def graph(self):
+        """Grafo compilado usado por esta instância"""
+        return self._graph if self._graph is not None else get_task_generator_graph()
     
-    def generate_tasks(self, goal: str) -> dict:
+    @graph.setter
+    def graph(self, graph):
+        self._graph = graph
+    
+    def generate_tasks(self, goal: str, session_id: Optional[str] = None) -> dict:
         """
         Gera tarefas baseado em um goal específico
         
         Args:
             goal: O objetivo para gerar tarefas
+            session_id: Id da sessão (gerado se omitido); com checkpointing,
+                é a chave usada por resume_tasks
             
         Returns:
             Dicionário com as tarefas estruturadas
         """
         
-        session_id = str(uuid.uuid4())
+        session_id = session_id or str(uuid.uuid4())
         
-        print(f"\n🚀 Iniciando geração de tarefas para: '{goal}'")
-        print(f"🆔 Session ID: {session_id}")
+        try:
+            with self.telemetry.span("generate_tasks", session_id, goal=goal) as span:
+                # Executa o grafo (ou reaproveita o cache)
+                result = self._run_pipeline(goal, session_id, span.span_id)
+                self._record_result(span, result)
+            
+            return result["structured_json"]
+            
+        except Exception as e:
+            return {"error": str(e)}
+    
+    async def agenerate_tasks(self, goal: str, session_id: Optional[str] = None) -> dict:
+        """
+        Versão assíncrona de generate_tasks para servidores async
         
-        # Estado inicial
-        initial_state = {
-            "messages": [HumanMessage(content=f"Gerar tarefas para: {goal}")],
-            "goal": goal,
-            "intention_analysis": {},
-            "task_steps": [],
-            "structured_json": {},
-            "status": TaskStatus.ANALYZING,
-            "confidence_score": 0.0,
-            "session_id": session_id
-        }
+        Executa o grafo via ``ainvoke`` com os nós assíncronos, sem ocupar uma
+        thread por requisição.
+        
+        Args:
+            goal: O objetivo para gerar tarefas
+            session_id: Id da sessão (gerado se omitido)
+            
+        Returns:
+            Dicionário com as tarefas estruturadas
+        """
+        
+        session_id = session_id or str(uuid.uuid4())
         
         try:
-            # Executa o grafo
-            result = self.graph.invoke(initial_state)
+            with self.telemetry.span("agenerate_tasks", session_id, goal=goal) as span:
+                result = await self._arun_pipeline(goal, session_id, span.span_id)
+                self._record_result(span, result)
+            
+            return result["structured_json"]
+            
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def stream_tasks(self, goal: str, session_id: Optional[str] = None) -> Iterator[dict]:
+        """
+        Gera tarefas emitindo o progresso de cada etapa assim que fica pronto
+        
+        Eventos (``{"event": ..., "data": ...}``), nesta ordem:
+            - ``intention_analysis``: análise de viabilidade e intenção
+            - ``steps_generated``: total de passos e tempo estimado
+            - ``plan_started``: cabeçalho do plano (id, metadata) sem tarefas
+            - ``task``: uma tarefa estruturada, emitida assim que é montada
+            - ``completed``: resumo final (id do plano, sessão, score)
+            - ``error``: em caso de falha, encerra o stream
+        
+        Args:
+            goal: O objetivo para gerar tarefas
+            session_id: Id da sessão (gerado se omitido)
+            
+        Yields:
+            Eventos de progresso da geração
+        """
+        
+        session_id = session_id or str(uuid.uuid4())
+        
+        try:
+            cached = self._lookup_cache(goal)
+            if cached is not None:
+                yield from self._stream_from_cache(goal, session_id, cached)
+                return
+            
+            collected = {}
+            for mode, chunk in self.graph.stream(
+                self._build_initial_state(goal, session_id),
+                stream_mode=["updates", "custom"],
+                **self._run_options(session_id)
+            ):
+                yield from self._stream_events(mode, chunk, collected, session_id)
+            
+            self._store_in_cache(goal, collected)
+            
+        except Exception as e:
+            yield {"event": "error", "data": {"error": str(e)}}
+    
+    async def astream_tasks(self, goal: str, session_id: Optional[str] = None) -> AsyncIterator[dict]:
+        """
+        Versão assíncrona de stream_tasks, baseada em ``graph.astream``
+        
+        Args:
+            goal: O objetivo para gerar tarefas
+            session_id: Id da sessão (gerado se omitido)
+            
+        Yields:
+            Os mesmos eventos de stream_tasks
+        """
+        
+        session_id = session_id or str(uuid.uuid4())
+        
+        if self.checkpointer is not None:
+            # O SqliteSaver é síncrono: consome o stream síncrono em uma thread
+            import asyncio
+            
+            events = self.stream_tasks(goal, session_id)
+            while (event := await asyncio.to_thread(next, events, None)) is not None:
+                yield event
+            return
+        
+        try:
+            cached = self._lookup_cache(goal)
+            if cached is not None:
+                for event in self._stream_from_cache(goal, session_id, cached):
+                    yield event
+                return
+            
+            collected = {}
+            async for mode, chunk in self.graph.astream(
+                self._build_initial_state(goal, session_id),
+                stream_mode=["updates", "custom"],
+                **self._run_options(session_id)
+            ):
+                for event in self._stream_events(mode, chunk, collected, session_id):
+                    yield event
             
-            # Log de observabilidade
-            if self.langsmith_client:
-                self._log_to_langsmith(goal, result)
+            self._store_in_cache(goal, collected)
             
-            print(f"✅ Geração concluída com sucesso!")
-            print(f"📊 Score de confiança: {result['confidence_score']:.0%}")
-            print(f"📝 Tarefas criadas: {len(result['structured_json'].get('tasks', []))}")
+        except Exception as e:
+            yield {"event": "error", "data": {"error": str(e)}}
+    
+    def generate_tasks_batch(
+        self,
+        goals: List[str],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ) -> List[dict]:
+        """
+        Gera tarefas para vários goals em paralelo
+        
+        O pipeline é CPU-bound, então por padrão os goals são distribuídos em um
+        pool de processos (cada worker compila o próprio grafo uma única vez).
+        O pool é criado na primeira chamada e reaproveitado nas seguintes (ver
+        close); os workers recebem o classificador semântico em uso e devolvem
+        spans e amostras de profiling à telemetria e ao profiler desta
+        instância. Com ``use_processes=False`` é usado um pool de threads sobre
+        o grafo desta instância, útil quando os nós passarem a fazer I/O.
+        
+        Args:
+            goals: Lista de objetivos para gerar tarefas
+            max_workers: Limite de goals processados simultaneamente
+                (padrão: número de CPUs)
+            use_processes: Usa processos em vez de threads
+            
+        Returns:
+            Lista na mesma ordem de ``goals``; goals que falharem retornam
+            ``{"error": "..."}`` sem interromper os demais
+        """
+        
+        if not goals:
+            return []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        if not use_processes:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(goals))) as executor:
+                return list(executor.map(self._generate_for_batch, goals))
+        
+        # Acertos de cache são resolvidos aqui; só os demais vão para o pool
+        results: List[Optional[dict]] = [None] * len(goals)
+        pending = []
+        for index, goal in enumerate(goals):
+            cached = self._lookup_cache(goal)
+            if cached is not None:
+                results[index] = self._state_from_cache(goal, str(uuid.uuid4()), cached)["structured_json"]
+            else:
+                pending.append(index)
+        
+        if pending:
+            executor = self._get_batch_pool(max_workers)
+            # Agrupa goals por worker para amortizar o custo de IPC
+            chunksize = max(1, len(pending) // (max_workers * 4))
+            outcomes = executor.map(_run_in_batch_worker, [goals[i] for i in pending], chunksize=chunksize)
+            version = _results_version()
+            for index, outcome in zip(pending, outcomes):
+                self.telemetry.ingest(outcome.pop("telemetry", ()))
+                profile = outcome.pop("profile", None)
+                if profile is not None and self.profiler is not None:
+                    self.profiler.merge(profile)
+                if "error" not in outcome:
+                    # Só entra no cache o que foi gerado com a mesma configuração da chave
+                    if outcome["version"] == version:
+                        self._store_in_cache(goals[index], outcome)
+                    outcome = outcome["structured_json"]
+                results[index] = outcome
+        
+        return results
+    
+    def close(self) -> None:
+        """Encerra o pool de processos de generate_tasks_batch, se houver"""
+        with self._batch_pool_lock:
+            pool, self._batch_pool, self._batch_pool_config = self._batch_pool, None, None
+        if pool is not None:
+            pool.shutdown()
+    
+    def _get_batch_pool(self, max_workers: int):
+        """
+        Pool de processos do lote; é recriado só se o número de workers ou a
+        configuração repassada aos workers mudar
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        config = _batch_worker_config(self)
+        key = (max_workers, _results_version(), self.telemetry.enabled, self.telemetry.sample_rate,
+               None if self.profiler is None else self.profiler.trace_memory)
+        with self._batch_pool_lock:
+            if self._batch_pool is not None and self._batch_pool_config == key:
+                return self._batch_pool
+            previous = self._batch_pool
+            self._batch_pool = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_batch_worker, initargs=(config,)
+            )
+            self._batch_pool_config = key
+        if previous is not None:
+            previous.shutdown(wait=False)
+        return self._batch_pool
+    
+    def resume_tasks(self, session_id: str) -> dict:
+        """
+        Retoma uma sessão interrompida a partir do último nó gravado
+        
+        Requer ``checkpoint_path``. Se a sessão já tiver terminado, devolve o
+        resultado gravado sem reexecutar nenhum nó.
+        
+        Args:
+            session_id: Id da sessão passada a generate_tasks/stream_tasks
+            
+        Returns:
+            Dicionário com as tarefas estruturadas
+        """
+        
+        if self.checkpointer is None:
+            return {"error": "Checkpointing desabilitado (use checkpoint_path)"}
+        
+        try:
+            with self.telemetry.span("resume_tasks", session_id) as span:
+                options = self._run_options(session_id, span.span_id)
+                snapshot = self.graph.get_state(options["config"])
+                if not snapshot.values:
+                    return {"error": f"Sessão sem checkpoint: {session_id}"}
+                
+                span.set(resumed_from=list(snapshot.next))
+                if snapshot.next:
+                    result = self.graph.invoke(None, **options)
+                    self._store_in_cache(result["goal"], result)
+                else:
+                    result = snapshot.values
+                self._record_result(span, result)
             
             return result["structured_json"]
             
         except Exception as e:
-            print(f"❌ Erro durante geração: {e}")
             return {"error": str(e)}
     
-    def _log_to_langsmith(self, goal: str, result: dict):
-        """Log de observabilidade para LangSmith"""
+    def update_tasks(self, previous_plan: dict, new_goal: str, session_id: Optional[str] = None) -> dict:
+        """
+        Replaneja após a edição de um goal, devolvendo só o que mudou
+        
+        Não executa o grafo: a análise é uma varredura de palavras-chave e os
+        passos vêm do template (ou do cache). Com a mesma intenção, cada tarefa
+        mantém o id da tarefa na mesma posição; tarefas com o mesmo título
+        mantêm o id mesmo se a intenção mudar. O id e o ``created_at`` do plano
+        são preservados.
+        
+        Args:
+            previous_plan: Plano retornado por generate_tasks (ou o resultado
+                de apply_patch de uma atualização anterior)
+            new_goal: O goal editado
+            session_id: Id da sessão (gerado se omitido)
+            
+        Returns:
+            ``{"id", "goal", "intention_changed", "patch", "stats"}``, em que
+            ``patch`` é a lista de operações JSON Patch (RFC 6902) sobre o
+            plano anterior (aplicável com plan_diff.apply_patch)
+        """
+        
+        session_id = session_id or str(uuid.uuid4())
+        
         try:
-            # Cria entrada de log estruturada
-            log_data = {
-                "goal": goal,
-                "session_id": result["session_id"],
-                "confidence_score": result["confidence_score"],
-                "intention": result["intention_analysis"].get("detected_intention", "unknown"),
-                "tasks_generated": len(result["structured_json"].get("tasks", [])),
-                "status": result["status"],
-                "timestamp": datetime.now().isoformat()
-            }
+            with self.telemetry.span("update_tasks", session_id, goal=new_goal) as span:
+                new_plan, stats = self._replan(previous_plan, new_goal)
+                # Sem nenhuma tarefa em comum, o documento inteiro é menor que o patch
+                if stats["tasks_kept"] == 0:
+                    patch = [{"op": "replace", "path": "", "value": new_plan}]
+                else:
+                    patch = diff(previous_plan, new_plan)
+                intention_changed = new_plan["metadata"]["intention"] != previous_plan["metadata"].get("intention")
+                span.set(intention_changed=intention_changed, patch_ops=len(patch), **stats)
             
-            print(f"📊 Log enviado para LangSmith: {log_data}")
+            return {
+                "id": new_plan["id"],
+                "goal": new_goal,
+                "intention_changed": intention_changed,
+                "patch": patch,
+                "stats": stats
+            }
             
         except Exception as e:
-            print(f"⚠️ Erro ao logar no LangSmith: {e}")
+            return {"error": str(e)}
+    
+    def cache_stats(self) -> dict:
+        """Contadores do cache de resultados (vazio se não houver cache)"""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def single_flight_stats(self) -> dict:
+        """
+        Execuções do grafo (``executed``) e requisições que aguardaram uma
+        execução já em andamento para o mesmo goal (``coalesced``), somando os
+        caminhos síncrono e assíncrono (vazio se desativado)
+        """
+        if self._flight is None:
+            return {}
+        sync_stats, async_stats = self._flight.stats(), self._aflight.stats()
+        return {key: sync_stats[key] + async_stats[key] for key in sync_stats}
+    
+    def _generate_for_batch(self, goal: str) -> dict:
+        """Executa um goal do lote sem logs por goal, isolando falhas"""
+        try:
+            return self._run_pipeline(goal, str(uuid.uuid4()))["structured_json"]
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _run_pipeline(self, goal: str, session_id: str, parent_span_id: Optional[str] = None) -> dict:
+        """Executa o grafo compilado para um goal (ou usa o cache) e retorna o estado final"""
+        cached = self._lookup_cache(goal)
+        if cached is not None:
+            return self._state_from_cache(goal, session_id, cached)
+        
+        if self._flight is None:
+            return self._invoke_graph(goal, session_id, parent_span_id)
+        
+        result, shared = self._flight.do(
+            self._result_key(goal), lambda: self._invoke_graph(goal, session_id, parent_span_id)
+        )
+        # Quem aguardou recebe uma cópia do resultado, com plano (ids) próprio
+        return self._state_from_cache(goal, session_id, copy.deepcopy(result)) if shared else result
+    
+    def _invoke_graph(self, goal: str, session_id: str, parent_span_id: Optional[str] = None) -> dict:
+        """Executa o grafo compilado e guarda o resultado no cache"""
+        with self.profiler.run() if self.profiler else nullcontext():
+            result = self.graph.invoke(
+                self._build_initial_state(goal, session_id),
+                **self._run_options(session_id, parent_span_id)
+            )
+        self._store_in_cache(goal, result)
+        return result
+    
+    async def _arun_pipeline(self, goal: str, session_id: str, parent_span_id: Optional[str] = None) -> dict:
+        """Versão assíncrona de _run_pipeline"""
+        if self.checkpointer is not None:
+            # O SqliteSaver não tem API assíncrona; executa o caminho síncrono em uma thread
+            import asyncio
+            
+            return await asyncio.to_thread(self._run_pipeline, goal, session_id, parent_span_id)
+        
+        cached = self._lookup_cache(goal)
+        if cached is not None:
+            return self._state_from_cache(goal, session_id, cached)
+        
+        if self._aflight is None:
+            return await self._ainvoke_graph(goal, session_id, parent_span_id)
+        
+        result, shared = await self._aflight.do(
+            self._result_key(goal), lambda: self._ainvoke_graph(goal, session_id, parent_span_id)
+        )
+        return self._state_from_cache(goal, session_id, copy.deepcopy(result)) if shared else result
+    
+    async def _ainvoke_graph(self, goal: str, session_id: str, parent_span_id: Optional[str] = None) -> dict:
+        """Versão assíncrona de _invoke_graph"""
+        with self.profiler.run() if self.profiler else nullcontext():
+            result = await self.graph.ainvoke(
+                self._build_initial_state(goal, session_id),
+                **self._run_options(session_id, parent_span_id)
+            )
+        self._store_in_cache(goal, result)
+        return result
+    
+    def _replan(self, previous_plan: dict, new_goal: str) -> Tuple[dict, dict]:
+        """Gera o plano do goal editado reaproveitando ids, id e data do plano anterior"""
+        cached = self._lookup_cache(new_goal)
+        if cached is not None:
+            task_steps = dict(cached["task_steps"], goal=new_goal)
+        else:
+            intention_analysis = analyze_goal_feasibility(new_goal)
+            task_steps = build_task_steps(new_goal, intention_analysis["detected_intention"])
+            self._store_in_cache(new_goal, {"intention_analysis": intention_analysis, "task_steps": task_steps})
+        
+        plan = build_structured_plan(new_goal, task_steps)
+        previous_tasks = previous_plan.get("tasks", [])
+        same_intention = plan["metadata"]["intention"] == previous_plan["metadata"].get("intention")
+        stable_ids = _stable_task_ids(previous_tasks, plan["tasks"], same_intention)
+        
+        for task in plan["tasks"]:
+            task["id"] = stable_ids[task["id"]]
+            task["dependencies"] = [stable_ids[d] for d in task["dependencies"]]
+        plan["metadata"]["critical_path"] = [stable_ids[t] for t in plan["metadata"].get("critical_path", [])]
+        plan["id"] = previous_plan["id"]
+        plan["created_at"] = previous_plan["created_at"]
+        
+        previous_by_id = {task["id"]: task for task in previous_tasks}
+        kept = [task for task in plan["tasks"] if task["id"] in previous_by_id]
+        stats = {
+            "tasks_kept": len(kept),
+            "tasks_changed": sum(task != previous_by_id[task["id"]] for task in kept),
+            "tasks_added": len(plan["tasks"]) - len(kept),
+            "tasks_removed": len(previous_tasks) - len(kept)
+        }
+        return plan, stats
+    
+    def _run_options(self, session_id: str, parent_span_id: Optional[str] = None) -> dict:
+        """
+        Argumentos de invoke/stream: a sessão vira o thread_id do checkpoint e
+        a telemetria e o profiler seguem para os nós via ``configurable``
+        """
+        options = {}
+        configurable = {}
+        if self.telemetry.enabled:
+            configurable["telemetry"] = self.telemetry
+            configurable["parent_span_id"] = parent_span_id
+        if self.profiler is not None:
+            configurable["profiler"] = self.profiler
+        if self.checkpointer is not None:
+            configurable["thread_id"] = session_id
+            options["durability"] = self.checkpoint_durability
+        if configurable:
+            options["config"] = {"configurable": configurable}
+        return options
+    
+    def _record_result(self, span, result: dict):
+        """Anexa o resumo da geração ao span da requisição"""
+        span.set(
+            confidence_score=result["confidence_score"],
+            intention=result["intention_analysis"].get("detected_intention", "unknown"),
+            tasks_generated=len(result["structured_json"].get("tasks", []))
+        )
+    
+    def _stream_events(self, mode: str, chunk: dict, collected: dict, session_id: str) -> Iterator[dict]:
+        """Traduz os chunks de ``graph.stream`` nos eventos de stream_tasks"""
+        
+        # Eventos "custom" já vêm no formato final (emitidos pelo nó de estruturação)
+        if mode == "custom":
+            yield chunk
+            return
+        
+        for node, update in chunk.items():
+            # O que vai para o cache é uma cópia: o consumidor pode alterar os eventos
+            if node == "intention_validation":
+                collected["intention_analysis"] = copy.deepcopy(update["intention_analysis"])
+                yield {"event": "intention_analysis", "data": update["intention_analysis"]}
+            elif node == "task_processing":
+                collected["task_steps"] = copy.deepcopy(update["task_steps"])
+                yield {"event": "steps_generated", "data": {
+                    "total_steps": update["task_steps"]["total_steps"],
+                    "estimated_completion": update["task_steps"]["estimated_completion"]
+                }}
+            elif node == "json_structuring":
+                yield self._completed_event(update["structured_json"], collected, session_id)
+    
+    def _stream_from_cache(self, goal: str, session_id: str, cached: dict) -> Iterator[dict]:
+        """Emite os mesmos eventos de stream_tasks a partir de um acerto de cache"""
+        
+        intention_analysis = cached["intention_analysis"]
+        task_steps = dict(cached["task_steps"], goal=goal)
+        
+        yield {"event": "intention_analysis", "data": intention_analysis}
+        yield {"event": "steps_generated", "data": {
+            "total_steps": task_steps["total_steps"],
+            "estimated_completion": task_steps["estimated_completion"]
+        }}
+        
+        plan_header = None
+        for event, data in iter_structured_plan(goal, task_steps):
+            plan_header = plan_header or data
+            yield {"event": event, "data": data}
+        
+        yield self._completed_event(plan_header, {"intention_analysis": intention_analysis}, session_id)
+    
+    def _completed_event(self, plan: dict, collected: dict, session_id: str) -> dict:
+        """Evento final do stream, sem repetir as tarefas já emitidas"""
+        return {"event": "completed", "data": {
+            "id": plan["id"],
+            "session_id": session_id,
+            "total_tasks": plan["metadata"]["total_tasks"],
+            "confidence_score": collected["intention_analysis"]["feasibility_score"]
+        }}
+    
+    def _result_key(self, goal: str) -> str:
+        """Chave do resultado de um goal (cache e single-flight)"""
+        return plan_cache_key(goal, _results_version())
+    
+    def _lookup_cache(self, goal: str) -> Optional[dict]:
+        """Busca a análise e os passos já calculados para o goal"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self._result_key(goal))
+    
+    def _store_in_cache(self, goal: str, result: dict):
+        """Guarda a parte determinística do resultado (sem ids nem timestamps)"""
+        if self.cache is None:
+            return
+        self.cache.put(self._result_key(goal), {
+            "intention_analysis": result["intention_analysis"],
+            "task_steps": result["task_steps"]
+        })
+    
+    def _state_from_cache(self, goal: str, session_id: str, cached: dict) -> dict:
+        """Reconstrói o estado final a partir do cache, com ids e timestamp novos"""
+        intention_analysis = cached["intention_analysis"]
+        task_steps = dict(cached["task_steps"], goal=goal)
+        
+        return {
+            "messages": [],
+            "goal": goal,
+            "intention_analysis": intention_analysis,
+            "task_steps": task_steps,
+            "structured_json": build_structured_plan(goal, task_steps),
+            "status": TaskStatus.COMPLETED,
+            "confidence_score": intention_analysis["feasibility_score"],
+            "session_id": session_id
+        }
+    
+    def _build_initial_state(self, goal: str, session_id: str) -> dict:
+        """Monta o estado inicial do grafo para um goal"""
+        from langchain_core.messages import HumanMessage
+        
+        return {
+            "messages": [HumanMessage(content=f"Gerar tarefas para: {goal}")],
+            "goal": goal,
+            "intention_analysis": {},
+            "task_steps": {},
+            "structured_json": {},
+            "status": TaskStatus.ANALYZING,
+            "confidence_score": 0.0,
+            "session_id": session_id
+        }
+
+def _stable_task_ids(previous_tasks: list, new_tasks: list, same_intention: bool) -> dict:
+    """
+    Mapeia o id gerado de cada tarefa nova para o id a manter: primeiro por
+    título igual, depois (com a mesma intenção) pela posição no plano
+    """
+    available = {task["id"] for task in previous_tasks}
+    by_title = {}
+    for task in previous_tasks:
+        by_title.setdefault(task["title"], task["id"])
+    
+    mapping = {}
+    for task in new_tasks:
+        previous_id = by_title.get(task["title"])
+        if previous_id in available:
+            mapping[task["id"]] = previous_id
+            available.discard(previous_id)
+    
+    for index, task in enumerate(new_tasks):
+        if task["id"] in mapping:
+            continue
+        if same_intention and index < len(previous_tasks) and previous_tasks[index]["id"] in available:
+            mapping[task["id"]] = previous_tasks[index]["id"]
+            available.discard(previous_tasks[index]["id"])
+        else:
+            mapping[task["id"]] = task["id"]
+    return mapping
+
+# Worker do pool de processos usado por generate_tasks_batch
+_batch_worker_agent = None
+
+def _batch_worker_config(agent: "TaskGeneratorAgent") -> dict:
+    """O que os workers precisam para reproduzir o agente pai (enviado uma vez por processo)"""
+    return {
+        "semantic_classifier": get_semantic_classifier(),
+        "telemetry_sample_rate": agent.telemetry.sample_rate if agent.telemetry.enabled else None,
+        "profiler_trace_memory": None if agent.profiler is None else agent.profiler.trace_memory,
+    }
+
+def _init_batch_worker(config: dict):
+    """Cria um agente por processo do pool (grafo compilado uma única vez)"""
+    global _batch_worker_agent
+    from telemetry import MemorySink
+    
+    set_semantic_classifier(config["semantic_classifier"])
+    telemetry = None
+    if config["telemetry_sample_rate"] is not None:
+        # Os registros voltam ao processo pai junto com cada resultado
+        telemetry = Telemetry([MemorySink()], sample_rate=config["telemetry_sample_rate"])
+    profiler = None
+    if config["profiler_trace_memory"] is not None:
+        profiler = NodeProfiler(trace_memory=config["profiler_trace_memory"])
+    _batch_worker_agent = TaskGeneratorAgent(telemetry=telemetry, profiler=profiler, single_flight=False)
+
+def _run_in_batch_worker(goal: str) -> dict:
+    """Processa um goal dentro de um worker do pool, isolando falhas"""
+    agent = _batch_worker_agent
+    try:
+        result = agent._run_pipeline(goal, str(uuid.uuid4()))
+        # Devolve também a parte cacheável, para o processo pai alimentar o cache
+        outcome = {
+            "structured_json": result["structured_json"],
+            "intention_analysis": result["intention_analysis"],
+            "task_steps": result["task_steps"],
+            "version": _results_version()
+        }
+    except Exception as e:
+        outcome = {"error": str(e)}
+    
+    if agent.telemetry.enabled:
+        agent.telemetry.flush()
+        records = agent.telemetry.sinks[0].records
+        outcome["telemetry"] = list(records)
+        records.clear()
+    if agent.profiler is not None:
+        outcome["profile"] = agent.profiler.export_samples()
+        agent.profiler.reset()
+    return outcome
 
 # Demonstração prática
 def demonstrate_agent():
@@ -485,21 +1367,23 @@ def demonstrate_agent():
         "Implementar sistema de gestão de tarefas"
     ]
     
-    for i, goal in enumerate(test_goals, 1):
-        print(f"\n--- EXEMPLO {i} ---")
-        
-        # Gera tarefas
-        result = agent.generate_tasks(goal)
+    # Processa todos os goals em paralelo, mantendo a ordem de entrada
+    results = agent.generate_tasks_batch(test_goals)
+    
+    for i, (goal, result) in enumerate(zip(test_goals, results), 1):
+        print(f"\n--- EXEMPLO {i}: {goal} ---")
         
         if "error" not in result:
             print(f"\n📋 JSON ESTRUTURADO GERADO:")
-            print(json.dumps(result, ensure_ascii=False, indent=2))
+            print(serialization.dumps(result, pretty=True))
             
             # Mostra resumo das tarefas
             print(f"\n📊 RESUMO:")
             print(f"Total de tarefas: {len(result.get('tasks', []))}")
             print(f"Tempo estimado: {result.get('metadata', {}).get('estimated_completion', 'N/A')}")
             print(f"Intenção detectada: {result.get('metadata', {}).get('intention', 'N/A')}")
+        else:
+            print(f"❌ Erro: {result['error']}")
         
         print("\n" + "-" * 60)
 
@@ -0,0 +1,183 @@
+"""
+Modelo compacto em memória para planos grandes
+
+Alternativa opcional ao dict de ``structured_json`` para serviços que mantêm
+muitos planos (ou planos com milhares de tarefas) em memória:
+
+- classes com ``__slots__`` (sem ``__dict__`` por instância)
+- ids UUID guardados como inteiros de 128 bits, convertidos para texto só na
+  serialização
+- prioridade, status, categoria e tempo estimado internados: todas as tarefas
+  compartilham a mesma instância de cada valor. São strings internadas com
+  ``sys.intern``, não ``Enum``: a memória é a mesma (uma instância por
+  valor), ``to_dict`` devolve o texto sem conversão e valores fora do
+  conjunto conhecido (categorias dos templates, prioridades editadas) não
+  quebram a conversão sem perdas
+- descrição, tags e dependências vazias derivadas em ``to_dict`` quando seguem
+  o padrão gerado pelo pipeline; valores fora do padrão são guardados como
+  exceção
+
+``CompactPlan.from_dict(plano).to_dict() == plano`` para qualquer plano no
+formato atual, inclusive com chaves extras ou ids fora do formato UUID.
+Ver benchmarks/bench_task_model.py para a memória por 10 mil tarefas
+(referência local: 7,7 MiB em dicts contra 4,7 MiB, redução de 39%).
+"""
+
+import sys
+import uuid
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+TASK_KEYS = (
+    "id", "title", "description", "priority", "category",
+    "estimated_time", "status", "dependencies", "tags",
+)
+
+PLAN_KEYS = ("id", "goal", "created_at", "status", "metadata", "tasks")
+
+# Id UUID como inteiro, ou o texto original quando não é um UUID canônico
+CompactId = Union[int, str]
+
+def _pack_id(value: str) -> CompactId:
+    try:
+        packed = uuid.UUID(value)
+    except (ValueError, AttributeError, TypeError):
+        return value
+    return packed.int if str(packed) == value else value
+
+def _unpack_id(value: CompactId) -> str:
+    return str(uuid.UUID(int=value)) if isinstance(value, int) else value
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+class _Derived:
+    """Marca um campo derivado em to_dict (``None`` é um valor válido de tarefa)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "DERIVED"
+
+_DERIVED = _Derived()
+
+def _canonical_description(step: int) -> str:
+    """Descrição gerada por iter_structured_plan para o passo ``step``"""
+    return f"Passo {step} para alcançar o goal do plano"
+
+def _canonical_tags(intention: str, priority: str) -> list:
+    return [intention.replace("_", "-"), priority]
+
+@dataclass
+class CompactTask:
+    """Tarefa de um CompactPlan; campos derivados ficam como ``_DERIVED``"""
+
+    __slots__ = (
+        "id", "title", "priority", "category", "estimated_time", "status",
+        "dependencies", "description", "tags", "extra",
+    )
+
+    id: CompactId
+    title: str
+    priority: str
+    category: str
+    estimated_time: str
+    status: str
+    dependencies: Tuple[CompactId, ...]
+    # Exceções ao padrão (_DERIVED = derivado do plano e da posição da tarefa)
+    description: Union[str, None, _Derived]
+    tags: Union[tuple, None, _Derived]
+    extra: Optional[dict]
+
+class CompactPlan:
+    """Plano estruturado compacto, conversível de/para o formato JSON atual"""
+
+    __slots__ = ("id", "goal", "created_at", "status", "metadata", "tasks", "extra")
+
+    def __init__(self, id: CompactId, goal: str, created_at: str, status: str,
+                 metadata: dict, tasks: list, extra: Optional[dict] = None):
+        self.id = id
+        self.goal = goal
+        self.created_at = created_at
+        self.status = status
+        self.metadata = metadata
+        self.tasks = tasks
+        self.extra = extra
+
+    @property
+    def intention(self) -> str:
+        return self.metadata.get("intention", "geral")
+
+    @classmethod
+    def from_dict(cls, plan: dict) -> "CompactPlan":
+        """Converte um ``structured_json`` para o modelo compacto"""
+        # Chaves ausentes não poderiam ser recriadas por to_dict
+        missing = [key for key in PLAN_KEYS if key not in plan]
+        if missing:
+            raise ValueError(f"Plano sem as chaves obrigatórias: {', '.join(missing)}")
+
+        intention = plan["metadata"].get("intention", "geral")
+        return cls(
+            id=_pack_id(plan["id"]),
+            goal=plan["goal"],
+            created_at=plan["created_at"],
+            status=_intern(plan["status"]),
+            metadata=plan["metadata"],
+            tasks=[cls._pack_task(task, position, intention) for position, task in enumerate(plan["tasks"])],
+            extra={key: value for key, value in plan.items() if key not in PLAN_KEYS} or None,
+        )
+
+    def to_dict(self) -> dict:
+        """Reconstrói o ``structured_json`` no formato atual"""
+        plan = {
+            "id": _unpack_id(self.id),
+            "goal": self.goal,
+            "created_at": self.created_at,
+            "status": self.status,
+            "metadata": self.metadata,
+            "tasks": [self._unpack_task(task, position) for position, task in enumerate(self.tasks)],
+        }
+        if self.extra:
+            plan.update(self.extra)
+        return plan
+
+    @staticmethod
+    def _pack_task(task: dict, position: int, intention: str) -> CompactTask:
+        missing = [key for key in TASK_KEYS if key not in task]
+        if missing:
+            raise ValueError(f"Tarefa {position + 1} sem as chaves obrigatórias: {', '.join(missing)}")
+
+        description = task["description"]
+        tags = task["tags"]
+        return CompactTask(
+            id=_pack_id(task["id"]),
+            title=task["title"],
+            priority=_intern(task["priority"]),
+            category=_intern(task["category"]),
+            estimated_time=_intern(task["estimated_time"]),
+            status=_intern(task["status"]),
+            dependencies=tuple(_pack_id(d) for d in task["dependencies"]),
+            description=_DERIVED if description == _canonical_description(position + 1) else description,
+            tags=_DERIVED if tags == _canonical_tags(intention, task["priority"])
+                else tuple(tags) if isinstance(tags, list) else tags,
+            extra={key: value for key, value in task.items() if key not in TASK_KEYS} or None,
+        )
+
+    def _unpack_task(self, task: CompactTask, position: int) -> dict:
+        data = {
+            "id": _unpack_id(task.id),
+            "title": task.title,
+            "description": _canonical_description(position + 1)
+                if task.description is _DERIVED
+                else task.description,
+            "priority": task.priority,
+            "category": task.category,
+            "estimated_time": task.estimated_time,
+            "status": task.status,
+            "dependencies": [_unpack_id(d) for d in task.dependencies],
+            "tags": _canonical_tags(self.intention, task.priority) if task.tags is _DERIVED
+                else list(task.tags) if isinstance(task.tags, tuple) else task.tags,
+        }
+        if task.extra:
+            data.update(task.extra)
+        return data
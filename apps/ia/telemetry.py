@@ -0,0 +1,315 @@
+"""
+Telemetria estruturada do agente gerador de tarefas
+
+Substitui os ``print`` do caminho de requisição por registros estruturados
+(spans com duração e atributos, e eventos pontuais). O caminho de requisição
+só monta o registro e o coloca em uma fila limitada; a escrita nos sinks é
+feita por uma thread em segundo plano, em lotes.
+
+- Amostragem por trace: todos os spans de uma sessão são mantidos ou
+  descartados juntos (decisão determinística pelo ``trace_id``)
+- Fila cheia nunca bloqueia a requisição: o registro é descartado e contado
+- Registros gerados depois de ``close`` também são descartados e contados
+- Sem sinks (modo silencioso, o padrão do agente) nada é registrado
+
+Sinks disponíveis: JSONLSink (arquivo), MemorySink (testes e inspeção),
+LangSmithSink (runs no formato do LangSmith, guardados localmente ou enviados
+por um ``langsmith.Client``) e ConsoleSink (linhas legíveis para demos).
+"""
+
+import json
+import queue
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+class TelemetrySink:
+    """Destino de registros; ``emit`` recebe lotes, sempre fora da requisição"""
+
+    def emit(self, records: List[dict]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+class JSONLSink(TelemetrySink):
+    """Acrescenta um registro JSON por linha a um arquivo (uma escrita por lote)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, records: List[dict]) -> None:
+        self._file.write("".join(json.dumps(r, ensure_ascii=False, default=str) + "\n" for r in records))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+class MemorySink(TelemetrySink):
+    """Guarda os registros em memória (os mais recentes, se houver limite)"""
+
+    def __init__(self, max_records: Optional[int] = None):
+        self.records = deque(maxlen=max_records)
+
+    def emit(self, records: List[dict]) -> None:
+        self.records.extend(records)
+
+class LangSmithSink(TelemetrySink):
+    """
+    Converte spans em runs no formato do LangSmith.
+
+    Sem ``client`` funciona como stub local: os runs ficam em ``self.runs``
+    (úteis para inspeção ou envio posterior). Com um ``langsmith.Client``, cada
+    lote é enviado via ``batch_ingest_runs`` pela thread de flush.
+    """
+
+    def __init__(self, client=None, max_runs: Optional[int] = 10_000):
+        self.client = client
+        self.runs = deque(maxlen=max_runs)
+
+    def emit(self, records: List[dict]) -> None:
+        runs = [self._to_run(r) for r in records if r["type"] == "span"]
+        if not runs:
+            return
+        if self.client is not None:
+            self.client.batch_ingest_runs(create=runs)
+        else:
+            self.runs.extend(runs)
+
+    @staticmethod
+    def _to_run(span: dict) -> dict:
+        return {
+            "id": span["span_id"],
+            "trace_id": span["trace_id"],
+            "parent_run_id": span["parent_id"],
+            "name": span["name"],
+            "run_type": "chain",
+            "start_time": span["start_time"],
+            "end_time": span["end_time"],
+            "inputs": {},
+            "outputs": span["attributes"],
+            "error": span["error"],
+            "extra": {"metadata": {"duration_ms": span["duration_ms"]}},
+        }
+
+class ConsoleSink(TelemetrySink):
+    """Imprime uma linha legível por registro (demos e depuração local)"""
+
+    def emit(self, records: List[dict]) -> None:
+        lines = []
+        for record in records:
+            attributes = record["attributes"]
+            detail = attributes.get("message") or ", ".join(f"{k}={v}" for k, v in attributes.items())
+            if record["type"] == "span":
+                status = f"❌ {record['error']}" if record["error"] else f"{record['duration_ms']:.1f} ms"
+                lines.append(f"⏱️ {record['name']} ({status}) {detail}")
+            else:
+                lines.append(f"📊 {record['name']}: {detail}")
+        print("\n".join(lines))
+
+class Span:
+    """Span aberto; atributos podem ser adicionados até o fim do bloco"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "error", "_start")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = str(uuid.uuid4())
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.error = None
+        self._start = time.perf_counter()
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+class _NoopSpan:
+    """Span descartado (modo silencioso ou trace fora da amostra)"""
+
+    __slots__ = ()
+    span_id = None
+    attributes: dict = {}
+
+    def set(self, **attributes) -> None:
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+class Telemetry:
+    """
+    Coleta spans e eventos e os entrega aos sinks em segundo plano.
+
+    Args:
+        sinks: Destinos dos registros; sem sinks, nada é registrado
+        sample_rate: Fração de traces mantidos (0.0 a 1.0)
+        queue_size: Capacidade da fila; registros excedentes são descartados
+        flush_interval: Intervalo máximo entre escritas, em segundos
+        batch_size: Máximo de registros por chamada a ``emit``
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[TelemetrySink] = (),
+        sample_rate: float = 1.0,
+        queue_size: int = 10_000,
+        flush_interval: float = 1.0,
+        batch_size: int = 500
+    ):
+        self.sinks = list(sinks)
+        self.sample_rate = sample_rate
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.enabled = bool(self.sinks) and sample_rate > 0
+        self.emitted = 0
+        self.dropped = 0
+        self.sink_errors = 0
+
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=queue_size)
+        self._emit_lock = threading.Lock()
+        # _enqueue roda nas threads das requisições; _emit_lock fica preso durante o envio ao sink
+        self._dropped_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+
+    @classmethod
+    def quiet(cls) -> "Telemetry":
+        """Telemetria desligada: nenhum custo além de uma checagem por span"""
+        return cls()
+
+    def sampled(self, trace_id: str) -> bool:
+        """Decide se o trace entra na amostra (estável para o mesmo trace_id)"""
+        if not self.enabled:
+            return False
+        if self.sample_rate >= 1.0:
+            return True
+        return zlib.crc32(trace_id.encode("utf-8")) / 0xFFFFFFFF < self.sample_rate
+
+    @contextmanager
+    def span(self, name: str, trace_id: str, parent_id: Optional[str] = None, **attributes):
+        """Mede um bloco; exceções marcam o span com erro e são propagadas"""
+        if not self.sampled(trace_id):
+            yield _NOOP_SPAN
+            return
+
+        span = Span(name, trace_id, parent_id, attributes)
+        start_time = datetime.now(timezone.utc)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            duration = time.perf_counter() - span._start
+            self._enqueue({
+                "type": "span",
+                "name": name,
+                "trace_id": trace_id,
+                "span_id": span.span_id,
+                "parent_id": parent_id,
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(seconds=duration)).isoformat(),
+                "duration_ms": duration * 1000,
+                "attributes": span.attributes,
+                "error": span.error,
+            })
+
+    def event(self, name: str, trace_id: str, **attributes) -> None:
+        """Registra um evento pontual (sem duração)"""
+        if not self.sampled(trace_id):
+            return
+        self._enqueue({
+            "type": "event",
+            "name": name,
+            "trace_id": trace_id,
+            "time": datetime.now(timezone.utc).isoformat(),
+            "attributes": attributes,
+        })
+
+    def ingest(self, records: Iterable[dict]) -> None:
+        """Enfileira registros já montados por outra instância (ex.: workers de processo)"""
+        if not self.enabled:
+            return
+        for record in records:
+            self._enqueue(record)
+
+    def flush(self) -> None:
+        """Entrega imediatamente tudo o que está na fila"""
+        while self._drain():
+            pass
+
+    def close(self) -> None:
+        """
+        Para a thread de flush, entrega o restante e fecha os sinks; registros
+        enfileirados depois disso são descartados (contados em ``dropped``)
+        """
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+    def stats(self) -> dict:
+        """Contadores de registros entregues, descartados e pendentes"""
+        return {
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "sink_errors": self.sink_errors,
+            "pending": self._queue.qsize(),
+        }
+
+    def _enqueue(self, record: dict) -> None:
+        if self._stop.is_set():
+            # Depois de close não há flusher nem sinks abertos para entregar o registro
+            self._count_dropped()
+            return
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._count_dropped()
+            return
+        if self._flusher is None:
+            self._start_flusher()
+
+    def _count_dropped(self) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def _start_flusher(self) -> None:
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="telemetry-flusher", daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def _drain(self) -> bool:
+        """Entrega um lote aos sinks; retorna False se a fila estava vazia"""
+        with self._emit_lock:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return False
+
+            for sink in self.sinks:
+                try:
+                    sink.emit(batch)
+                except Exception:
+                    # Falha de um sink não pode derrubar o flusher nem os demais
+                    self.sink_errors += 1
+            self.emitted += len(batch)
+            return True
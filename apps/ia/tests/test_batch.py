@@ -0,0 +1,44 @@
+import pytest
+
+import task_generator_agent
+from plan_cache import MemoryPlanCache
+from profiling import NodeProfiler
+from semantic_intention import HashingEmbedder, SemanticIntentionClassifier
+from telemetry import MemorySink, Telemetry
+from task_generator_agent import TaskGeneratorAgent
+
+GOALS = [
+    "Planejar uma viagem para o Japão de 2 semanas",
+    "Escrevendo contos infantis",
+    "Reforma completa dos banheiros",
+    "Ser mais feliz",
+]
+
+@pytest.fixture
+def semantic_classifier():
+    classifier = SemanticIntentionClassifier(embedder=HashingEmbedder())
+    task_generator_agent.set_semantic_classifier(classifier)
+    yield classifier
+    task_generator_agent.set_semantic_classifier(None)
+
+def intentions(results: list) -> list:
+    return [result["metadata"]["intention"] for result in results]
+
+def test_workers_usam_a_configuracao_do_agente(semantic_classifier):
+    sink = MemorySink()
+    profiler = NodeProfiler(trace_memory=False)
+    agent = TaskGeneratorAgent(cache=MemoryPlanCache(), telemetry=Telemetry([sink]), profiler=profiler)
+    try:
+        in_processes = agent.generate_tasks_batch(GOALS, max_workers=2)
+        pool = agent._batch_pool
+        agent.generate_tasks_batch(["Criar um aplicativo mobile"], max_workers=2)
+        assert agent._batch_pool is pool
+    finally:
+        agent.close()
+    agent.telemetry.flush()
+
+    in_threads = TaskGeneratorAgent().generate_tasks_batch(GOALS, use_processes=False)
+    assert intentions(in_processes) == intentions(in_threads)
+    assert agent.cache_stats()["entries"] == len(GOALS) + 1
+    assert profiler.summary()["runs"] == len(GOALS) + 1
+    assert any(record["type"] == "span" for record in sink.records)
@@ -0,0 +1,57 @@
+import pytest
+
+import task_generator_agent
+from bulk_scoring import FACTOR_COLUMNS, score_goals_bulk
+from semantic_intention import HashingEmbedder, SemanticIntentionClassifier
+
+GOALS = [
+    "Planejar uma viagem para o Japão de 2 semanas",
+    "Criar um aplicativo mobile urgente",
+    "Reforma completa dos banheiros",
+    "Escrevendo contos infantis",
+    "Fazer bolo",
+    "Reforma completa dos banheiros",
+    "Ser mais feliz",
+    "Implementar sistema de gestão de tarefas",
+]
+
+@pytest.fixture
+def semantic_classifier():
+    classifier = SemanticIntentionClassifier(embedder=HashingEmbedder())
+    task_generator_agent.set_semantic_classifier(classifier)
+    yield classifier
+    task_generator_agent.set_semantic_classifier(None)
+
+def as_analysis(row) -> dict:
+    return {
+        "feasibility_score": float(row["feasibility_score"]),
+        "factors": {name: float(row[name]) for name in FACTOR_COLUMNS},
+        "detected_intention": str(row["detected_intention"]),
+        "is_feasible": bool(row["is_feasible"]),
+    }
+
+def expected_analysis(goal: str) -> dict:
+    analysis = task_generator_agent.analyze_goal_feasibility(goal)
+    return {key: analysis[key] for key in ("feasibility_score", "factors", "detected_intention", "is_feasible")}
+
+def test_lote_igual_a_analise_por_goal_sem_classificador():
+    task_generator_agent.set_semantic_classifier(None)
+    assert [as_analysis(row) for row in score_goals_bulk(GOALS)] == [expected_analysis(goal) for goal in GOALS]
+
+def test_lote_igual_a_analise_por_goal_com_classificador(semantic_classifier):
+    bulk = [as_analysis(row) for row in score_goals_bulk(GOALS)]
+    semantic_classifier.clear_cache()
+
+    assert bulk == [expected_analysis(goal) for goal in GOALS]
+    assert bulk[2]["detected_intention"] == "desenvolvimento_projeto"
+    assert bulk[4]["detected_intention"] == "geral"
+
+def test_goals_sem_palavra_chave_sao_classificados_em_um_lote(semantic_classifier, monkeypatch):
+    calls = []
+    embed = semantic_classifier.embedder.embed
+    semantic_classifier.predict("aquece o índice")
+    monkeypatch.setattr(semantic_classifier.embedder, "embed", lambda texts: calls.append(list(texts)) or embed(texts))
+
+    score_goals_bulk(GOALS)
+
+    assert calls == [["Reforma completa dos banheiros", "Escrevendo contos infantis", "Fazer bolo", "Ser mais feliz"]]
@@ -0,0 +1,40 @@
+import pytest
+
+import keyword_matcher
+from keyword_matcher import KeywordMatcher
+from task_generator_agent import FEASIBILITY_KEYWORDS, INTENTION_KEYWORDS
+
+GOALS = [
+    "Planejar uma viagem para o Japão de 2 semanas",
+    "PLANEJAR VIAGEM AO JAPAO URGENTE",
+    "Criar e implementar um sistema hoje",
+    "Ser mais feliz",
+    "",
+]
+
+def build_matcher() -> KeywordMatcher:
+    matcher = KeywordMatcher(FEASIBILITY_KEYWORDS)
+    for keyword, intention in INTENTION_KEYWORDS.items():
+        matcher.add_ranked(keyword, intention)
+    return matcher
+
+def repeated_scans(text: str):
+    """Semântica de referência: ``keyword in texto`` por palavra, sem acentos"""
+    text = keyword_matcher.normalize_text(text)
+    groups = {
+        group for group, keywords in FEASIBILITY_KEYWORDS.items()
+        if any(keyword_matcher.normalize_text(k) in text for k in keywords)
+    }
+    label = next((i for k, i in INTENTION_KEYWORDS.items() if k in text), None)
+    return frozenset(groups), label
+
+@pytest.mark.skipif(keyword_matcher.ahocorasick is None, reason="pyahocorasick não instalado")
+@pytest.mark.parametrize("goal", GOALS)
+def test_regex_igual_ao_automato(monkeypatch, goal):
+    automaton = build_matcher().match(goal)
+    monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    assert build_matcher().match(goal) == automaton
+
+@pytest.mark.parametrize("goal", GOALS)
+def test_mesmo_resultado_das_varreduras_por_palavra(goal):
+    assert tuple(build_matcher().match(goal)) == repeated_scans(goal)
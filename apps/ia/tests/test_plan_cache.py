@@ -0,0 +1,39 @@
+from plan_cache import MemoryPlanCache
+from task_generator_agent import TaskGeneratorAgent
+
+GOAL = "Planejar uma viagem para o Japão de 2 semanas"
+
+def test_get_devolve_copia_independente():
+    cache = MemoryPlanCache()
+    value = {"task_steps": {"steps": [{"title": "a"}]}}
+    cache.put("k", value)
+    value["task_steps"]["steps"].append({"title": "b"})
+
+    first = cache.get("k")
+    first["task_steps"]["steps"][0]["title"] = "alterado"
+
+    assert cache.get("k") == {"task_steps": {"steps": [{"title": "a"}]}}
+
+def test_alterar_resultado_nao_afeta_acertos_seguintes():
+    agent = TaskGeneratorAgent(cache=MemoryPlanCache())
+    first = agent.generate_tasks(GOAL)
+    expected = [task["title"] for task in first["tasks"]]
+    first["tasks"][0]["title"] = "alterado"
+    first["tasks"].clear()
+
+    second = agent.generate_tasks(GOAL)
+
+    assert [task["title"] for task in second["tasks"]] == expected
+
+def test_alterar_eventos_do_stream_nao_afeta_o_cache():
+    agent = TaskGeneratorAgent(cache=MemoryPlanCache())
+    for event in agent.stream_tasks(GOAL):
+        if event["event"] == "intention_analysis":
+            event["data"]["feasibility_score"] = -1.0
+            event["data"]["factors"].clear()
+
+    events = list(agent.stream_tasks(GOAL))
+    analysis = next(e["data"] for e in events if e["event"] == "intention_analysis")
+
+    assert analysis["feasibility_score"] >= 0
+    assert analysis["factors"]
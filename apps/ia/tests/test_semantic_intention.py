@@ -0,0 +1,26 @@
+import pytest
+
+from semantic_intention import HashingEmbedder, SemanticIntentionClassifier
+
+@pytest.fixture(scope="module")
+def classifier():
+    return SemanticIntentionClassifier(embedder=HashingEmbedder())
+
+@pytest.mark.parametrize("goal", ["Fazer bolo", "Passar roupa", "Ir ao médico", "Fazer"])
+def test_palavras_genericas_nao_definem_intencao(classifier, goal):
+    assert classifier.predict(goal).intention is None
+
+@pytest.mark.parametrize("goal, intention", [
+    ("Reforma completa dos banheiros", "desenvolvimento_projeto"),
+    ("Escrevendo contos infantis", "criação_conteudo"),
+])
+def test_flexoes_das_palavras_dos_exemplos(classifier, goal, intention):
+    assert classifier.predict(goal).intention == intention
+
+def test_limiar_padrao_vem_do_embedder(classifier):
+    assert classifier.threshold == HashingEmbedder.default_threshold
+
+def test_sem_modelo_configurado_nao_usa_hashing(monkeypatch):
+    monkeypatch.delenv("TASK_AGENT_EMBEDDING_MODEL", raising=False)
+    with pytest.raises(ValueError, match="TASK_AGENT_EMBEDDING_MODEL"):
+        SemanticIntentionClassifier()
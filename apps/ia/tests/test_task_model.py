@@ -0,0 +1,18 @@
+from task_generator_agent import TaskGeneratorAgent
+from task_model import CompactPlan
+
+def test_conversao_sem_perdas():
+    plan = TaskGeneratorAgent().generate_tasks("Planejar uma viagem para o Japão")
+    assert CompactPlan.from_dict(plan).to_dict() == plan
+
+def test_descricao_e_tags_none_sao_preservadas():
+    plan = TaskGeneratorAgent().generate_tasks("Planejar uma viagem para o Japão")
+    plan["tasks"][0]["description"] = None
+    plan["tasks"][1]["tags"] = None
+    plan["tasks"][2]["tags"] = []
+
+    restored = CompactPlan.from_dict(plan).to_dict()
+
+    assert restored == plan
+    assert restored["tasks"][0]["description"] is None
+    assert restored["tasks"][1]["tags"] is None
@@ -0,0 +1,23 @@
+import os
+
+from task_generator_agent import TaskGeneratorAgent
+from telemetry import MemorySink, Telemetry
+
+def test_registros_depois_de_close_sao_descartados():
+    sink = MemorySink()
+    telemetry = Telemetry([sink])
+    telemetry.event("antes", "trace")
+    telemetry.close()
+
+    telemetry.event("depois", "trace")
+    with telemetry.span("depois", "trace"):
+        pass
+
+    assert [record["name"] for record in sink.records] == ["antes"]
+    assert telemetry.stats()["dropped"] == 2
+    assert telemetry.stats()["pending"] == 0
+
+def test_agente_nao_ativa_o_tracing_do_langsmith(monkeypatch):
+    monkeypatch.delenv("LANGCHAIN_TRACING_V2", raising=False)
+    TaskGeneratorAgent()
+    assert "LANGCHAIN_TRACING_V2" not in os.environ